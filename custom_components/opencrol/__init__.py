@@ -6,8 +6,19 @@ import logging
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
-from .const import DOMAIN
-from .coordinator import OpenCtrolCoordinator
+from .const import (
+    DOMAIN,
+    CONF_TRANSPORT,
+    CONF_INPUT_FLUSH_INTERVAL,
+    DEFAULT_INPUT_FLUSH_INTERVAL,
+    CONF_SCREENSHOT_MAX_COUNT,
+    DEFAULT_SCREENSHOT_MAX_COUNT,
+    CONF_SCREENSHOT_MAX_SIZE,
+    DEFAULT_SCREENSHOT_MAX_SIZE,
+    TRANSPORT_HTTP,
+)
+from .capabilities import platforms_for
+from .coordinator import OpenCtrolCoordinator, snapshot_store
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -17,11 +28,25 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     _LOGGER.info("Setting up OpenCtrol integration")
 
     coordinator = OpenCtrolCoordinator(hass, entry)
-    await coordinator.async_config_entry_first_refresh()
+    # A PC seen before starts from its last known state and is refreshed in
+    # the background, so PCs that are asleep do not hold up startup
+    restored = await coordinator.async_restore_snapshot()
+    if not restored:
+        try:
+            await coordinator.async_config_entry_first_refresh()
+        except Exception:
+            # Setup is retried with a new coordinator; release this one's
+            # subscriptions and share of the connection pool
+            await coordinator.async_shutdown()
+            raise
 
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
+    # Stream state changes from the PC; polling only runs while this is down
+    coordinator.async_start_push()
+    entry.async_on_unload(entry.add_update_listener(_async_update_listener))
+
     # Register frontend resources for Lovelace card
     try:
         from pathlib import Path
@@ -218,30 +243,61 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.warning(f"Failed to register frontend resources: {ex}")
 
 
-    # Setup platforms - register all entity types
-    platforms = ["remote", "media_player", "number", "select", "button"]
-    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+    # Setup platforms - only those backed by something the client supports
+    coordinator.platforms = platforms_for(coordinator.capabilities)
+    _LOGGER.debug(f"Loading platforms for {coordinator.client_id}: {coordinator.platforms}")
+    await hass.config_entries.async_forward_entry_setups(entry, coordinator.platforms)
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_{coordinator.client_id}_first_refresh"
+        )
 
-    # Setup services (only once per domain)
-    from . import services
+    # Setup services and WebSocket commands (only once per domain)
+    from . import services, websocket_api
     if DOMAIN not in hass.data or "services_registered" not in hass.data.setdefault(DOMAIN, {}):
         services.async_setup_services(hass)
+        websocket_api.async_setup_websocket_api(hass)
         hass.data[DOMAIN]["services_registered"] = True
 
     return True
 
 
+async def _async_update_listener(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Apply changed options, reloading the entry if the transport or platforms changed."""
+    coordinator = hass.data.get(DOMAIN, {}).get(entry.entry_id)
+    if not coordinator:
+        return
+    transport = entry.options.get(CONF_TRANSPORT, entry.data.get(CONF_TRANSPORT, TRANSPORT_HTTP))
+    # Renegotiated capabilities may add or remove platforms
+    platforms = platforms_for(coordinator.capabilities)
+    if coordinator.transport != transport or platforms != coordinator.platforms:
+        await hass.config_entries.async_reload(entry.entry_id)
+        return
+    coordinator.input_coalescer.flush_interval = (
+        entry.options.get(CONF_INPUT_FLUSH_INTERVAL, DEFAULT_INPUT_FLUSH_INTERVAL) / 1000
+    )
+    coordinator.screenshots.max_count = entry.options.get(
+        CONF_SCREENSHOT_MAX_COUNT, DEFAULT_SCREENSHOT_MAX_COUNT
+    )
+    coordinator.screenshots.max_size_mb = entry.options.get(
+        CONF_SCREENSHOT_MAX_SIZE, DEFAULT_SCREENSHOT_MAX_SIZE
+    )
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload OpenCtrol config entry."""
     _LOGGER.info("Unloading OpenCtrol integration")
 
-    platforms = ["remote", "media_player", "number", "select", "button"]
-    unload_ok = await hass.config_entries.async_unload_platforms(entry, platforms)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, coordinator.platforms)
     
     if unload_ok:
-        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
-        if coordinator:
-            await coordinator.async_shutdown()
+        hass.data[DOMAIN].pop(entry.entry_id)
+        await coordinator.async_shutdown()
 
     return unload_ok
 
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the last known state of a deleted OpenCtrol entry."""
+    await snapshot_store(hass, entry.entry_id).async_remove()
@@ -8,7 +8,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ATTR_CLIENT_ID
+from .const import DOMAIN, ATTR_CLIENT_ID, CAPABILITY_SCREEN
 from .coordinator import OpenCtrolCoordinator
 
 _LOGGER = logging.getLogger(__name__)
@@ -22,10 +22,10 @@ async def async_setup_entry(
     """Set up OpenCtrol button entities."""
     coordinator: OpenCtrolCoordinator = hass.data[DOMAIN][entry.entry_id]
     
-    async_add_entities([
-        OpenCtrolScreenshotButton(coordinator, entry),
-        OpenCtrolRestartButton(coordinator, entry),
-    ])
+    entities = [OpenCtrolRestartButton(coordinator, entry)]
+    if coordinator.supports(CAPABILITY_SCREEN):
+        entities.insert(0, OpenCtrolScreenshotButton(coordinator, entry))
+    async_add_entities(entities)
 
 
 class OpenCtrolScreenshotButton(ButtonEntity):
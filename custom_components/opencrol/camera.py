@@ -0,0 +1,98 @@
+"""Camera platform for OpenCtrol screen streaming."""
+
+import logging
+
+from aiohttp import web
+
+from homeassistant.components.camera import Camera
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, ATTR_CLIENT_ID, SECTION_STATUS
+from .coordinator import OpenCtrolCoordinator
+from .entity import OpenCtrolEntity
+from .stream_hub import ScreenStreamHub
+
+_LOGGER = logging.getLogger(__name__)
+
+MJPEG_BOUNDARY = "frame"
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up OpenCtrol camera."""
+    coordinator: OpenCtrolCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities([OpenCtrolScreenCamera(coordinator, entry)])
+
+
+class OpenCtrolScreenCamera(OpenCtrolEntity, Camera):
+    """Screen of an OpenCtrol PC, relayed through Home Assistant.
+
+    All viewers share one connection to the PC; frames are passed through
+    as received, without re-encoding.
+    """
+
+    _sections = frozenset({SECTION_STATUS})
+
+    def __init__(self, coordinator: OpenCtrolCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the screen camera."""
+        super().__init__(coordinator)
+        Camera.__init__(self)
+        self.entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_screen_camera"
+        self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} Screen"
+        self._hub = ScreenStreamHub(coordinator)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.last_update_success and self.coordinator.data.get("status") == "online"
+
+    @property
+    def is_streaming(self) -> bool:
+        """Return true if the PC is capturing its screen."""
+        return self.coordinator.data.get("screen_capture_active", False)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Close the upstream stream and end open viewer streams."""
+        self._hub.async_shutdown()
+        await super().async_will_remove_from_hass()
+
+    async def async_camera_image(
+        self, width: int | None = None, height: int | None = None
+    ) -> bytes | None:
+        """Return the latest streamed frame, or fetch a single one.
+
+        Stills never join the shared stream: dashboard tiles poll them every
+        few seconds, which would otherwise keep screen capture running.
+        """
+        if self._hub.last_frame is not None:
+            return self._hub.last_frame
+        return await self.coordinator.async_get_frame()
+
+    async def handle_async_mjpeg_stream(self, request: web.Request) -> web.StreamResponse:
+        """Serve the shared screen stream to one viewer."""
+        response = web.StreamResponse()
+        response.content_type = f"multipart/x-mixed-replace;boundary={MJPEG_BOUNDARY}"
+        await response.prepare(request)
+
+        queue = self._hub.async_add_viewer()
+        try:
+            while frame := await queue.get():
+                await response.write(
+                    f"--{MJPEG_BOUNDARY}\r\n"
+                    f"Content-Type: image/jpeg\r\n"
+                    f"Content-Length: {len(frame)}\r\n\r\n".encode()
+                    + frame
+                    + b"\r\n"
+                )
+        except ConnectionResetError:
+            # Viewer went away
+            pass
+        finally:
+            self._hub.async_remove_viewer(queue)
+        return response
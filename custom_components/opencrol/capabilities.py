@@ -0,0 +1,74 @@
+"""Capability negotiation with OpenCtrol clients."""
+
+from typing import Any
+
+from .const import (
+    CAPABILITY_AUDIO,
+    CAPABILITY_SCREEN,
+    SECTION_MONITORS,
+    SECTION_AUDIO_APPS,
+    SECTION_AUDIO_DEVICES,
+)
+
+PLATFORMS = ["remote", "media_player", "camera", "image", "number", "select", "button"]
+
+# Platforms only loaded when the client supports a capability; the rest are
+# always loaded
+PLATFORM_CAPABILITIES = {
+    "camera": CAPABILITY_SCREEN,
+    "image": CAPABILITY_SCREEN,
+    "number": CAPABILITY_AUDIO,
+    "select": CAPABILITY_AUDIO,
+}
+
+# Data sections only fetched when the client supports a capability
+SECTION_CAPABILITIES = {
+    SECTION_MONITORS: CAPABILITY_SCREEN,
+    SECTION_AUDIO_APPS: CAPABILITY_AUDIO,
+    SECTION_AUDIO_DEVICES: CAPABILITY_AUDIO,
+}
+
+
+def parse_capabilities(payload: Any) -> dict[str, bool]:
+    """Return the capabilities a status payload reports, by name.
+
+    Clients report either a list of supported names or a mapping of name to
+    flag (or to an object with a ``supported`` flag). Explicit negatives are
+    kept so they can be told apart from capabilities never mentioned.
+    """
+    if isinstance(payload, list):
+        return {str(name): True for name in payload}
+    if not isinstance(payload, dict):
+        return {}
+    capabilities = {}
+    for name, value in payload.items():
+        if isinstance(value, dict):
+            value = value.get("supported", value.get("enabled", True))
+        capabilities[str(name)] = bool(value)
+    return capabilities
+
+
+def parse_api_version(status: dict[str, Any]) -> str | None:
+    """Return the API version a status payload reports."""
+    version = status.get("api_version", status.get("version"))
+    return str(version) if version is not None else None
+
+
+def supports(capabilities: dict[str, bool], capability: str) -> bool:
+    """Return if a capability is supported.
+
+    Only capabilities the client explicitly reports as unsupported are
+    gated; unknown ones are assumed present, so a client using other names
+    keeps every platform.
+    """
+    return capabilities.get(capability, True)
+
+
+def platforms_for(capabilities: dict[str, bool]) -> list[str]:
+    """Return the platforms to load for a client's capabilities."""
+    return [
+        platform
+        for platform in PLATFORMS
+        if platform not in PLATFORM_CAPABILITIES
+        or supports(capabilities, PLATFORM_CAPABILITIES[platform])
+    ]
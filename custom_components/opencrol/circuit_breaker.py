@@ -0,0 +1,111 @@
+"""Circuit breaker for OpenCtrol hosts."""
+
+import logging
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+STATE_CLOSED = "closed"
+STATE_OPEN = "open"
+STATE_HALF_OPEN = "half_open"
+
+# Consecutive failed requests before the breaker opens
+FAILURE_THRESHOLD = 3
+# Failures this close together count once; the sections of one refresh are
+# fetched concurrently and fail together when the host is down (seconds)
+FAILURE_COALESCE_WINDOW = 2.0
+# Time the breaker stays open before a probe is allowed (seconds); doubles
+# after every failed probe up to the maximum
+INITIAL_OPEN_TIME = 15.0
+MAX_OPEN_TIME = 300.0
+
+
+class CircuitBreaker:
+    """Track reachability of one host and fail fast while it is down.
+
+    Closed: requests flow normally. Open: requests fail immediately until the
+    open time has elapsed. Half-open: a single probe is in flight; its result
+    closes the breaker or opens it again for longer.
+    """
+
+    def __init__(self, name: str) -> None:
+        """Initialize circuit breaker."""
+        self.name = name
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.trip_count = 0
+        self.open_time = INITIAL_OPEN_TIME
+        self._opened_at = 0.0
+        self._last_failure_at = 0.0
+        self.last_error: str | None = None
+
+    @property
+    def closed(self) -> bool:
+        """Return True if requests may flow."""
+        return self.state == STATE_CLOSED
+
+    @property
+    def probe_due(self) -> bool:
+        """Return True if the breaker is open and its open time has elapsed."""
+        return (
+            self.state == STATE_OPEN
+            and time.monotonic() - self._opened_at >= self.open_time
+        )
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return breaker state for diagnostics."""
+        retry_in = None
+        if self.state == STATE_OPEN:
+            retry_in = max(0.0, round(self.open_time - (time.monotonic() - self._opened_at), 1))
+        return {
+            "state": self.state,
+            "trip_count": self.trip_count,
+            "consecutive_failures": self.consecutive_failures,
+            "open_time": self.open_time,
+            "probe_in": retry_in,
+            "last_error": self.last_error,
+        }
+
+    def begin_probe(self) -> None:
+        """Move to half-open while the single probe runs."""
+        self.state = STATE_HALF_OPEN
+
+    def abort_probe(self) -> None:
+        """Reopen after an abandoned probe; the next caller probes straight away."""
+        if self.state == STATE_HALF_OPEN:
+            self.state = STATE_OPEN
+
+    def record_success(self) -> None:
+        """Record a request that reached the host."""
+        if self.state != STATE_CLOSED:
+            _LOGGER.info(f"OpenCtrol host {self.name} reachable again, closing circuit")
+        self.state = STATE_CLOSED
+        self.consecutive_failures = 0
+        self.open_time = INITIAL_OPEN_TIME
+
+    def record_failure(self, error: Exception) -> None:
+        """Record a request that could not reach the host."""
+        self.last_error = str(error) or type(error).__name__
+        now = time.monotonic()
+        if self.state == STATE_CLOSED and now - self._last_failure_at < FAILURE_COALESCE_WINDOW:
+            return
+        self._last_failure_at = now
+        self.consecutive_failures += 1
+        if self.state == STATE_HALF_OPEN:
+            # Probe failed: stay open for longer
+            self.open_time = min(self.open_time * 2, MAX_OPEN_TIME)
+            self._open()
+        elif self.state == STATE_CLOSED and self.consecutive_failures >= FAILURE_THRESHOLD:
+            self.trip_count += 1
+            _LOGGER.warning(
+                f"OpenCtrol host {self.name} unreachable after {self.consecutive_failures} "
+                f"attempts, failing fast for {self.open_time:.0f}s: {self.last_error}"
+            )
+            self._open()
+
+    def _open(self) -> None:
+        """Open the breaker."""
+        self.state = STATE_OPEN
+        self._opened_at = time.monotonic()
@@ -16,7 +16,26 @@ _LOGGER = logging.getLogger(__name__)
 from .const import (
     DOMAIN,
     CONF_CLIENT_ID,
+    CONF_TRANSPORT,
+    CONF_INPUT_FLUSH_INTERVAL,
+    DEFAULT_INPUT_FLUSH_INTERVAL,
+    CONF_THUMBNAIL_TTL,
+    DEFAULT_THUMBNAIL_TTL,
+    CONF_SCREENSHOT_MAX_COUNT,
+    DEFAULT_SCREENSHOT_MAX_COUNT,
+    CONF_SCREENSHOT_MAX_SIZE,
+    DEFAULT_SCREENSHOT_MAX_SIZE,
+    TRANSPORT_HTTP,
+    TRANSPORTS,
 )
+from .connection_manager import async_get_session_manager
+from .device_probe import async_get_probe_cache
+
+
+def _device_base_url(device: dict[str, Any]) -> str:
+    """Return the base URL of a discovered device."""
+    port = int(device.get("properties", {}).get("port", device.get("port", 8080)))
+    return f"http://{device.get('host', '')}:{port}"
 
 
 class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -24,6 +43,14 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     def __init__(self):
         """Initialize config flow."""
         super().__init__()
@@ -44,8 +71,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 from homeassistant.components import zeroconf
                 _LOGGER.info("Starting auto-discovery...")
                 # Get shared Zeroconf instance from Home Assistant
-                zeroconf_instance = await zeroconf.async_get_instance(self.hass)
-                self._discovered_devices = await discovery.discover_opencrol_devices(zeroconf_instance)
+                aiozc = await zeroconf.async_get_async_instance(self.hass)
+                # Devices are collected as they resolve and probed in the
+                # background right away; discovery returns as soon as the
+                # set stops changing
+                self._discovered_devices = []
+                probes = async_get_probe_cache(self.hass)
+
+                def on_device(device: dict[str, Any]) -> None:
+                    self._discovered_devices.append(device)
+                    probes.async_start(_device_base_url(device))
+
+                await discovery.async_discover_devices(aiozc, on_device)
                 if self._discovered_devices:
                     _LOGGER.info(f"Discovered {len(self._discovered_devices)} OpenCtrol device(s)")
                     # Show discovered devices
@@ -75,12 +112,18 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                         properties = self._selected_device.get("properties", {})
                         host = self._selected_device.get("host", "")
                         port = int(properties.get("port", self._selected_device.get("port", 8080)))
-                        client_id = properties.get("client_id", self._selected_device.get("name", "unknown"))
-                        
-                        # Check if password is required
-                        requires_password = properties.get("requires_password", "false").lower() == "true"
-                        
-                        if requires_password:
+
+                        # Usually answered from the background probe
+                        probe = await async_get_probe_cache(self.hass).async_probe(
+                            _device_base_url(self._selected_device)
+                        )
+                        client_id = probe.client_id or properties.get(
+                            "client_id", self._selected_device.get("name", "unknown")
+                        )
+
+                        if not probe.reachable:
+                            errors["base"] = probe.error or "cannot_connect"
+                        elif probe.requires_password:
                             # Go to password entry step
                             self._password_step_data = {
                                 "host": host,
@@ -103,7 +146,7 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                             if mac_address:
                                 entry_data["mac_address"] = mac_address
                             
-                            return await self.async_create_entry(
+                            return self.async_create_entry(
                                 title=f"OpenCtrol - {client_id}",
                                 data=entry_data
                             )
@@ -119,7 +162,12 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             client_id = properties.get("client_id", device.get("name", "Unknown"))
             host = device.get("host", "Unknown")
             port = properties.get("port", device.get("port", 8080))
-            device_options[str(idx)] = f"{client_id} ({host}:{port})"
+            label = f"{client_id} ({host}:{port})"
+            # Probes finished by now are shown; the rest complete in the background
+            probe = async_get_probe_cache(self.hass).get(_device_base_url(device))
+            if probe is not None:
+                label += " - password required" if probe.requires_password else f" - {probe.rtt_ms:.0f} ms"
+            device_options[str(idx)] = label
 
         return self.async_show_form(
             step_id="discovery",
@@ -146,143 +194,25 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             if not host:
                 errors["host"] = "host_required"
             else:
-                # Test connection and check if password is required
-                import aiohttp
+                # Check reachability and whether a password is required
                 base_url = f"http://{host}:{port}"
-                
-                try:
-                    _LOGGER.info(f"Testing connection to {base_url}")
-                    _LOGGER.debug(f"Connection details: host={host}, port={port}, base_url={base_url}")
-                    # Create session with connector for better connection handling
-                    connector = aiohttp.TCPConnector(limit=10, limit_per_host=5, force_close=False)
-                    async with aiohttp.ClientSession(connector=connector) as session:
-                        # First, test health endpoint (no auth required)
-                        try:
-                            _LOGGER.debug(f"Attempting to connect to health endpoint: {base_url}/api/v1/health")
-                            async with session.get(
-                                f"{base_url}/api/v1/health",
-                                timeout=aiohttp.ClientTimeout(total=10, connect=5)
-                            ) as health_response:
-                                if health_response.status == 200:
-                                    _LOGGER.info(f"Health endpoint accessible: {health_response.status}")
-                                    # Connection successful, check status for password requirement
-                                    try:
-                                        async with session.get(
-                                            f"{base_url}/api/v1/status",
-                                            timeout=aiohttp.ClientTimeout(total=10, connect=5)
-                                        ) as status_response:
-                                            _LOGGER.info(f"Status endpoint response: {status_response.status}")
-                                            if status_response.status == 401:
-                                                # Password required
-                                                _LOGGER.info("Password required, proceeding to password step")
-                                                self._password_step_data = {
-                                                    "host": host,
-                                                    "port": port,
-                                                    "client_id": client_id
-                                                }
-                                                return await self.async_step_password()
-                                            elif status_response.status == 200:
-                                                # Status accessible - always proceed to password step
-                                                # User can leave password empty if no password is set
-                                                try:
-                                                    # status_response.json() is already a coroutine, await it
-                                                    status_data = await status_response.json()
-                                                    if isinstance(status_data, dict):
-                                                        actual_client_id = status_data.get('client_id', client_id)
-                                                    else:
-                                                        _LOGGER.warning(f"Unexpected response type: {type(status_data)}")
-                                                        actual_client_id = client_id
-                                                    _LOGGER.info(f"Status accessible. Client ID: {actual_client_id}. Proceeding to password step.")
-                                                    self._password_step_data = {
-                                                        "host": host,
-                                                        "port": port,
-                                                        "client_id": actual_client_id
-                                                    }
-                                                    return await self.async_step_password()
-                                                except Exception as json_ex:
-                                                    _LOGGER.error(f"Error parsing status JSON: {json_ex}", exc_info=True)
-                                                    # Proceed to password step anyway with original client_id
-                                                    self._password_step_data = {
-                                                        "host": host,
-                                                        "port": port,
-                                                        "client_id": client_id
-                                                    }
-                                                    return await self.async_step_password()
-                                            else:
-                                                _LOGGER.warning(f"Unexpected status code: {status_response.status}")
-                                                errors["base"] = "cannot_connect"
-                                    except aiohttp.ClientError as ex:
-                                        _LOGGER.error(f"Error checking status endpoint: {ex}")
-                                        # Assume password required if status check fails
-                                        self._password_step_data = {
-                                            "host": host,
-                                            "port": port,
-                                            "client_id": client_id
-                                        }
-                                        return await self.async_step_password()
-                                    except aiohttp.ClientConnectorError as ex:
-                                        _LOGGER.error(f"Connection error checking status: {ex}")
-                                        errors["base"] = "cannot_connect"
-                                    except aiohttp.ServerTimeoutError as ex:
-                                        _LOGGER.error(f"Timeout checking status: {ex}")
-                                        errors["base"] = "timeout"
-                                    except asyncio.TimeoutError as ex:
-                                        _LOGGER.error(f"Request timeout checking status: {ex}")
-                                        errors["base"] = "timeout"
-                                    except Exception as ex:
-                                        _LOGGER.exception(f"Unexpected error checking status: {ex}")
-                                        error_msg = str(ex).lower()
-                                        if "connection" in error_msg or "connect" in error_msg or "refused" in error_msg:
-                                            errors["base"] = "cannot_connect"
-                                        elif "timeout" in error_msg:
-                                            errors["base"] = "timeout"
-                                        else:
-                                            errors["base"] = "cannot_connect"
-                                            _LOGGER.error(f"Unhandled error, treating as connection error: {error_msg}")
-                                else:
-                                    _LOGGER.error(f"Health endpoint returned status: {health_response.status}")
-                                    errors["base"] = "cannot_connect"
-                        except aiohttp.ClientConnectorError as ex:
-                            _LOGGER.error(f"Connection error to {base_url}: {ex}")
-                            _LOGGER.error(f"Connection error details: {type(ex).__name__}: {str(ex)}")
-                            errors["base"] = "cannot_connect"
-                        except aiohttp.ServerTimeoutError:
-                            _LOGGER.error("Connection timeout")
-                            errors["base"] = "timeout"
-                        except asyncio.TimeoutError:
-                            _LOGGER.error("Request timeout")
-                            errors["base"] = "timeout"
-                except aiohttp.ClientError as ex:
-                    _LOGGER.error(f"Client error: {ex}")
-                    errors["base"] = "cannot_connect"
-                except asyncio.TimeoutError:
-                    _LOGGER.error("Connection timeout")
-                    errors["base"] = "timeout"
-                except aiohttp.ClientConnectorError as ex:
-                    _LOGGER.error(f"Connection error: {ex}")
-                    errors["base"] = "cannot_connect"
-                except aiohttp.ServerTimeoutError as ex:
-                    _LOGGER.error(f"Server timeout: {ex}")
-                    errors["base"] = "timeout"
-                except asyncio.TimeoutError as ex:
-                    _LOGGER.error(f"Request timeout: {ex}")
-                    errors["base"] = "timeout"
-                except Exception as ex:
-                    _LOGGER.exception(f"Unexpected error during connection test: {ex}")
-                    error_msg = str(ex).lower()
-                    error_type = type(ex).__name__
-                    _LOGGER.error(f"Error type: {error_type}, Message: {error_msg}")
-                    
-                    if "connection" in error_msg or "connect" in error_msg or "refused" in error_msg:
-                        errors["base"] = "cannot_connect"
-                    elif "timeout" in error_msg:
-                        errors["base"] = "timeout"
-                    elif "name resolution" in error_msg or "dns" in error_msg:
-                        errors["base"] = "cannot_connect"
-                    else:
-                        # Treat unknown errors as connection errors for better UX
-                        errors["base"] = "cannot_connect"
-                        _LOGGER.error(f"Unhandled error type: {error_type}, treating as connection error")
+                _LOGGER.info(f"Testing connection to {base_url}")
+                probe = await async_get_probe_cache(self.hass).async_probe(base_url)
+                if probe.reachable:
+                    _LOGGER.info(
+                        f"Device reachable in {probe.rtt_ms} ms "
+                        f"(password {'required' if probe.requires_password else 'not required'}). "
+                        "Proceeding to password step."
+                    )
+                    # User can leave the password empty if none is set
+                    self._password_step_data = {
+                        "host": host,
+                        "port": port,
+                        "client_id": probe.client_id or client_id or host,
+                    }
+                    return await self.async_step_password()
+                _LOGGER.error(f"Could not connect to {base_url}: {probe.error}")
+                errors["base"] = probe.error or "cannot_connect"
 
         return self.async_show_form(
             step_id="manual",
@@ -338,13 +268,33 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             headers = {}
             if password:
                 headers["X-Password"] = password
-            
+
+            # A recent probe already read the status without a password
+            probe = async_get_probe_cache(self.hass).get(base_url)
+            if not password and probe is not None and not probe.requires_password:
+                actual_client_id = probe.client_id or client_id
+                _LOGGER.info(f"No password required. Client ID: {actual_client_id}")
+                entry_data = {
+                    "host": host,
+                    "port": port,
+                    "client_id": actual_client_id,
+                    "password": password,
+                    "base_url": base_url
+                }
+                if mac_address:
+                    entry_data["mac_address"] = mac_address
+                return self.async_create_entry(
+                    title=f"OpenCtrol - {actual_client_id}",
+                    data=entry_data
+                )
+
             try:
                 _LOGGER.info(f"Validating password for {base_url}")
                 _LOGGER.debug(f"Password validation: host={host}, port={port}, base_url={base_url}, has_password={bool(password)}")
-                # Use TCPConnector for better connection handling
-                connector = aiohttp.TCPConnector(limit=10, limit_per_host=5, force_close=False)
-                async with aiohttp.ClientSession(connector=connector) as session:
+                # Borrow the shared connection pool instead of building a throwaway one
+                async with async_get_session_manager(self.hass).async_lease(
+                    f"config_flow:{self.flow_id}", base_url
+                ) as session:
                     async with session.get(
                         f"{base_url}/api/v1/status",
                         headers=headers,
@@ -592,5 +542,54 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             return await self.async_step_manual()
 
 
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle OpenCtrol options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self._entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Select the transport, input batching, previews and screenshot retention."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        current = self._entry.options.get(
+            CONF_TRANSPORT, self._entry.data.get(CONF_TRANSPORT, TRANSPORT_HTTP)
+        )
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema({
+                vol.Required(CONF_TRANSPORT, default=current): vol.In(TRANSPORTS),
+                vol.Required(
+                    CONF_INPUT_FLUSH_INTERVAL,
+                    default=self._entry.options.get(
+                        CONF_INPUT_FLUSH_INTERVAL, DEFAULT_INPUT_FLUSH_INTERVAL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+                vol.Required(
+                    CONF_THUMBNAIL_TTL,
+                    default=self._entry.options.get(
+                        CONF_THUMBNAIL_TTL, DEFAULT_THUMBNAIL_TTL
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=300)),
+                vol.Required(
+                    CONF_SCREENSHOT_MAX_COUNT,
+                    default=self._entry.options.get(
+                        CONF_SCREENSHOT_MAX_COUNT, DEFAULT_SCREENSHOT_MAX_COUNT
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+                vol.Required(
+                    CONF_SCREENSHOT_MAX_SIZE,
+                    default=self._entry.options.get(
+                        CONF_SCREENSHOT_MAX_SIZE, DEFAULT_SCREENSHOT_MAX_SIZE
+                    ),
+                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=100000)),
+            }),
+        )
+
+
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
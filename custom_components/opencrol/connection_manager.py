@@ -0,0 +1,119 @@
+"""Shared HTTP connection pool for OpenCtrol."""
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_SESSION_MANAGER = "session_manager"
+
+# Pool limits. Per host, the push channel, input channel and screen stream
+# each hold a connection open, leaving the rest for concurrent polling and
+# commands.
+PER_HOST_CONNECTION_LIMIT = 8
+# Idle keep-alive sockets are closed after this long (seconds)
+KEEPALIVE_TIMEOUT = 30.0
+DNS_CACHE_TTL = 300  # seconds
+
+USER_AGENT = "HomeAssistant-OpenCtrol/2.0"
+
+
+class OpenCtrolSessionManager:
+    """Own the pooled aiohttp sessions used to talk to OpenCtrol clients.
+
+    Every config entry (and each config flow validation) registers as an
+    owner of the host it talks to. Owners of the same host share one
+    session, whose pool keeps keep-alive connections warm for polling and
+    reaps sockets idle for longer than ``KEEPALIVE_TIMEOUT``. When the last
+    owner of a host releases it, that host's session and connections are
+    closed; other hosts are not affected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize session manager."""
+        # Base URL -> session of that host
+        self._sessions: dict[str, aiohttp.ClientSession] = {}
+        self._lock = asyncio.Lock()
+        # Owner (entry id) -> base URL of the host it talks to
+        self._owners: dict[str, str] = {}
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return pool state for diagnostics."""
+        return {
+            "owners": len(self._owners),
+            "hosts": sorted(set(self._owners.values())),
+            "open_sessions": sorted(
+                base_url for base_url, session in self._sessions.items() if not session.closed
+            ),
+            "limit_per_host": PER_HOST_CONNECTION_LIMIT,
+            "keepalive_timeout": KEEPALIVE_TIMEOUT,
+        }
+
+    def acquire(self, owner: str, base_url: str) -> None:
+        """Register an owner of a host's pool."""
+        self._owners[owner] = base_url
+
+    async def async_get_session(self, base_url: str) -> aiohttp.ClientSession:
+        """Return the session of a host, creating it if needed."""
+        session = self._sessions.get(base_url)
+        if session is not None and not session.closed:
+            return session
+        async with self._lock:
+            session = self._sessions.get(base_url)
+            if session is None or session.closed:
+                connector = aiohttp.TCPConnector(
+                    limit=PER_HOST_CONNECTION_LIMIT,
+                    limit_per_host=PER_HOST_CONNECTION_LIMIT,
+                    keepalive_timeout=KEEPALIVE_TIMEOUT,
+                    ttl_dns_cache=DNS_CACHE_TTL,
+                    enable_cleanup_closed=True,
+                )
+                # Credentials are added by the client on each request, since
+                # several entries may point at the same PC
+                session = self._sessions[base_url] = aiohttp.ClientSession(
+                    headers={"User-Agent": USER_AGENT, "Accept": "application/json"},
+                    timeout=aiohttp.ClientTimeout(total=30, connect=10),
+                    connector=connector,
+                    read_bufsize=65536,
+                )
+                _LOGGER.debug(f"Created OpenCtrol connection pool for {base_url}")
+        return session
+
+    async def async_release(self, owner: str) -> None:
+        """Unregister an owner, closing its host's pool when no owner of it remains."""
+        base_url = self._owners.pop(owner, None)
+        if base_url is None or base_url in self._owners.values():
+            return
+        session = self._sessions.pop(base_url, None)
+        if session is not None and not session.closed:
+            await session.close()
+            _LOGGER.debug(f"Closed OpenCtrol connection pool for {base_url}")
+
+    @asynccontextmanager
+    async def async_lease(
+        self, owner: str, base_url: str
+    ) -> AsyncIterator[aiohttp.ClientSession]:
+        """Borrow a host's session for a short-lived task such as validation."""
+        self.acquire(owner, base_url)
+        try:
+            yield await self.async_get_session(base_url)
+        finally:
+            await self.async_release(owner)
+
+
+def async_get_session_manager(hass: HomeAssistant) -> OpenCtrolSessionManager:
+    """Return the domain-wide session manager."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_SESSION_MANAGER not in domain_data:
+        domain_data[DATA_SESSION_MANAGER] = OpenCtrolSessionManager()
+    return domain_data[DATA_SESSION_MANAGER]
@@ -7,6 +7,25 @@ CONF_HOST = "host"
 CONF_PORT = "port"
 CONF_PASSWORD = "password"
 CONF_CLIENT_ID = "client_id"
+CONF_TRANSPORT = "transport"
+CONF_INPUT_FLUSH_INTERVAL = "input_flush_interval"
+CONF_THUMBNAIL_TTL = "thumbnail_ttl"
+CONF_SCREENSHOT_MAX_COUNT = "screenshot_max_count"
+CONF_SCREENSHOT_MAX_SIZE = "screenshot_max_size"
+# Negotiated with the client and stored in the entry data
+CONF_API_VERSION = "api_version"
+CONF_CAPABILITIES = "capabilities"
+
+# Defaults
+DEFAULT_INPUT_FLUSH_INTERVAL = 12  # milliseconds
+DEFAULT_THUMBNAIL_TTL = 10  # seconds
+DEFAULT_SCREENSHOT_MAX_COUNT = 50
+DEFAULT_SCREENSHOT_MAX_SIZE = 200  # megabytes
+
+# Transports
+TRANSPORT_HTTP = "http"
+TRANSPORT_MQTT = "mqtt"
+TRANSPORTS = [TRANSPORT_HTTP, TRANSPORT_MQTT]
 
 # MQTT Topics
 TOPIC_COMMAND = "opencrol/{client_id}/command"
@@ -38,6 +57,17 @@ ATTR_VOLUME = "volume"
 ATTR_DEVICE_ID = "device_id"
 ATTR_CLIENT_ID = "client_id"
 
+# Coordinator data sections
+SECTION_STATUS = "status"
+SECTION_MONITORS = "monitors"
+SECTION_AUDIO_APPS = "audio_apps"
+SECTION_AUDIO_DEVICES = "audio_devices"
+SECTIONS = (SECTION_STATUS, SECTION_MONITORS, SECTION_AUDIO_APPS, SECTION_AUDIO_DEVICES)
+
+# Client capabilities
+CAPABILITY_AUDIO = "audio"
+CAPABILITY_SCREEN = "screen_capture"
+
 # Status
 STATE_ONLINE = "online"
 STATE_OFFLINE = "offline"
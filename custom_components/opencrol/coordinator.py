@@ -1,24 +1,167 @@
 """DataUpdateCoordinator for OpenCtrol."""
 
-from datetime import timedelta
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from datetime import datetime, timedelta
+import json
 import logging
+import time
 from typing import Any
 import aiohttp
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
+from homeassistant.util import dt as dt_util, slugify
+
 from .const import (
     DOMAIN,
     STATE_ONLINE,
     STATE_OFFLINE,
     CONF_CLIENT_ID,
+    CONF_TRANSPORT,
+    CONF_API_VERSION,
+    CONF_CAPABILITIES,
+    CAPABILITY_SCREEN,
+    CONF_INPUT_FLUSH_INTERVAL,
+    DEFAULT_INPUT_FLUSH_INTERVAL,
+    CONF_SCREENSHOT_MAX_COUNT,
+    DEFAULT_SCREENSHOT_MAX_COUNT,
+    CONF_SCREENSHOT_MAX_SIZE,
+    DEFAULT_SCREENSHOT_MAX_SIZE,
+    TRANSPORT_HTTP,
+    TRANSPORT_MQTT,
+    SECTION_STATUS,
+    SECTION_MONITORS,
+    SECTION_AUDIO_APPS,
+    SECTION_AUDIO_DEVICES,
+    SECTIONS,
+)
+from .capabilities import (
+    PLATFORMS,
+    SECTION_CAPABILITIES,
+    parse_api_version,
+    parse_capabilities,
+    supports,
 )
-from .http_client import OpenCtrolHttpClient
+from .connection_manager import async_get_session_manager
+from .http_client import CircuitOpenError, OpenCtrolHttpClient
+from .input_channel import FRAME_CODES as INPUT_CHANNEL_COMMANDS
+from .input_coalescer import InputCoalescer
+from .mqtt_transport import AUDIO_KEYS, SECTION_AUDIO, OpenCtrolMqttTransport
+from .screenshots import Screenshot, ScreenshotStore
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared deadline for all requests issued by one refresh (seconds)
+REFRESH_DEADLINE = 8.0
+
+# Refresh interval per data section. Status (online state, master volume,
+# capture state) drives the coordinator tick; the rest rarely change and are
+# only re-fetched once their interval has elapsed.
+SECTION_INTERVALS = {
+    SECTION_STATUS: timedelta(seconds=10),
+    SECTION_AUDIO_APPS: timedelta(seconds=30),
+    SECTION_MONITORS: timedelta(minutes=2),
+    SECTION_AUDIO_DEVICES: timedelta(minutes=2),
+}
+
+# Coordinator data keys owned by each section
+SECTION_KEYS = {
+    SECTION_STATUS: ("status", "capabilities", "master_volume", "screen_capture_active"),
+    SECTION_MONITORS: ("monitors", "current_monitor", "total_monitors"),
+    SECTION_AUDIO_APPS: ("audio_apps",),
+    SECTION_AUDIO_DEVICES: ("audio_devices",),
+}
+
+# Reconnect backoff for the push channel (seconds)
+PUSH_INITIAL_RETRY_DELAY = 1.0
+PUSH_MAX_RETRY_DELAY = 60.0
+# Retry delay when the client does not offer a push channel at all
+PUSH_UNSUPPORTED_RETRY_DELAY = 600.0
+
+# Coordinator data before anything has been fetched
+EMPTY_DATA: dict[str, Any] = {
+    "status": STATE_OFFLINE,
+    "monitors": [],
+    "current_monitor": 0,
+    "total_monitors": 0,
+    "audio_apps": [],
+    "audio_devices": [],
+    "capabilities": {},
+    "master_volume": 0.0,
+    "screen_capture_active": False,
+}
+
+# The last known state of each PC is persisted so setup can create entities
+# from it instead of waiting for a PC that may be asleep
+STORAGE_VERSION = 1
+STORAGE_KEY = f"{DOMAIN}.snapshot"
+# Snapshot writes are batched; volumes and app lists change often (seconds)
+SNAPSHOT_SAVE_DELAY = 60
+# Coordinator data kept in the snapshot; the online state is never restored
+SNAPSHOT_KEYS = (
+    "monitors",
+    "current_monitor",
+    "total_monitors",
+    "audio_apps",
+    "audio_devices",
+    "capabilities",
+    "master_volume",
+)
+
+# Screen capture keeps running this long after the last viewer leaves, so
+# switching tabs or scrolling past the card does not restart it (seconds)
+VIEWER_GRACE_PERIOD = 30
+
+# Apps missing from the audio app list for longer than this lose their
+# entities; shorter gaps (an app restarting) keep them
+APP_EXPIRY = timedelta(minutes=5)
+
+
+def audio_app_key(app: dict[str, Any]) -> str:
+    """Return the stable identity of an audio app, independent of its process id."""
+    executable = app.get("executable") or app.get("process_name") or app.get("name")
+    if not executable:
+        return f"pid_{app.get('process_id') or app.get('id')}"
+    key = slugify(str(executable).rsplit("\\", 1)[-1].lower().removesuffix(".exe"))
+    # The session identifier (unlike the instance identifier) survives restarts
+    session = app.get("session_id")
+    if session:
+        key = f"{key}_{slugify(str(session))[-12:]}"
+    return key
+
+
+def section_fingerprint(data: dict[str, Any], section: str) -> int:
+    """Return a cheap fingerprint of the data keys owned by a section."""
+    return hash(
+        json.dumps(
+            [data.get(key) for key in SECTION_KEYS[section]],
+            sort_keys=True,
+            separators=(",", ":"),
+            default=str,
+        )
+    )
+
+
+def snapshot_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the last known state of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{STORAGE_KEY}.{entry_id}")
+
+
+# Commands whose effect is only visible in a slow section; that section is
+# re-fetched on the next refresh instead of waiting for its interval
+COMMAND_INVALIDATES = {
+    "select_monitor": (SECTION_MONITORS,),
+    "set_app_volume": (SECTION_AUDIO_APPS,),
+    "set_app_device": (SECTION_AUDIO_APPS,),
+    "set_default_device": (SECTION_AUDIO_DEVICES,),
+}
+
 
 class OpenCtrolCoordinator(DataUpdateCoordinator):
     """Class to manage fetching OpenCtrol data."""
@@ -29,76 +172,370 @@ class OpenCtrolCoordinator(DataUpdateCoordinator):
         self.client_id = entry.data.get(CONF_CLIENT_ID, "default")
         self._http_client: OpenCtrolHttpClient | None = None
         self._available = False
+        # Capabilities negotiated with the client, kept in the entry data and
+        # only renegotiated when the client's API version changes. Anything
+        # not explicitly reported as unsupported is assumed supported.
+        self.api_version: str | None = entry.data.get(CONF_API_VERSION)
+        capabilities = entry.data.get(CONF_CAPABILITIES)
+        self._negotiated = isinstance(capabilities, dict)
+        self.capabilities: dict[str, bool] = capabilities if self._negotiated else {}
+        # Platforms forwarded for this entry
+        self.platforms: list[str] = list(PLATFORMS)
+        # Per-section freshness and change tracking
+        self.section_updated: dict[str, datetime] = {}
+        self.changed_sections: set[str] = set(SECTIONS)
+        # Fingerprint and revision per section; a revision only moves when
+        # the section's content actually changed
+        self.section_fingerprints: dict[str, int] = {}
+        self.section_revisions: dict[str, int] = dict.fromkeys(SECTIONS, 0)
+        self._section_listeners: dict[CALLBACK_TYPE, frozenset[str]] = {}
+        # Sections served from the persisted snapshot until first fetched
+        self.restored_sections: set[str] = set()
+        self._store = snapshot_store(hass, entry.entry_id)
+        # Audio apps by stable key; apps seen recently are still tracked so a
+        # short gap does not drop their entities
+        self.audio_apps: dict[str, dict[str, Any]] = {}
+        self._app_last_seen: dict[str, datetime] = {}
+        # Frontend viewers of the screen stream; capture is stopped when the
+        # last one leaves and restarted for the next one
+        self.viewers = 0
+        self._viewer_grace_unsub: CALLBACK_TYPE | None = None
+        self._capture_paused = False
+        # Push channel state; polling is paused while the channel is up
+        self.push_connected = False
+        self._push_task: asyncio.Task | None = None
+        # Optional MQTT transport replaces polling and HTTP commands
+        self.transport = entry.options.get(
+            CONF_TRANSPORT, entry.data.get(CONF_TRANSPORT, TRANSPORT_HTTP)
+        )
+        self._mqtt: OpenCtrolMqttTransport | None = None
+        self._mqtt_status_received = asyncio.Event()
+        if self.transport == TRANSPORT_MQTT:
+            self._mqtt = OpenCtrolMqttTransport(hass, self.client_id, self._handle_push_event)
+        # Pointer input is coalesced per device before it is sent
+        self.input_coalescer = InputCoalescer(
+            hass,
+            self._async_dispatch_command,
+            entry.options.get(CONF_INPUT_FLUSH_INTERVAL, DEFAULT_INPUT_FLUSH_INTERVAL),
+        )
 
         # Get base URL from config
         base_url = entry.data.get("base_url", f"http://{entry.data.get('host', 'localhost')}:{entry.data.get('port', 8080)}")
         password = entry.data.get("password")
 
-        self._http_client = OpenCtrolHttpClient(base_url, password)
+        # All entries share one connection pool; this entry's share is
+        # released when the client is closed on unload
+        self._session_manager = async_get_session_manager(hass)
+        self._http_client = OpenCtrolHttpClient(
+            base_url, password, self._session_manager, entry.entry_id
+        )
+        # Screenshots are downloaded into the media directory
+        self.screenshots = ScreenshotStore(
+            hass,
+            self._http_client,
+            self.client_id,
+            entry.options.get(CONF_SCREENSHOT_MAX_COUNT, DEFAULT_SCREENSHOT_MAX_COUNT),
+            entry.options.get(CONF_SCREENSHOT_MAX_SIZE, DEFAULT_SCREENSHOT_MAX_SIZE),
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=10),  # Reduced frequency for better performance
+            # State arrives on retained topics when MQTT is used
+            update_interval=None if self._mqtt else SECTION_INTERVALS[SECTION_STATUS],
+        )
+
+    async def async_restore_snapshot(self) -> bool:
+        """Start from the last known state; returns False if there is none.
+
+        Restored data is served with the coordinator marked as failed, so
+        entities are created straight away but stay unavailable until the
+        PC answers.
+        """
+        snapshot = await self._store.async_load()
+        if not snapshot:
+            return False
+        data = {**EMPTY_DATA, **{key: snapshot[key] for key in SNAPSHOT_KEYS if key in snapshot}}
+        data["audio_apps"] = self._index_audio_apps(data["audio_apps"])
+        self.restored_sections = {
+            section
+            for section in SECTIONS
+            if any(key in snapshot for key in SECTION_KEYS[section])
+        }
+        self._diff_sections(data)
+        self.changed_sections = set(SECTIONS)
+        self.data = data
+        self.last_update_success = False
+        _LOGGER.debug(f"Restored last known state of {self.client_id}")
+        return True
+
+    @callback
+    def _snapshot(self) -> dict[str, Any]:
+        """Return the data persisted as the last known state."""
+        data = self.data or EMPTY_DATA
+        return {key: data.get(key) for key in SNAPSHOT_KEYS}
+
+    def _sections_due(self) -> list[str]:
+        """Return the sections whose refresh interval has elapsed."""
+        now = dt_util.utcnow()
+        due = [SECTION_STATUS]
+        for section in SECTIONS:
+            if section == SECTION_STATUS or not self.section_supported(section):
+                continue
+            last = self.section_updated.get(section)
+            if last is None or now - last >= SECTION_INTERVALS[section]:
+                due.append(section)
+        return due
+
+    def supports(self, capability: str) -> bool:
+        """Return if the client supports a capability."""
+        return supports(self.capabilities, capability)
+
+    def section_supported(self, section: str) -> bool:
+        """Return if the client offers the endpoint behind a data section."""
+        capability = SECTION_CAPABILITIES.get(section)
+        return capability is None or self.supports(capability)
+
+    @callback
+    def _async_negotiate(self, status: dict[str, Any]) -> None:
+        """Store the client's capabilities on first contact or after a version change."""
+        version = parse_api_version(status)
+        if version is None and "capabilities" not in status:
+            # Nothing to negotiate from, e.g. a pushed delta
+            return
+        if version is None:
+            version = self.api_version
+        if self._negotiated and version == self.api_version:
+            return
+        capabilities = parse_capabilities(status.get("capabilities"))
+        unsupported = sorted(name for name, supported in capabilities.items() if not supported)
+        _LOGGER.info(
+            f"OpenCtrol {self.client_id} API version {version}, unsupported capabilities: "
+            f"{', '.join(unsupported) or 'none'}"
         )
+        self.api_version = version
+        self.capabilities = capabilities
+        self._negotiated = True
+        # The update listener reloads the entry if the platforms change
+        self.hass.config_entries.async_update_entry(
+            self.entry,
+            data={
+                **self.entry.data,
+                CONF_API_VERSION: version,
+                CONF_CAPABILITIES: capabilities,
+            },
+        )
+
+    @callback
+    def async_add_viewer(self) -> CALLBACK_TYPE:
+        """Register a viewer of the screen stream; returns a release callback."""
+        self.viewers += 1
+        if self._viewer_grace_unsub is not None:
+            self._viewer_grace_unsub()
+            self._viewer_grace_unsub = None
+        if self._capture_paused:
+            self._capture_paused = False
+            self.hass.async_create_task(self.send_command("start_screen_capture"))
+
+        released = False
+
+        @callback
+        def release_viewer() -> None:
+            nonlocal released
+            if released:
+                return
+            released = True
+            self.viewers -= 1
+            if self.viewers == 0:
+                self._viewer_grace_unsub = async_call_later(
+                    self.hass, VIEWER_GRACE_PERIOD, self._async_stop_unwatched_capture
+                )
+
+        return release_viewer
+
+    async def _async_stop_unwatched_capture(self, _now: datetime) -> None:
+        """Stop screen capture nobody has been watching for the grace period."""
+        self._viewer_grace_unsub = None
+        if self.viewers or not (self.data or {}).get("screen_capture_active"):
+            return
+        _LOGGER.debug("No viewers left, stopping screen capture")
+        if await self.send_command("stop_screen_capture"):
+            self._capture_paused = True
+
+    async def async_take_screenshot(self) -> Screenshot | None:
+        """Capture the selected monitor and save it to the media directory."""
+        if not self._available or not self.supports(CAPABILITY_SCREEN):
+            return None
+        return await self.screenshots.async_capture((self.data or {}).get("current_monitor", 0))
+
+    async def async_get_frame(self) -> bytes | None:
+        """Return the current frame of the selected monitor as JPEG."""
+        if not self._available or not self.supports(CAPABILITY_SCREEN):
+            return None
+        return await self._http_client.get_frame((self.data or {}).get("current_monitor", 0))
+
+    def stream_screen(self, monitor: int = 0) -> AsyncIterator[bytes]:
+        """Return the raw MJPEG screen stream of a monitor."""
+        return self._http_client.stream_screen(monitor)
+
+    @property
+    def input_channel_stats(self) -> dict[str, Any]:
+        """Return statistics of the persistent input channel."""
+        return self._http_client.input_channel.stats if self._http_client else {}
+
+    @property
+    def request_policies(self) -> dict[str, dict[str, Any]]:
+        """Return the retry and deadline policy applied to each command."""
+        return self._http_client.policies if self._http_client else {}
+
+    @property
+    def connection_pool(self) -> dict[str, Any]:
+        """Return the state of the shared connection pool."""
+        return self._session_manager.stats
+
+    @property
+    def circuit_breaker(self) -> dict[str, Any]:
+        """Return the state of the host's circuit breaker."""
+        return self._http_client.breaker.stats if self._http_client else {}
+
+    @callback
+    def async_invalidate_section(self, section: str) -> None:
+        """Mark a section stale so it is re-fetched on the next refresh."""
+        self.section_updated.pop(section, None)
+
+    @callback
+    def async_start_push(self) -> None:
+        """Start the push subscription in the background."""
+        if self._mqtt:
+            # MQTT state topics are subscribed during the first refresh
+            return
+        if self._push_task is None and self._http_client:
+            self._push_task = self.entry.async_create_background_task(
+                self.hass, self._async_run_push(), f"{DOMAIN}_{self.client_id}_push"
+            )
+
+    async def _async_run_push(self) -> None:
+        """Keep the push channel connected, reconnecting with backoff.
+
+        While the channel is up, polling is disabled and state deltas are
+        applied as they arrive. When it drops, polling resumes at the status
+        interval until the channel comes back.
+        """
+        delay = PUSH_INITIAL_RETRY_DELAY
+        while True:
+            try:
+                await self._http_client.subscribe_events(self._handle_push_event)
+                _LOGGER.debug("OpenCtrol push channel closed by client")
+            except aiohttp.WSServerHandshakeError as ex:
+                if ex.status == 404:
+                    _LOGGER.debug("OpenCtrol client does not offer a push channel, polling only")
+                    delay = PUSH_UNSUPPORTED_RETRY_DELAY
+                else:
+                    _LOGGER.debug(f"Push channel handshake failed: {ex}")
+            except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as ex:
+                _LOGGER.debug(f"Push channel disconnected: {ex}")
+            except Exception as ex:
+                _LOGGER.warning(f"Unexpected push channel error: {ex}", exc_info=True)
+            if self.push_connected:
+                delay = PUSH_INITIAL_RETRY_DELAY
+                self._set_push_connected(False)
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, PUSH_MAX_RETRY_DELAY)
+
+    @callback
+    def _set_push_connected(self, connected: bool) -> None:
+        """Switch between push-driven updates and polling."""
+        if connected == self.push_connected:
+            return
+        self.push_connected = connected
+        if connected:
+            _LOGGER.info(f"OpenCtrol push channel connected for {self.client_id}, pausing polling")
+            self.update_interval = None
+        else:
+            _LOGGER.info(f"OpenCtrol push channel down for {self.client_id}, resuming polling")
+            self.update_interval = SECTION_INTERVALS[SECTION_STATUS]
+            # Resync anything missed while the channel was down
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def _handle_push_event(self, event: dict[str, Any]) -> None:
+        """Apply a pushed section delta to coordinator data."""
+        if not self.push_connected and not self._mqtt:
+            self._set_push_connected(True)
+        section = event.get("section")
+        payload = event.get("data")
+        if section == SECTION_AUDIO:
+            # Master volume update: merged into the status section, but it
+            # does not count as a status message
+            if not isinstance(payload, dict):
+                return
+            payload = {key: payload[key] for key in AUDIO_KEYS if key in payload}
+            if not payload:
+                return
+            data = {**EMPTY_DATA, **(self.data or {})}
+            data.update(payload)
+            self.changed_sections = self._diff_sections(data)
+            if self.changed_sections and self.last_update_success:
+                self.async_set_updated_data(data)
+            elif self.changed_sections:
+                # Picked up once the status arrives
+                self.data = data
+            return
+        if section not in SECTIONS:
+            _LOGGER.debug(f"Ignoring push event for unknown section: {section}")
+            return
+        if section == SECTION_STATUS:
+            self._mqtt_status_received.set()
+        previous = self.data or {}
+        data = {**EMPTY_DATA, **previous}
+        self._merge_section(data, section, payload)
+        self.changed_sections = self._diff_sections(data)
+        if self.changed_sections or not self.last_update_success:
+            self.async_set_updated_data(data)
 
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from OpenCtrol."""
+        # A failed refresh changes nothing; listeners only see availability
+        self.changed_sections = set()
+        if self._mqtt:
+            return await self._async_update_from_mqtt()
+
         if not self._http_client:
-            return {
-                "status": STATE_OFFLINE,
-                "monitors": [],
-                "audio_apps": [],
-                "audio_devices": [],
-            }
+            return dict(EMPTY_DATA)
+
+        # Only sections whose interval has elapsed are fetched; the rest keep
+        # serving their last known value. Due sections are fanned out
+        # concurrently under one shared deadline so a refresh costs a single
+        # round trip and a slow subsystem (e.g. audio on the PC) cannot hold
+        # back status data.
+        due = self._sections_due()
+        _LOGGER.debug(f"Refreshing OpenCtrol sections: {due}")
+        fetchers = {
+            SECTION_STATUS: self._http_client.get_status,
+            SECTION_MONITORS: self._http_client.get_monitors,
+            SECTION_AUDIO_APPS: self._http_client.get_audio_apps,
+            SECTION_AUDIO_DEVICES: self._http_client.get_audio_devices,
+        }
+        results = await self._async_fetch_sections(
+            {section: fetchers[section] for section in due}
+        )
 
         try:
-            # Get status
-            _LOGGER.debug("Fetching status from OpenCtrol client")
-            status_data = await self._http_client.get_status()
-            self._available = status_data.get("online", False)
-            _LOGGER.debug(f"Status response: online={self._available}, data keys: {list(status_data.keys())}")
-
-            # Get monitors
-            monitors_data = await self._http_client.get_monitors()
-            
-            # Extract monitors list and current_monitor
-            monitors = []
-            current_monitor = 0
-            if isinstance(monitors_data, dict):
-                monitors = monitors_data.get("monitors", [])
-                current_monitor = monitors_data.get("current_monitor", 0)
-            elif isinstance(monitors_data, list):
-                monitors = monitors_data
-                # Get current monitor from status endpoint if available
-                current_monitor = status_data.get("current_monitor", 0)
-
-            # Get audio apps and devices
-            try:
-                audio_apps = await self._http_client.get_audio_apps()
-                audio_devices = await self._http_client.get_audio_devices()
-            except Exception as ex:
-                _LOGGER.warning(f"Error fetching audio data: {ex}")
-                audio_apps = []
-                audio_devices = []
-
-            return {
-                "status": STATE_ONLINE if self._available else STATE_OFFLINE,
-                "monitors": monitors,
-                "current_monitor": current_monitor,
-                "total_monitors": len(monitors),
-                "audio_apps": audio_apps,
-                "audio_devices": audio_devices,
-                "capabilities": status_data.get("capabilities", {}),
-                "master_volume": status_data.get("master_volume", 0.0),
-                "screen_capture_active": status_data.get("screen_capture_active", False),
-            }
+            status_data = results[SECTION_STATUS]
+            if isinstance(status_data, BaseException):
+                raise status_data
+            _LOGGER.debug(f"Status response: online={status_data.get('online', False)}, data keys: {list(status_data.keys())}")
+        except CircuitOpenError as ex:
+            # Already logged when the circuit opened; stay quiet until it closes
+            _LOGGER.debug(f"Skipping refresh: {ex}")
+            self._available = False
+            raise UpdateFailed(f"Cannot connect to OpenCtrol: {ex}") from ex
         except ConnectionError as ex:
             _LOGGER.warning(f"Connection error: {ex}")
             self._available = False
             raise UpdateFailed(f"Cannot connect to OpenCtrol: {ex}") from ex
-        except TimeoutError as ex:
+        except (TimeoutError, asyncio.TimeoutError) as ex:
             _LOGGER.warning(f"Timeout error: {ex}")
             self._available = False
             raise UpdateFailed(f"Connection timeout: {ex}") from ex
@@ -111,12 +548,315 @@ class OpenCtrolCoordinator(DataUpdateCoordinator):
             self._available = False
             raise UpdateFailed(f"Error communicating with OpenCtrol: {ex}") from ex
 
+        previous = self.data or {}
+        data = {**EMPTY_DATA, **previous}
+        # A polled status is a full snapshot, so a missing flag means offline
+        self._merge_section(data, SECTION_STATUS, {"online": False, **status_data})
+
+        # A failed section keeps its stale value and is retried on the next
+        # refresh
+        for section in due:
+            # The status may just have revealed that a section is unsupported
+            if section == SECTION_STATUS or not self.section_supported(section):
+                continue
+            if isinstance(results[section], BaseException):
+                _LOGGER.warning(f"Error fetching {section}: {results[section]}")
+                continue
+            self._merge_section(data, section, results[section])
+
+        self.changed_sections = self._diff_sections(data)
+        return data
+
+    async def _async_update_from_mqtt(self) -> dict[str, Any]:
+        """Return state received on the retained MQTT topics.
+
+        The first call subscribes and waits for the retained status message so
+        setup fails (and is retried) if the client has never published.
+        """
+        try:
+            await self._mqtt.async_subscribe()
+        except Exception as ex:
+            raise UpdateFailed(f"Cannot subscribe to OpenCtrol MQTT topics: {ex}") from ex
+        try:
+            async with asyncio.timeout(REFRESH_DEADLINE):
+                await self._mqtt_status_received.wait()
+        except TimeoutError as ex:
+            # Setup is retried with a new coordinator; its handlers must not
+            # stay subscribed
+            self._mqtt.async_unsubscribe()
+            raise UpdateFailed(
+                f"No retained status from OpenCtrol {self.client_id} over MQTT"
+            ) from ex
+        self.changed_sections = set()
+        return {**EMPTY_DATA, **(self.data or {})}
+
+    def _merge_section(self, data: dict[str, Any], section: str, payload: Any) -> None:
+        """Merge a section payload (polled or pushed) into coordinator data."""
+        if section == SECTION_STATUS:
+            if not isinstance(payload, dict):
+                return
+            self._async_negotiate(payload)
+            self._available = payload.get("online", data["status"] == STATE_ONLINE)
+            data["status"] = STATE_ONLINE if self._available else STATE_OFFLINE
+            for key in ("capabilities", "master_volume", "screen_capture_active", "current_monitor"):
+                if key in payload:
+                    data[key] = payload[key]
+        elif section == SECTION_MONITORS:
+            # Extract monitors list and current_monitor
+            if isinstance(payload, dict):
+                data["monitors"] = payload.get("monitors", [])
+                data["current_monitor"] = payload.get("current_monitor", data["current_monitor"])
+            elif isinstance(payload, list):
+                data["monitors"] = payload
+            else:
+                return
+            data["total_monitors"] = len(data["monitors"])
+        elif section == SECTION_AUDIO_APPS:
+            if not isinstance(payload, list):
+                return
+            data[section] = self._index_audio_apps(payload)
+        elif section == SECTION_AUDIO_DEVICES:
+            if not isinstance(payload, list):
+                return
+            data[section] = payload
+        else:
+            return
+        self.section_updated[section] = dt_util.utcnow()
+
+    @property
+    def tracked_app_keys(self) -> set[str]:
+        """Return the keys of apps present now or seen within the expiry time."""
+        return set(self._app_last_seen)
+
+    def _index_audio_apps(self, apps: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Key each app by its stable identity and refresh the app index."""
+        now = dt_util.utcnow()
+        index: dict[str, dict[str, Any]] = {}
+        # Instances sharing an identity are numbered in process id order
+        for app in sorted(apps, key=lambda a: str(a.get("process_id") or a.get("id") or "")):
+            base = key = audio_app_key(app)
+            instance = 2
+            while key in index:
+                key = f"{base}_{instance}"
+                instance += 1
+            index[key] = {**app, "key": key}
+            self._app_last_seen[key] = now
+
+        for key, seen in list(self._app_last_seen.items()):
+            if key not in index and now - seen > APP_EXPIRY:
+                del self._app_last_seen[key]
+
+        added = index.keys() - self.audio_apps.keys()
+        removed = self.audio_apps.keys() - index.keys()
+        if added or removed:
+            _LOGGER.debug(f"Audio apps added: {sorted(added)}, removed: {sorted(removed)}")
+        self.audio_apps = index
+        return list(index.values())
+
+    def _diff_sections(self, data: dict[str, Any]) -> set[str]:
+        """Return the sections whose fingerprint changed, bumping their revision."""
+        changed = set()
+        for section in SECTIONS:
+            fingerprint = section_fingerprint(data, section)
+            if fingerprint != self.section_fingerprints.get(section):
+                self.section_fingerprints[section] = fingerprint
+                self.section_revisions[section] += 1
+                changed.add(section)
+        return changed
+
+    @property
+    def revision(self) -> int:
+        """Return a counter that moves whenever any section changes."""
+        return sum(self.section_revisions.values())
+
+    def sections_snapshot(self, sections: Iterable[str] = SECTIONS) -> dict[str, Any]:
+        """Return the data keys and revision of the given sections."""
+        data = self.data or EMPTY_DATA
+        return {
+            section: {
+                "revision": self.section_revisions[section],
+                "data": {key: data.get(key) for key in SECTION_KEYS[section]},
+            }
+            for section in sections
+        }
+
+    @callback
+    def async_add_section_listener(
+        self, sections: Iterable[str], update_callback: CALLBACK_TYPE
+    ) -> CALLBACK_TYPE:
+        """Listen for changes to specific data sections only."""
+        self._section_listeners[update_callback] = frozenset(sections)
+
+        @callback
+        def remove_listener() -> None:
+            self._section_listeners.pop(update_callback, None)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update all listeners, and section listeners whose sections changed."""
+        super().async_update_listeners()
+        if not self.changed_sections:
+            return
+        if self._available:
+            self._store.async_delay_save(self._snapshot, SNAPSHOT_SAVE_DELAY)
+        for update_callback, sections in list(self._section_listeners.items()):
+            if sections & self.changed_sections:
+                update_callback()
+
+    async def _async_fetch_sections(
+        self, fetchers: dict[str, Callable[[], Awaitable[Any]]]
+    ) -> dict[str, Any]:
+        """Run fetchers concurrently under a shared deadline.
+
+        Returns a mapping of section name to either the fetched value or the
+        exception that section failed with. Fetchers still running when the
+        deadline expires are cancelled and reported as timeouts.
+        """
+        tasks = {
+            name: asyncio.create_task(fetcher(), name=f"{DOMAIN}_{self.client_id}_{name}")
+            for name, fetcher in fetchers.items()
+        }
+        _, pending = await asyncio.wait(tasks.values(), timeout=REFRESH_DEADLINE)
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        results: dict[str, Any] = {}
+        for name, task in tasks.items():
+            if task in pending:
+                results[name] = asyncio.TimeoutError(
+                    f"{name} not received within {REFRESH_DEADLINE:.0f}s"
+                )
+            elif task.exception() is not None:
+                results[name] = task.exception()
+            else:
+                results[name] = task.result()
+        return results
+
     async def send_command(self, command: str, **kwargs: Any) -> bool:
-        """Send command to OpenCtrol client via HTTP."""
+        """Send command to OpenCtrol client.
+
+        Pointer moves and scrolls are queued in the input coalescer and
+        flushed in batches; every other command first flushes pending input
+        so ordering on the PC matches the order of service calls.
+        """
         if not self._http_client or not self._available:
             _LOGGER.error("Cannot send command: HTTP client not available")
             return False
 
+        for section in COMMAND_INVALIDATES.get(command, ()):
+            self.async_invalidate_section(section)
+
+        if command == "move_mouse":
+            self.input_coalescer.queue_move(
+                kwargs.get("x", 0), kwargs.get("y", 0), relative=kwargs.get("relative", False)
+            )
+            return True
+        if command == "scroll":
+            self.input_coalescer.queue_scroll(kwargs.get("delta", 0))
+            return True
+        if command == "click":
+            return await self.input_coalescer.async_click(
+                kwargs.get("button", "left"), kwargs.get("x"), kwargs.get("y")
+            )
+
+        await self.input_coalescer.async_flush()
+        return await self._async_dispatch_command(command, **kwargs)
+
+    async def async_send_commands(
+        self, steps: list[dict[str, Any]], stop_on_error: bool = False
+    ) -> list[dict[str, Any]]:
+        """Execute an ordered list of commands and report per-step results.
+
+        Each step is ``{"command": str, "delay": seconds, **params}``. The
+        whole list is sent as one batch request when the client supports it;
+        otherwise steps run back to back over the shared keep-alive
+        connection, bypassing input coalescing so the order is exact.
+        """
+        if not self._http_client or not self._available:
+            _LOGGER.error("Cannot send commands: HTTP client not available")
+            return [{"command": step["command"], "success": False, "skipped": True} for step in steps]
+
+        await self.input_coalescer.async_flush()
+        for step in steps:
+            for section in COMMAND_INVALIDATES.get(step["command"], ()):
+                self.async_invalidate_section(section)
+
+        def _params(step: dict[str, Any]) -> dict[str, Any]:
+            return {key: value for key, value in step.items() if key not in ("command", "delay")}
+
+        # Screenshots are downloaded into Home Assistant, which a batch cannot do
+        batchable = not any(step["command"] == "take_screenshot" for step in steps)
+        if not self._mqtt and batchable and self._http_client.batch_supported is not False:
+            try:
+                results = await self._http_client.send_batch(
+                    [
+                        {
+                            "command": step["command"],
+                            "params": _params(step),
+                            "delay_ms": round(step.get("delay", 0) * 1000),
+                        }
+                        for step in steps
+                    ],
+                    stop_on_error=stop_on_error,
+                )
+            except (CircuitOpenError, aiohttp.ClientConnectorError, aiohttp.ClientResponseError) as ex:
+                # Never reached the PC, or rejected as a whole: run the steps
+                # one by one instead
+                _LOGGER.warning(f"Command batch failed, sending steps individually: {ex}")
+                results = None
+            except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+                # Some steps may have run; sending them again could repeat them
+                raise HomeAssistantError(
+                    f"Command batch to OpenCtrol {self.client_id} failed: {ex}"
+                ) from ex
+            if results is not None:
+                report = []
+                for index, step in enumerate(steps):
+                    result = results[index] if index < len(results) and isinstance(results[index], dict) else {}
+                    step_report = {
+                        "command": step["command"],
+                        "success": bool(result.get("success", False)),
+                        "elapsed_ms": result.get("elapsed_ms"),
+                    }
+                    if result.get("unknown"):
+                        # Sent but not answered in time; it may still have run
+                        step_report.update(success=None, unknown=True)
+                    report.append(step_report)
+                return report
+
+        report: list[dict[str, Any]] = []
+        failed = False
+        for step in steps:
+            if failed and stop_on_error:
+                report.append({"command": step["command"], "success": False, "skipped": True})
+                continue
+            started = time.monotonic()
+            success = await self._async_dispatch_command(step["command"], **_params(step))
+            report.append({
+                "command": step["command"],
+                "success": success,
+                "elapsed_ms": round((time.monotonic() - started) * 1000, 1),
+            })
+            failed = failed or not success
+            if step.get("delay"):
+                await asyncio.sleep(step["delay"])
+        return report
+
+    async def _async_dispatch_command(self, command: str, **kwargs: Any) -> bool:
+        """Send a single command over the configured transport."""
+        if self._mqtt:
+            return await self._mqtt.async_send_command(command, **kwargs)
+
+        # Input goes over the persistent channel when the PC offers one
+        if command in INPUT_CHANNEL_COMMANDS and await self._http_client.input_channel.async_send(
+            command, **kwargs
+        ):
+            return True
+
         try:
             if command == "move_mouse":
                 relative = kwargs.get("relative", False)
@@ -144,8 +884,7 @@ class OpenCtrolCoordinator(DataUpdateCoordinator):
             elif command == "send_to_secure_desktop":
                 return await self._http_client.send_to_secure_desktop(kwargs.get("text", ""))
             elif command == "take_screenshot":
-                result = await self._http_client.take_screenshot()
-                return result is not None and result.get("success", False)
+                return await self.async_take_screenshot() is not None
             elif command == "restart":
                 return await self._http_client.restart_client()
             elif command == "lock":
@@ -172,5 +911,15 @@ class OpenCtrolCoordinator(DataUpdateCoordinator):
 
     async def async_shutdown(self) -> None:
         """Shutdown coordinator."""
+        if self._push_task:
+            self._push_task.cancel()
+            self._push_task = None
+        self.input_coalescer.async_cancel()
+        if self._viewer_grace_unsub is not None:
+            self._viewer_grace_unsub()
+            self._viewer_grace_unsub = None
+        if self._mqtt:
+            self._mqtt.async_unsubscribe()
+        await super().async_shutdown()
         if self._http_client:
             await self._http_client.close()
@@ -0,0 +1,141 @@
+"""Reachability probes for OpenCtrol devices being set up."""
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import HomeAssistant, callback
+
+from .connection_manager import async_get_session_manager
+from .const import DOMAIN
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_PROBE_CACHE = "probe_cache"
+
+STATUS_PATH = "/api/v1/status"
+# Probes run while the user is looking at a form, so they fail fast
+PROBE_TIMEOUT = 4.0  # seconds
+PROBE_CONNECT_TIMEOUT = 2.0  # seconds
+# How long a probe result is trusted
+PROBE_TTL = 60.0  # seconds
+
+
+@dataclass
+class DeviceProbe:
+    """Result of probing one device."""
+
+    base_url: str
+    reachable: bool
+    requires_password: bool = False
+    client_id: str | None = None
+    rtt_ms: float | None = None
+    # Config flow error key when unreachable
+    error: str | None = None
+    status: dict[str, Any] = field(default_factory=dict)
+    probed_at: float = field(default_factory=time.monotonic)
+
+
+async def async_probe_device(session: aiohttp.ClientSession, base_url: str) -> DeviceProbe:
+    """Probe a device with a single unauthenticated status request.
+
+    A 401 means the device is up but needs a password; a 200 carries the
+    client id, so no further request is needed to create the entry.
+    """
+    started = time.monotonic()
+    try:
+        async with session.get(
+            f"{base_url}{STATUS_PATH}",
+            timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT, connect=PROBE_CONNECT_TIMEOUT),
+        ) as response:
+            rtt_ms = round((time.monotonic() - started) * 1000, 1)
+            if response.status == 401:
+                return DeviceProbe(base_url, True, requires_password=True, rtt_ms=rtt_ms)
+            if response.status != 200:
+                _LOGGER.debug(f"Probe of {base_url} returned status {response.status}")
+                return DeviceProbe(base_url, False, rtt_ms=rtt_ms, error="cannot_connect")
+            status = await response.json(content_type=None)
+    except asyncio.TimeoutError:
+        _LOGGER.debug(f"Probe of {base_url} timed out")
+        return DeviceProbe(base_url, False, error="timeout")
+    except (aiohttp.ClientError, ValueError) as ex:
+        _LOGGER.debug(f"Probe of {base_url} failed: {ex}")
+        return DeviceProbe(base_url, False, error="cannot_connect")
+
+    if not isinstance(status, dict):
+        status = {}
+    return DeviceProbe(
+        base_url, True, client_id=status.get("client_id"), rtt_ms=rtt_ms, status=status
+    )
+
+
+class ProbeCache:
+    """Short-lived cache of probe results shared by all config flows.
+
+    Concurrent requests for the same device share one probe, so probing
+    every discovered device in the background and then looking up the one
+    the user picked costs a single request per device.
+    """
+
+    def __init__(self, hass: HomeAssistant, ttl: float = PROBE_TTL) -> None:
+        """Initialize probe cache."""
+        self.hass = hass
+        self.ttl = ttl
+        self._results: dict[str, DeviceProbe] = {}
+        self._pending: dict[str, asyncio.Task] = {}
+
+    def get(self, base_url: str) -> DeviceProbe | None:
+        """Return a cached probe result that is still fresh."""
+        probe = self._results.get(base_url)
+        if probe is None or time.monotonic() - probe.probed_at > self.ttl:
+            return None
+        return probe
+
+    @callback
+    def async_start(self, base_url: str) -> asyncio.Task | None:
+        """Start probing a device in the background unless a result is fresh."""
+        if self.get(base_url) is not None:
+            return None
+        task = self._pending.get(base_url)
+        if task is None:
+            task = self.hass.async_create_task(self._async_run(base_url))
+            self._pending[base_url] = task
+        return task
+
+    async def async_probe(self, base_url: str) -> DeviceProbe:
+        """Return a fresh probe result, probing the device if needed."""
+        if (task := self.async_start(base_url)) is None:
+            return self.get(base_url)
+        # A cancelled flow step must not cancel a probe others may wait on
+        return await asyncio.shield(task)
+
+    async def _async_run(self, base_url: str) -> DeviceProbe:
+        """Probe a device over the shared connection pool and store the result."""
+        try:
+            async with async_get_session_manager(self.hass).async_lease(
+                f"probe:{base_url}", base_url
+            ) as session:
+                probe = await async_probe_device(session, base_url)
+        finally:
+            self._pending.pop(base_url, None)
+        # Failures are not cached so a retry after fixing the PC probes again
+        if probe.reachable:
+            self._results[base_url] = probe
+        # Drop results nobody asked for again
+        now = time.monotonic()
+        for url, cached in list(self._results.items()):
+            if now - cached.probed_at > self.ttl:
+                del self._results[url]
+        return probe
+
+
+def async_get_probe_cache(hass: HomeAssistant) -> ProbeCache:
+    """Return the domain-wide probe cache."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_PROBE_CACHE not in domain_data:
+        domain_data[DATA_PROBE_CACHE] = ProbeCache(hass)
+    return domain_data[DATA_PROBE_CACHE]
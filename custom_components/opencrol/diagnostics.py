@@ -0,0 +1,48 @@
+"""Diagnostics support for OpenCtrol."""
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_PASSWORD
+from .coordinator import OpenCtrolCoordinator
+from .thumbnail_cache import DATA_THUMBNAIL_CACHE
+
+TO_REDACT = {CONF_PASSWORD, "mac_address"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OpenCtrolCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": async_redact_data(entry.as_dict(), TO_REDACT),
+        "transport": coordinator.transport,
+        "api_version": coordinator.api_version,
+        "capabilities": coordinator.capabilities,
+        "platforms": coordinator.platforms,
+        "push_connected": coordinator.push_connected,
+        "last_update_success": coordinator.last_update_success,
+        "section_updated": {
+            section: updated.isoformat()
+            for section, updated in coordinator.section_updated.items()
+        },
+        "section_revisions": coordinator.section_revisions,
+        "restored_sections": sorted(coordinator.restored_sections),
+        "stream_viewers": coordinator.viewers,
+        "input": coordinator.input_coalescer.stats,
+        "input_channel": coordinator.input_channel_stats,
+        "request_policies": coordinator.request_policies,
+        "circuit_breaker": coordinator.circuit_breaker,
+        "connection_pool": coordinator.connection_pool,
+        "screenshots": coordinator.screenshots.stats,
+        "thumbnail_cache": (
+            hass.data[DOMAIN][DATA_THUMBNAIL_CACHE].stats
+            if DATA_THUMBNAIL_CACHE in hass.data[DOMAIN] else None
+        ),
+        "data": coordinator.data,
+    }
@@ -1,122 +1,134 @@
 """Auto-discovery for OpenCtrol devices."""
 
+import asyncio
+from collections.abc import Callable
 import logging
 from typing import Any
-from zeroconf import ServiceBrowser, ServiceListener, Zeroconf
 
-_LOGGER = logging.getLogger(__name__)
-
-
-class OpenCtrolListener(ServiceListener):
-    """Listener for OpenCtrol mDNS services."""
-
-    def __init__(self, callback):
-        """Initialize listener."""
-        self.callback = callback
+from zeroconf import ServiceStateChange, Zeroconf
+from zeroconf.asyncio import AsyncServiceBrowser, AsyncServiceInfo, AsyncZeroconf
 
-    def add_service(self, zeroconf: Zeroconf, service_type: str, name: str) -> None:
-        """Handle service discovered."""
-        info = zeroconf.get_service_info(service_type, name)
-        if info:
-            properties = {}
-            for key, value in info.properties.items():
-                key_str = key.decode() if isinstance(key, bytes) else str(key)
-                value_str = value.decode() if isinstance(value, bytes) else str(value)
-                properties[key_str] = value_str
-
-            host = str(info.parsed_addresses()[0]) if info.parsed_addresses() else None
-            port = info.port
-
-            _LOGGER.info(f"Discovered OpenCtrol device: {name} at {host}:{port}")
-            self.callback({
-                "name": name,
-                "host": host,
-                "port": port,
-                "properties": properties
-            })
-
-    def remove_service(self, zeroconf: Zeroconf, service_type: str, name: str) -> None:
-        """Handle service removed."""
-        _LOGGER.info(f"OpenCtrol device removed: {name}")
+_LOGGER = logging.getLogger(__name__)
 
-    def update_service(self, zeroconf: Zeroconf, service_type: str, name: str) -> None:
-        """Handle service updated."""
-        pass
+SERVICE_TYPE = "_opencrol._tcp.local."
+
+# Discovery gives up after this long if devices keep appearing or none answer
+DISCOVERY_TIMEOUT = 5.0  # seconds
+# Discovery ends once every device is resolved and no new one has appeared
+# for this long
+SETTLE_TIME = 0.75  # seconds
+RESOLVE_TIMEOUT = 3000  # milliseconds
+
+
+def _device_from_info(name: str, info: AsyncServiceInfo) -> dict[str, Any] | None:
+    """Build a device dictionary from resolved service info."""
+    properties = {}
+    for key, value in info.properties.items():
+        key_str = key.decode() if isinstance(key, bytes) else str(key)
+        value_str = value.decode() if isinstance(value, bytes) else str(value)
+        properties[key_str] = value_str
+
+    addresses = info.parsed_addresses()
+    host = str(addresses[0]) if addresses else None
+    port = info.port
+
+    if not host:
+        _LOGGER.warning(f"Discovered device missing host: {name}")
+        return None
+    if not port or port <= 0:
+        _LOGGER.warning(f"Discovered device has invalid port: {name} - {port}")
+        return None
+
+    return {
+        "name": name,
+        "host": host,
+        "port": port,
+        "properties": properties,
+    }
+
+
+async def async_discover_devices(
+    aiozc: AsyncZeroconf | None = None,
+    on_device: Callable[[dict[str, Any]], None] | None = None,
+) -> list[dict[str, Any]]:
+    """Discover OpenCtrol devices on the network.
 
+    Services are resolved concurrently as the browser reports them and each
+    device is handed to ``on_device`` as soon as it is resolved. Discovery
+    returns once the result set is stable: all seen services are resolved
+    and no new one has appeared for ``SETTLE_TIME``. Answers already in the
+    shared zeroconf cache therefore come back almost immediately.
 
-async def discover_opencrol_devices(zeroconf_instance=None) -> list[dict[str, Any]]:
-    """Discover OpenCtrol devices on the network.
-    
     Args:
-        zeroconf_instance: Optional shared Zeroconf instance from Home Assistant.
-                          If None, creates a new instance (not recommended in HA).
-    
+        aiozc: Shared AsyncZeroconf instance from Home Assistant. If None, a
+            new instance is created (not recommended in HA).
+        on_device: Called with each device as it is discovered.
+
     Returns:
         List of discovered device dictionaries with host, port, and properties.
     """
-    devices = []
-    zeroconf = None
-    browser = None
-    
+    loop = asyncio.get_running_loop()
+    devices: dict[str, dict[str, Any]] = {}
+    seen: set[str] = set()
+    resolving: set[asyncio.Task] = set()
+    changed = asyncio.Event()
+    owned = aiozc is None
+    if owned:
+        aiozc = AsyncZeroconf()
+        _LOGGER.warning("Creating new Zeroconf instance - should use shared instance in Home Assistant")
+
+    async def resolve(name: str) -> None:
+        info = AsyncServiceInfo(SERVICE_TYPE, name)
+        if not await info.async_request(aiozc.zeroconf, RESOLVE_TIMEOUT):
+            _LOGGER.debug(f"Could not resolve {name}")
+            return
+        device = _device_from_info(name, info)
+        if device is None:
+            return
+        devices[name] = device
+        _LOGGER.info(f"Discovered OpenCtrol device: {name} at {device['host']}:{device['port']}")
+        if on_device is not None:
+            on_device(device)
+
+    def resolved(task: asyncio.Task) -> None:
+        resolving.discard(task)
+        changed.set()
+
+    def on_service_state_change(
+        zeroconf: Zeroconf, service_type: str, name: str, state_change: ServiceStateChange
+    ) -> None:
+        # Called in the event loop by the async browser
+        if state_change is not ServiceStateChange.Added or name in seen:
+            return
+        seen.add(name)
+        task = loop.create_task(resolve(name))
+        resolving.add(task)
+        task.add_done_callback(resolved)
+        changed.set()
+
+    _LOGGER.info("Searching for OpenCtrol devices on local network...")
+    started = loop.time()
+    browser = AsyncServiceBrowser(aiozc.zeroconf, SERVICE_TYPE, handlers=[on_service_state_change])
     try:
-        # Use shared instance if provided, otherwise create new one
-        if zeroconf_instance is not None:
-            zeroconf = zeroconf_instance
-            _LOGGER.debug("Using shared Zeroconf instance from Home Assistant")
-        else:
-            zeroconf = Zeroconf()
-            _LOGGER.warning("Creating new Zeroconf instance - should use shared instance in Home Assistant")
-
-        def on_device_found(device_info):
-            # Validate device info before adding
-            host = device_info.get('host')
-            port = device_info.get('port')
-            
-            if not host:
-                _LOGGER.warning(f"Discovered device missing host: {device_info.get('name')}")
-                return
-            
-            if not port or port <= 0:
-                _LOGGER.warning(f"Discovered device has invalid port: {device_info.get('name')} - {port}")
-                return
-            
-            devices.append(device_info)
-            _LOGGER.info(f"Discovered OpenCtrol device: {device_info.get('name')} at {host}:{port}")
-
-        listener = OpenCtrolListener(on_device_found)
-        browser = ServiceBrowser(zeroconf, "_opencrol._tcp.local.", listener)
-
-        # Wait longer for discovery (mDNS can be slow, especially on Windows)
-        import asyncio
-        _LOGGER.info("Searching for OpenCtrol devices on local network...")
-        # Try multiple times with shorter intervals to catch services that register late
-        for i in range(3):
-            await asyncio.sleep(3)  # 3 seconds x 3 = 9 seconds total
-            if devices:
-                _LOGGER.info(f"Found {len(devices)} device(s) after {3*(i+1)} seconds")
-                break
-        
-        if not devices:
-            _LOGGER.info("No OpenCtrol devices discovered after 9 seconds")
-        
+        while (remaining := started + DISCOVERY_TIMEOUT - loop.time()) > 0:
+            settled = bool(devices) and not resolving
+            changed.clear()
+            try:
+                async with asyncio.timeout(min(SETTLE_TIME, remaining) if settled else remaining):
+                    await changed.wait()
+            except TimeoutError:
+                if settled:
+                    break
     except Exception as ex:
         _LOGGER.error(f"Error during mDNS discovery: {ex}", exc_info=True)
     finally:
-        # Clean up browser and zeroconf instance
-        if browser:
-            try:
-                browser.cancel()
-            except Exception as ex:
-                _LOGGER.debug(f"Error canceling browser: {ex}")
-        
-        # Only close if we created the instance ourselves
-        if zeroconf_instance is None and zeroconf:
-            try:
-                zeroconf.close()
-            except Exception as ex:
-                _LOGGER.debug(f"Error closing Zeroconf instance: {ex}")
-        
-        _LOGGER.info(f"Discovery complete. Found {len(devices)} device(s)")
-
-    return devices
-
+        await browser.async_cancel()
+        for task in resolving:
+            task.cancel()
+        if owned:
+            await aiozc.async_close()
+
+    _LOGGER.info(
+        f"Discovery complete. Found {len(devices)} device(s) in {loop.time() - started:.1f}s"
+    )
+    return list(devices.values())
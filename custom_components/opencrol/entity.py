@@ -0,0 +1,110 @@
+"""Base entity for OpenCtrol."""
+
+from collections.abc import Callable
+import logging
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import entity_registry as er
+from homeassistant.helpers.entity import Entity
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .const import SECTION_AUDIO_APPS, SECTIONS
+from .coordinator import OpenCtrolCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OpenCtrolEntity(CoordinatorEntity[OpenCtrolCoordinator]):
+    """Coordinator entity that only writes state when its data sections change."""
+
+    # Coordinator data sections this entity reads; override in subclasses
+    _sections: frozenset[str] = frozenset(SECTIONS)
+
+    def __init__(self, coordinator: OpenCtrolCoordinator) -> None:
+        """Initialize the entity."""
+        super().__init__(coordinator)
+        self._last_available: bool | None = None
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state if a section this entity reads changed or availability flipped."""
+        available = self.available
+        if available == self._last_available:
+            if not self.coordinator.changed_sections & self._sections:
+                return
+            if not self._update_from_data():
+                return
+        else:
+            self._update_from_data()
+        self._last_available = available
+        self.async_write_ha_state()
+
+    @callback
+    def _update_from_data(self) -> bool:
+        """Refresh cached attributes from coordinator data.
+
+        Returns True if the entity's state changed. Entities that compute
+        their state on access keep the default and write on every change of
+        their sections.
+        """
+        return True
+
+
+@callback
+def async_track_app_entities(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    coordinator: OpenCtrolCoordinator,
+    platform: str,
+    unique_id_prefix: str,
+    factory: Callable[[str, dict[str, Any]], Entity],
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Keep one entity per audio app in sync with the coordinator's app index.
+
+    Entities are added as apps appear and removed from the entity registry
+    once an app has been gone for longer than the coordinator's expiry time,
+    so the registry does not accumulate entries for short-lived apps.
+    """
+    registry = er.async_get(hass)
+    prefix = f"{entry.entry_id}_{unique_id_prefix}_"
+    known: set[str] = set()
+    last_tracked: set[str] | None = None
+
+    @callback
+    def _async_sync() -> None:
+        nonlocal last_tracked
+        # Until the app list has been fetched or restored an empty index
+        # means "unknown"
+        if (
+            SECTION_AUDIO_APPS not in coordinator.section_updated
+            and SECTION_AUDIO_APPS not in coordinator.restored_sections
+        ):
+            return
+        tracked = coordinator.tracked_app_keys
+        if tracked == last_tracked:
+            return
+        last_tracked = tracked
+
+        added = coordinator.audio_apps.keys() - known
+        if added:
+            known.update(added)
+            async_add_entities(
+                [factory(key, coordinator.audio_apps[key]) for key in sorted(added)]
+            )
+
+        # Also collects entries left behind by earlier runs
+        for reg_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+            if reg_entry.domain != platform or not reg_entry.unique_id.startswith(prefix):
+                continue
+            key = reg_entry.unique_id.removeprefix(prefix)
+            if key not in tracked:
+                _LOGGER.debug(f"Removing {reg_entry.entity_id}, app {key} is gone")
+                known.discard(key)
+                registry.async_remove(reg_entry.entity_id)
+
+    _async_sync()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync))
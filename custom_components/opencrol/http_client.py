@@ -1,113 +1,379 @@
 """HTTP client for OpenCtrol communication."""
 
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import asdict, dataclass, replace
 import logging
 from typing import Any
 import aiohttp
 import asyncio
 
+from .circuit_breaker import CircuitBreaker
+from .connection_manager import OpenCtrolSessionManager
+from .input_channel import OpenCtrolInputChannel
+
 _LOGGER = logging.getLogger(__name__)
 
 # Retry configuration
 MAX_RETRIES = 3
 INITIAL_RETRY_DELAY = 1.0  # seconds
 MAX_RETRY_DELAY = 10.0  # seconds
+# Connect timeout of every attempt. Kept well below the coordinator's 8 s
+# refresh deadline so a host that never answers fails, and is counted by
+# the circuit breaker, before the refresh cancels the request.
+CONNECT_TIMEOUT = 4.0  # seconds
+
+
+
+@dataclass(frozen=True)
+class RequestPolicy:
+    """Retry and deadline policy for a class of commands."""
+
+    name: str
+    max_attempts: int
+    timeout: float  # seconds per attempt
+    deadline: float  # seconds for the whole request including retries
+    retry_after_send: bool = True  # retry failures that may have reached the client
+    latest_wins: bool = False  # a newer request for the same target cancels the old one
+    at_most_once: bool = False  # never send a second copy while one is in flight
+
+
+# Pointer and keyboard input: a late or repeated event is worse than a dropped one
+POLICY_INPUT = RequestPolicy("input", max_attempts=1, timeout=1.5, deadline=1.5, retry_after_send=False)
+# Typed text and secure desktop switches take a while on the PC; never sent
+# twice, since a retry would type the text again
+POLICY_TEXT = RequestPolicy("text", max_attempts=1, timeout=15.0, deadline=15.0, retry_after_send=False)
+# State setters (volume, devices, monitor): only the most recent value matters
+POLICY_STATE = RequestPolicy("state", max_attempts=2, timeout=5.0, deadline=8.0, latest_wins=True)
+# Read-only queries are safe to retry; an attempt times out before the
+# coordinator's 8 s refresh deadline so a hung host is seen as a failure
+POLICY_QUERY = RequestPolicy("query", max_attempts=MAX_RETRIES, timeout=6.0, deadline=30.0)
+# Preview frames: an old thumbnail is better than waiting for a new one
+POLICY_PREVIEW = RequestPolicy("preview", max_attempts=1, timeout=5.0, deadline=5.0, latest_wins=True)
+# Power and one-shot actions must not run twice
+POLICY_ACTION = RequestPolicy(
+    "action", max_attempts=2, timeout=10.0, deadline=15.0, retry_after_send=False, at_most_once=True
+)
+# Command batches run on the PC, delays included, before it answers. Sent
+# once, since any step may already have run; the timeout is the sum of the
+# step delays plus this margin.
+POLICY_BATCH = RequestPolicy(
+    "batch", max_attempts=1, timeout=15.0, deadline=15.0, retry_after_send=False
+)
+
+COMMAND_POLICIES: dict[str, RequestPolicy] = {
+    "get_status": POLICY_QUERY,
+    "get_monitors": POLICY_QUERY,
+    "get_audio_apps": POLICY_QUERY,
+    "get_audio_devices": POLICY_QUERY,
+    "move_mouse": POLICY_INPUT,
+    "click": POLICY_INPUT,
+    "scroll": POLICY_INPUT,
+    "type_text": POLICY_TEXT,
+    "send_key": POLICY_INPUT,
+    "secure_attention": POLICY_INPUT,
+    "send_to_secure_desktop": POLICY_TEXT,
+    "set_volume": POLICY_STATE,
+    "set_app_volume": POLICY_STATE,
+    "set_app_device": POLICY_STATE,
+    "set_default_device": POLICY_STATE,
+    "select_monitor": POLICY_STATE,
+    "start_screen_capture": POLICY_STATE,
+    "stop_screen_capture": POLICY_STATE,
+    "get_frame": POLICY_PREVIEW,
+    "take_screenshot": POLICY_ACTION,
+    "restart": POLICY_ACTION,
+    "lock": POLICY_ACTION,
+    "shutdown_computer": POLICY_ACTION,
+    "restart_computer": POLICY_ACTION,
+    "send_batch": POLICY_BATCH,
+}
+
+
+class SupersededError(aiohttp.ClientError):
+    """Request was cancelled because a newer one for the same target was sent."""
+
+
+class DuplicateRequestError(aiohttp.ClientError):
+    """At-most-once request refused because an identical one is in flight."""
+
+
+class CircuitOpenError(aiohttp.ClientConnectionError):
+    """Request refused because the host's circuit breaker is open."""
+
+
+# Cheap endpoint used to probe a host while its circuit is open
+HEALTH_PATH = "/api/v1/health"
+PROBE_TIMEOUT = 3.0  # seconds
+
+# Push channel configuration
+EVENTS_PATH = "/api/v1/events"
+EVENTS_HEARTBEAT = 30.0  # seconds
+
+# Batch endpoint
+BATCH_PATH = "/api/v1/batch"
+
+# MJPEG screen stream; only stalls count as failures, not its length
+SCREENSTREAM_PATH = "/api/v1/screenstream/stream"
+SCREENSTREAM_FRAME_PATH = "/api/v1/screenstream/frame"
+# Screenshots are written to disk in chunks of this size
+SCREENSHOT_CHUNK_SIZE = 64 * 1024
+SCREENSTREAM_READ_TIMEOUT = 15.0  # seconds
 
 
 class OpenCtrolHttpClient:
     """HTTP client for communicating with OpenCtrol Windows client."""
 
-    def __init__(self, base_url: str, password: str | None = None):
+    def __init__(
+        self,
+        base_url: str,
+        password: str | None = None,
+        session_manager: OpenCtrolSessionManager | None = None,
+        owner: str | None = None,
+    ):
         """Initialize HTTP client."""
         self.base_url = base_url.rstrip("/")
         self.password = password
-        self._session: aiohttp.ClientSession | None = None
+        # Sent per request since the pooled session is shared between PCs
+        self._headers = {"X-Password": password} if password else {}
+        self._session_manager = session_manager or OpenCtrolSessionManager()
+        self._owner = owner or self.base_url
+        self._session_manager.acquire(self._owner, self.base_url)
+        self.input_channel = OpenCtrolInputChannel(
+            self.base_url, self._get_session, self._headers
+        )
+        # None until the batch endpoint has been tried once
+        self.batch_supported: bool | None = None
+        # Latest-wins / at-most-once requests currently in flight, by key
+        self._in_flight: dict[str, asyncio.Task] = {}
+        self.breaker = CircuitBreaker(self.base_url)
+
+    @property
+    def policies(self) -> dict[str, dict[str, Any]]:
+        """Return the request policy applied to each command."""
+        return {command: asdict(policy) for command, policy in COMMAND_POLICIES.items()}
 
     async def _retry_request(
         self,
         method: str,
         url: str,
         retry_on: tuple[type[Exception], ...] = (aiohttp.ClientError, asyncio.TimeoutError),
+        policy: RequestPolicy = POLICY_QUERY,
+        key: str | None = None,
+        **kwargs: Any
+    ) -> aiohttp.ClientResponse:
+        """Execute HTTP request under a request policy.
+
+        The whole request, retries included, must finish within the policy
+        deadline. With ``latest_wins`` a newer request for the same ``key``
+        cancels the one in flight (which raises SupersededError); with
+        ``at_most_once`` a second request for a ``key`` still in flight is
+        refused with DuplicateRequestError instead of being sent again.
+        """
+        await self._async_check_circuit()
+
+        key = key or url
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None and not in_flight.done():
+            if policy.at_most_once:
+                raise DuplicateRequestError(f"{policy.name} request to {url} already in progress")
+            if policy.latest_wins:
+                in_flight.cancel()
+
+        task = asyncio.create_task(self._attempt_request(method, url, retry_on, policy, **kwargs))
+        if policy.latest_wins or policy.at_most_once:
+            self._in_flight[key] = task
+        try:
+            await asyncio.wait({task})
+        except asyncio.CancelledError:
+            task.cancel()
+            raise
+        finally:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+        if task.cancelled():
+            raise SupersededError(f"{policy.name} request to {url} superseded by a newer one")
+        # Failures were recorded by the attempt as soon as they happened
+        if task.exception() is None:
+            self.breaker.record_success()
+        return task.result()
+
+    async def _async_check_circuit(self) -> None:
+        """Fail fast while the circuit is open, probing health when due."""
+        if self.breaker.closed:
+            return
+        if not self.breaker.probe_due:
+            raise CircuitOpenError(f"{self.base_url} is unreachable (circuit {self.breaker.state})")
+
+        # Exactly one caller gets here per open period; the breaker is
+        # half-open until the probe completes, so others keep failing fast
+        self.breaker.begin_probe()
+        try:
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}{HEALTH_PATH}",
+                headers=self._headers,
+                timeout=aiohttp.ClientTimeout(total=PROBE_TIMEOUT),
+            ):
+                pass
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            self.breaker.record_failure(ex)
+            raise CircuitOpenError(f"{self.base_url} is unreachable: {ex}") from ex
+        except BaseException:
+            # Cancelled mid-probe: let the next caller probe again
+            self.breaker.abort_probe()
+            raise
+        self.breaker.record_success()
+
+    async def _attempt_request(
+        self,
+        method: str,
+        url: str,
+        retry_on: tuple[type[Exception], ...],
+        policy: RequestPolicy,
         **kwargs: Any
     ) -> aiohttp.ClientResponse:
-        """Execute HTTP request with exponential backoff retry logic."""
+        """Execute HTTP request with exponential backoff retry logic.
+
+        The first failure to reach the host is recorded on the circuit
+        breaker right away, so it counts even if the caller gives up before
+        the retries are done.
+        """
+        kwargs.setdefault("headers", self._headers)
+        kwargs.setdefault(
+            "timeout",
+            aiohttp.ClientTimeout(total=policy.timeout, connect=min(policy.timeout, CONNECT_TIMEOUT)),
+        )
         last_exception = None
-        
-        for attempt in range(MAX_RETRIES):
-            try:
-                session = await self._get_session()
-                # Don't use context manager - we need to return the response
-                # The caller is responsible for closing it
-                response = await session.request(method, url, **kwargs)
-                
-                # Don't retry on client errors (4xx) except for specific cases
-                if response.status < 500 or attempt == MAX_RETRIES - 1:
-                    return response
-                
-                # Retry on server errors (5xx) - close the response first
-                response.close()
-                raise aiohttp.ClientResponseError(
-                    request_info=response.request_info,
-                    history=response.history,
-                    status=response.status,
-                    message=response.reason
-                )
-            except retry_on as ex:
-                last_exception = ex
-                if attempt < MAX_RETRIES - 1:
-                    # Exponential backoff: delay = initial * (2 ^ attempt), capped at max
-                    delay = min(INITIAL_RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
-                    _LOGGER.warning(
-                        f"Request failed (attempt {attempt + 1}/{MAX_RETRIES}): {ex}. "
-                        f"Retrying in {delay:.1f}s..."
-                    )
-                    await asyncio.sleep(delay)
-                else:
-                    _LOGGER.error(f"Request failed after {MAX_RETRIES} attempts: {ex}")
-                    raise
-        
+        recorded = False
+
+        def record_failure(ex: BaseException) -> None:
+            nonlocal recorded
+            if not recorded:
+                recorded = True
+                self.breaker.record_failure(ex)
+
+        try:
+            async with asyncio.timeout(policy.deadline):
+                for attempt in range(policy.max_attempts):
+                    final = attempt == policy.max_attempts - 1
+                    try:
+                        session = await self._get_session()
+                        # Don't use context manager - we need to return the response
+                        # The caller is responsible for closing it
+                        response = await session.request(method, url, **kwargs)
+
+                        # Don't retry on client errors (4xx), or on server errors
+                        # when the request may already have taken effect
+                        if response.status < 500 or final or not policy.retry_after_send:
+                            return response
+
+                        # Retry on server errors (5xx) - close the response first
+                        response.close()
+                        raise aiohttp.ClientResponseError(
+                            request_info=response.request_info,
+                            history=response.history,
+                            status=response.status,
+                            message=response.reason
+                        )
+                    except retry_on as ex:
+                        last_exception = ex
+                        if isinstance(ex, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+                            record_failure(ex)
+                        # Without retry_after_send only a failed connect is known
+                        # not to have reached the client
+                        retryable = policy.retry_after_send or isinstance(ex, aiohttp.ClientConnectorError)
+                        if not final and retryable:
+                            # Exponential backoff: delay = initial * (2 ^ attempt), capped at max
+                            delay = min(INITIAL_RETRY_DELAY * (2 ** attempt), MAX_RETRY_DELAY)
+                            _LOGGER.warning(
+                                f"Request failed (attempt {attempt + 1}/{policy.max_attempts}): {ex}. "
+                                f"Retrying in {delay:.1f}s..."
+                            )
+                            await asyncio.sleep(delay)
+                        else:
+                            if policy.max_attempts > 1:
+                                _LOGGER.error(f"Request failed after {attempt + 1} attempt(s): {ex}")
+                            raise
+        except asyncio.TimeoutError as ex:
+            if ex is not last_exception:
+                # The deadline expired during an attempt
+                record_failure(ex)
+            raise
+
         # Should never reach here, but just in case
         if last_exception:
             raise last_exception
         raise RuntimeError("Request failed without exception")
 
     async def _get_session(self) -> aiohttp.ClientSession:
-        """Get or create HTTP session."""
-        if self._session is None or self._session.closed:
-            headers = {
-                "User-Agent": "HomeAssistant-OpenCtrol/2.0",
-                "Accept": "application/json"
-            }
-            if self.password:
-                headers["X-Password"] = self.password
-
-            # Performance: Optimize connection pooling
-            connector = aiohttp.TCPConnector(
-                limit=20,  # Increased pool size
-                limit_per_host=10,  # More connections per host
-                ttl_dns_cache=300,  # Cache DNS for 5 minutes
-                enable_cleanup_closed=True  # Clean up closed connections
-            )
-            self._session = aiohttp.ClientSession(
-                headers=headers,
-                timeout=aiohttp.ClientTimeout(total=30, connect=10),
-                connector=connector,
-                read_bufsize=65536  # Larger read buffer for better performance
-            )
-        return self._session
+        """Get the pooled HTTP session of this host."""
+        return await self._session_manager.async_get_session(self.base_url)
 
     async def close(self):
-        """Close HTTP session."""
-        if self._session and not self._session.closed:
-            await self._session.close()
+        """Close the input channel and release this client's share of the pool."""
+        await self.input_channel.close()
+        await self._session_manager.async_release(self._owner)
+
+    async def subscribe_events(self, on_event: Callable[[dict[str, Any]], None]) -> None:
+        """Stream state deltas from the client over a WebSocket.
+
+        Each message is a JSON object of the form
+        ``{"section": "status" | "monitors" | "audio_apps" | "audio_devices", "data": ...}``
+        and is handed to ``on_event``. Returns when the server closes the
+        channel; raises on connection or protocol errors so the caller can
+        reconnect.
+        """
+        session = await self._get_session()
+        async with session.ws_connect(
+            f"{self.base_url}{EVENTS_PATH}",
+            headers=self._headers,
+            heartbeat=EVENTS_HEARTBEAT,
+        ) as ws:
+            _LOGGER.debug(f"Subscribed to OpenCtrol events at {self.base_url}{EVENTS_PATH}")
+            async for msg in ws:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    try:
+                        event = msg.json()
+                    except ValueError as ex:
+                        _LOGGER.debug(f"Ignoring malformed event: {ex}")
+                        continue
+                    if isinstance(event, dict):
+                        on_event(event)
+                elif msg.type == aiohttp.WSMsgType.ERROR:
+                    raise ws.exception() or aiohttp.ClientError("Event channel error")
+
+    async def stream_screen(self, monitor: int = 0) -> AsyncIterator[bytes]:
+        """Yield raw chunks of the MJPEG screen stream of a monitor.
+
+        Returns when the client ends the stream; raises on connection errors
+        so the caller can reconnect.
+        """
+        await self._async_check_circuit()
+        session = await self._get_session()
+        async with session.get(
+            f"{self.base_url}{SCREENSTREAM_PATH}",
+            params={"monitor": monitor},
+            headers=self._headers,
+            timeout=aiohttp.ClientTimeout(total=None, connect=10, sock_read=SCREENSTREAM_READ_TIMEOUT),
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.content.iter_any():
+                yield chunk
 
     async def get_status(self) -> dict[str, Any]:
         """Get client status."""
         response = None
         try:
-            response = await self._retry_request("GET", f"{self.base_url}/api/v1/status")
+            response = await self._retry_request(
+                "GET",
+                f"{self.base_url}/api/v1/status",
+                policy=COMMAND_POLICIES["get_status"]
+            )
             response.raise_for_status()
             data = await response.json()
             return data
+        except CircuitOpenError:
+            raise
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error getting status: {ex}")
             raise
@@ -119,7 +385,11 @@ class OpenCtrolHttpClient:
         """Get available monitors."""
         response = None
         try:
-            response = await self._retry_request("GET", f"{self.base_url}/api/v1/status/monitors")
+            response = await self._retry_request(
+                "GET",
+                f"{self.base_url}/api/v1/status/monitors",
+                policy=COMMAND_POLICIES["get_monitors"]
+            )
             response.raise_for_status()
             data = await response.json()
             # API returns {monitors: [...], current_monitor: 0, total_monitors: 3}
@@ -130,6 +400,8 @@ class OpenCtrolHttpClient:
             if isinstance(data, list):
                 return {"monitors": data, "current_monitor": 0, "total_monitors": len(data)}
             return {"monitors": [], "current_monitor": 0, "total_monitors": 0}
+        except CircuitOpenError:
+            raise
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error getting monitors: {ex}")
             raise
@@ -153,11 +425,14 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/mouse/move",
-                json=payload
+                json=payload,
+                policy=COMMAND_POLICIES["move_mouse"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error moving mouse: {ex}")
             return False
@@ -177,11 +452,14 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/mouse/click",
-                json=payload
+                json=payload,
+                policy=COMMAND_POLICIES["click"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error clicking: {ex}")
             return False
@@ -197,11 +475,14 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/mouse/scroll",
-                json={"delta": delta}
+                json={"delta": delta},
+                policy=COMMAND_POLICIES["scroll"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error scrolling: {ex}")
             return False
@@ -216,11 +497,14 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/keyboard/type",
-                json={"text": text}
+                json={"text": text},
+                policy=COMMAND_POLICIES["type_text"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error typing text: {ex}")
             return False
@@ -240,11 +524,14 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/keyboard/key",
-                json=payload
+                json=payload,
+                policy=COMMAND_POLICIES["send_key"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error sending key: {ex}")
             return False
@@ -258,11 +545,14 @@ class OpenCtrolHttpClient:
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/remotecontrol/keyboard/secure-attention"
+                f"{self.base_url}/api/v1/remotecontrol/keyboard/secure-attention",
+                policy=COMMAND_POLICIES["secure_attention"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error sending secure attention: {ex}")
             return False
@@ -277,11 +567,15 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/audio/volume",
-                json={"volume": volume}
+                json={"volume": volume},
+                policy=COMMAND_POLICIES["set_volume"],
+                key="volume"
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error setting volume: {ex}")
             return False
@@ -301,11 +595,15 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/audio/app-volume",
-                json={"processId": process_id, "volume": volume}  # Use camelCase to match ASP.NET Core JSON naming policy
+                json={"processId": process_id, "volume": volume},  # Use camelCase to match ASP.NET Core JSON naming policy
+                policy=COMMAND_POLICIES["set_app_volume"],
+                key=f"app_volume:{process_id}"
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error setting app volume: {ex}")
             return False
@@ -317,9 +615,15 @@ class OpenCtrolHttpClient:
         """Get audio apps."""
         response = None
         try:
-            response = await self._retry_request("GET", f"{self.base_url}/api/v1/remotecontrol/audio/apps")
+            response = await self._retry_request(
+                "GET",
+                f"{self.base_url}/api/v1/remotecontrol/audio/apps",
+                policy=COMMAND_POLICIES["get_audio_apps"]
+            )
             response.raise_for_status()
             return await response.json()
+        except CircuitOpenError:
+            raise
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error getting audio apps: {ex}")
             raise
@@ -331,9 +635,15 @@ class OpenCtrolHttpClient:
         """Get audio devices."""
         response = None
         try:
-            response = await self._retry_request("GET", f"{self.base_url}/api/v1/remotecontrol/audio/devices")
+            response = await self._retry_request(
+                "GET",
+                f"{self.base_url}/api/v1/remotecontrol/audio/devices",
+                policy=COMMAND_POLICIES["get_audio_devices"]
+            )
             response.raise_for_status()
             return await response.json()
+        except CircuitOpenError:
+            raise
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error getting audio devices: {ex}")
             raise
@@ -352,11 +662,15 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/audio/default-device",
-                json={"deviceId": device_id}  # Use camelCase to match ASP.NET Core JSON naming policy
+                json={"deviceId": device_id},  # Use camelCase to match ASP.NET Core JSON naming policy
+                policy=COMMAND_POLICIES["set_default_device"],
+                key="default_device"
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error setting default audio device: {ex}")
             return False
@@ -370,11 +684,15 @@ class OpenCtrolHttpClient:
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/screen/monitor/{monitor_index}"
+                f"{self.base_url}/api/v1/screen/monitor/{monitor_index}",
+                policy=COMMAND_POLICIES["select_monitor"],
+                key="monitor"
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error selecting monitor: {ex}")
             return False
@@ -386,10 +704,17 @@ class OpenCtrolHttpClient:
         """Start screen capture."""
         response = None
         try:
-            response = await self._retry_request("POST", f"{self.base_url}/api/v1/screen/start")
+            response = await self._retry_request(
+                "POST",
+                f"{self.base_url}/api/v1/screen/start",
+                policy=COMMAND_POLICIES["start_screen_capture"],
+                key="screen_capture"
+            )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error starting screen capture: {ex}")
             return False
@@ -401,10 +726,17 @@ class OpenCtrolHttpClient:
         """Stop screen capture."""
         response = None
         try:
-            response = await self._retry_request("POST", f"{self.base_url}/api/v1/screen/stop")
+            response = await self._retry_request(
+                "POST",
+                f"{self.base_url}/api/v1/screen/stop",
+                policy=COMMAND_POLICIES["stop_screen_capture"],
+                key="screen_capture"
+            )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error stopping screen capture: {ex}")
             return False
@@ -419,11 +751,14 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/keyboard/secure-desktop/send-text",
-                json={"text": text}
+                json={"text": text},
+                policy=COMMAND_POLICIES["send_to_secure_desktop"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error sending text to secure desktop: {ex}")
             return False
@@ -431,18 +766,63 @@ class OpenCtrolHttpClient:
             if response:
                 response.close()
 
-    async def take_screenshot(self) -> dict[str, Any] | None:
-        """Take a screenshot."""
+    async def get_frame(self, monitor: int = 0) -> bytes | None:
+        """Get the current screen frame of a monitor as JPEG."""
+        response = None
+        try:
+            response = await self._retry_request(
+                "GET",
+                f"{self.base_url}{SCREENSTREAM_FRAME_PATH}",
+                policy=COMMAND_POLICIES["get_frame"],
+                params={"monitor": monitor},
+            )
+            response.raise_for_status()
+            return await response.read()
+        except (SupersededError, CircuitOpenError):
+            return None
+        except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
+            _LOGGER.debug(f"Error getting screen frame: {ex}")
+            return None
+        finally:
+            if response:
+                response.close()
+
+    async def download_screenshot(
+        self, write: Callable[[bytes], Awaitable[None]], monitor: int = 0
+    ) -> str | None:
+        """Take a screenshot and pass its image to ``write`` chunk by chunk.
+
+        Clients that only acknowledge the capture in JSON are served the
+        current frame of the monitor instead. Returns the image content type,
+        or None if nothing was written.
+        """
         response = None
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/screenstream/screenshot"
+                f"{self.base_url}/api/v1/screenstream/screenshot",
+                policy=COMMAND_POLICIES["take_screenshot"],
+                params={"monitor": monitor},
+                headers={**self._headers, "Accept": "image/png, image/jpeg;q=0.9"},
             )
             response.raise_for_status()
-            return await response.json()
+            if not response.content_type.startswith("image/"):
+                response.close()
+                response = await self._retry_request(
+                    "GET",
+                    f"{self.base_url}{SCREENSTREAM_FRAME_PATH}",
+                    policy=COMMAND_POLICIES["take_screenshot"],
+                    params={"monitor": monitor},
+                    key="screenshot_frame",
+                )
+                response.raise_for_status()
+            async for chunk in response.content.iter_chunked(SCREENSHOT_CHUNK_SIZE):
+                await write(chunk)
+            return response.content_type
+        except (CircuitOpenError, DuplicateRequestError):
+            return None
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
-            _LOGGER.error(f"Error taking screenshot: {ex}")
+            _LOGGER.error(f"Error downloading screenshot: {ex}")
             return None
         finally:
             if response:
@@ -454,11 +834,14 @@ class OpenCtrolHttpClient:
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/system/restart"
+                f"{self.base_url}/api/v1/system/restart",
+                policy=COMMAND_POLICIES["restart"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error restarting client: {ex}")
             return False
@@ -472,11 +855,14 @@ class OpenCtrolHttpClient:
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/system/lock"
+                f"{self.base_url}/api/v1/system/lock",
+                policy=COMMAND_POLICIES["lock"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error locking workstation: {ex}")
             return False
@@ -490,11 +876,14 @@ class OpenCtrolHttpClient:
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/system/shutdown"
+                f"{self.base_url}/api/v1/system/shutdown",
+                policy=COMMAND_POLICIES["shutdown_computer"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error shutting down computer: {ex}")
             return False
@@ -508,11 +897,14 @@ class OpenCtrolHttpClient:
         try:
             response = await self._retry_request(
                 "POST",
-                f"{self.base_url}/api/v1/system/restart-computer"
+                f"{self.base_url}/api/v1/system/restart-computer",
+                policy=COMMAND_POLICIES["restart_computer"]
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except CircuitOpenError:
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error restarting computer: {ex}")
             return False
@@ -531,11 +923,15 @@ class OpenCtrolHttpClient:
             response = await self._retry_request(
                 "POST",
                 f"{self.base_url}/api/v1/remotecontrol/audio/app-device",
-                json={"processId": process_id, "deviceId": device_id}  # Use camelCase to match ASP.NET Core JSON naming policy
+                json={"processId": process_id, "deviceId": device_id},  # Use camelCase to match ASP.NET Core JSON naming policy
+                policy=COMMAND_POLICIES["set_app_device"],
+                key=f"app_device:{process_id}"
             )
             response.raise_for_status()
             data = await response.json()
             return data.get("success", False)
+        except (SupersededError, CircuitOpenError):
+            return False
         except (aiohttp.ClientError, asyncio.TimeoutError) as ex:
             _LOGGER.error(f"Error setting app device: {ex}")
             return False
@@ -543,3 +939,45 @@ class OpenCtrolHttpClient:
             if response:
                 response.close()
 
+
+    async def send_batch(
+        self, steps: list[dict[str, Any]], stop_on_error: bool = False
+    ) -> list[dict[str, Any]] | None:
+        """Execute a list of commands in one request.
+
+        Each step is ``{"command": str, "params": dict, "delay_ms": int}``.
+        Returns the per-step results reported by the client, or None if the
+        client has no batch endpoint (the caller should then run the steps
+        one by one).
+        """
+        if self.batch_supported is False:
+            return None
+
+        timeout = POLICY_BATCH.timeout + sum(step.get("delay_ms", 0) for step in steps) / 1000
+        response = None
+        try:
+            response = await self._retry_request(
+                "POST",
+                f"{self.base_url}{BATCH_PATH}",
+                json={"commands": steps, "stop_on_error": stop_on_error},
+                policy=replace(POLICY_BATCH, timeout=timeout, deadline=timeout),
+            )
+            if response.status in (404, 405):
+                _LOGGER.debug("OpenCtrol client has no batch endpoint, running steps individually")
+                self.batch_supported = False
+                return None
+            response.raise_for_status()
+            data = await response.json()
+            self.batch_supported = True
+            results = data.get("results") if isinstance(data, dict) else None
+            return results if isinstance(results, list) else []
+        except asyncio.TimeoutError as ex:
+            # The PC may still be working through the steps
+            _LOGGER.warning(f"Command batch not answered within {timeout:.0f}s: {ex}")
+            return [{"unknown": True} for _ in steps]
+        except aiohttp.ClientError as ex:
+            _LOGGER.error(f"Error sending command batch: {ex}")
+            raise
+        finally:
+            if response:
+                response.close()
@@ -0,0 +1,90 @@
+"""Image platform for OpenCtrol screenshots."""
+
+from pathlib import Path
+from typing import Any
+
+from homeassistant.components.image import ImageEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+from .const import DOMAIN, ATTR_CLIENT_ID, SECTION_STATUS
+from .coordinator import OpenCtrolCoordinator
+from .entity import OpenCtrolEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up OpenCtrol screenshot image."""
+    coordinator: OpenCtrolCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.screenshots.async_load()
+    async_add_entities([OpenCtrolScreenshotImage(coordinator, entry)])
+
+
+class OpenCtrolScreenshotImage(OpenCtrolEntity, ImageEntity):
+    """Latest screenshot taken of an OpenCtrol PC."""
+
+    # Screenshots stay viewable while the PC is offline
+    _sections = frozenset({SECTION_STATUS})
+
+    def __init__(self, coordinator: OpenCtrolCoordinator, entry: ConfigEntry) -> None:
+        """Initialize the screenshot image."""
+        super().__init__(coordinator)
+        ImageEntity.__init__(self, coordinator.hass)
+        self.entry = entry
+        self._attr_unique_id = f"{entry.entry_id}_screenshot_image"
+        self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} Screenshot"
+        # Bytes of the latest screenshot, read from disk on first request
+        self._image: tuple[Path, bytes] | None = None
+        self._update_from_screenshot()
+
+    @property
+    def available(self) -> bool:
+        """Return if a screenshot has been taken."""
+        return self.coordinator.screenshots.latest is not None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return where the latest screenshot is stored."""
+        latest = self.coordinator.screenshots.latest
+        if latest is None:
+            return {}
+        return {"path": str(latest.path), "size": latest.size}
+
+    async def async_added_to_hass(self) -> None:
+        """Follow new screenshots."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self.coordinator.screenshots.async_add_listener(self._handle_screenshot)
+        )
+
+    @callback
+    def _handle_screenshot(self) -> None:
+        """Show a newly saved screenshot."""
+        self._update_from_screenshot()
+        self.async_write_ha_state()
+
+    @callback
+    def _update_from_screenshot(self) -> None:
+        """Point the entity at the latest screenshot."""
+        latest = self.coordinator.screenshots.latest
+        if latest is None:
+            return
+        self._attr_content_type = latest.content_type
+        self._attr_image_last_updated = latest.captured_at
+
+    async def async_image(self) -> bytes | None:
+        """Return the bytes of the latest screenshot."""
+        latest = self.coordinator.screenshots.latest
+        if latest is None:
+            return None
+        if self._image is None or self._image[0] != latest.path:
+            try:
+                data = await self.hass.async_add_executor_job(latest.path.read_bytes)
+            except OSError:
+                return None
+            self._image = (latest.path, data)
+        return self._image[1]
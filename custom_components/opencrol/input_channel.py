@@ -0,0 +1,194 @@
+"""Persistent low-latency input channel for OpenCtrol."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import json
+import logging
+import time
+from typing import Any
+
+import aiohttp
+
+_LOGGER = logging.getLogger(__name__)
+
+INPUT_PATH = "/api/v1/input/ws"
+INPUT_HEARTBEAT = 15.0  # seconds
+CONNECT_TIMEOUT = 3.0  # seconds
+# Wait before reconnecting after a failure; input falls back to HTTP meanwhile
+RECONNECT_DELAY = 5.0  # seconds
+# Wait before probing again when the client does not offer the channel
+UNSUPPORTED_RETRY_DELAY = 600.0  # seconds
+# Frames awaiting acknowledgement before the oldest is written off
+MAX_UNACKED = 256
+
+# Compact frame encoders: command -> (opcode, argument mapping)
+FRAME_CODES: dict[str, tuple[str, dict[str, str]]] = {
+    "move_mouse": ("m", {"x": "x", "y": "y", "relative": "r"}),
+    "click": ("c", {"button": "b", "x": "x", "y": "y"}),
+    "scroll": ("s", {"delta": "d"}),
+    "type_text": ("t", {"text": "t"}),
+    "send_key": ("k", {"key": "k", "keys": "ks"}),
+}
+
+
+class OpenCtrolInputChannel:
+    """Long-lived WebSocket carrying input events to the OpenCtrol client.
+
+    Every event is written as one compact JSON frame tagged with a sequence
+    number. Frames are not awaited; the client acknowledges them
+    asynchronously with ``{"a": seq, "ok": bool}`` and failures are counted.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        get_session: Callable[[], Awaitable[aiohttp.ClientSession]],
+        headers: dict[str, str] | None = None,
+    ) -> None:
+        """Initialize input channel."""
+        self.base_url = base_url
+        self._get_session = get_session
+        self._headers = headers or {}
+        self._ws: aiohttp.ClientWebSocketResponse | None = None
+        self._reader: asyncio.Task | None = None
+        self._connect_lock = asyncio.Lock()
+        self._retry_at = 0.0
+        self._seq = 0
+        self._unacked: dict[int, float] = {}
+
+        # Statistics
+        self.supported: bool | None = None
+        self.frames_sent = 0
+        self.frames_acked = 0
+        self.frames_failed = 0
+        self.last_ack_latency_ms: float | None = None
+
+    @property
+    def connected(self) -> bool:
+        """Return True if the channel is open."""
+        return self._ws is not None and not self._ws.closed
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return channel statistics."""
+        return {
+            "supported": self.supported,
+            "connected": self.connected,
+            "frames_sent": self.frames_sent,
+            "frames_acked": self.frames_acked,
+            "frames_failed": self.frames_failed,
+            "unacked": len(self._unacked),
+            "last_ack_latency_ms": self.last_ack_latency_ms,
+        }
+
+    async def async_send(self, command: str, **kwargs: Any) -> bool:
+        """Write one input event as a frame.
+
+        Returns False if the command has no frame encoding or the channel is
+        unavailable, in which case the caller should fall back to HTTP.
+        """
+        if command not in FRAME_CODES or not await self._async_ensure_connected():
+            return False
+
+        opcode, fields = FRAME_CODES[command]
+        self._seq += 1
+        frame: dict[str, Any] = {"i": self._seq, "c": opcode}
+        for name, short in fields.items():
+            value = kwargs.get(name)
+            if value is None or value is False:
+                continue
+            frame[short] = 1 if value is True else value
+
+        try:
+            await self._ws.send_str(json.dumps(frame, separators=(",", ":")))
+        except (aiohttp.ClientError, ConnectionError, RuntimeError) as ex:
+            _LOGGER.debug(f"Input channel write failed: {ex}")
+            await self._async_drop(RECONNECT_DELAY)
+            return False
+
+        self.frames_sent += 1
+        self._unacked[self._seq] = time.monotonic()
+        if len(self._unacked) > MAX_UNACKED:
+            self._unacked.pop(next(iter(self._unacked)))
+            self.frames_failed += 1
+        return True
+
+    async def _async_ensure_connected(self) -> bool:
+        """Open the channel if it is down and a retry is due."""
+        if self.connected:
+            return True
+        if time.monotonic() < self._retry_at:
+            return False
+
+        async with self._connect_lock:
+            if self.connected:
+                return True
+            try:
+                session = await self._get_session()
+                async with asyncio.timeout(CONNECT_TIMEOUT):
+                    self._ws = await session.ws_connect(
+                        f"{self.base_url}{INPUT_PATH}",
+                        headers=self._headers,
+                        heartbeat=INPUT_HEARTBEAT,
+                    )
+            except aiohttp.WSServerHandshakeError as ex:
+                if ex.status == 404:
+                    _LOGGER.debug("OpenCtrol client does not offer an input channel, using HTTP")
+                    self.supported = False
+                    self._retry_at = time.monotonic() + UNSUPPORTED_RETRY_DELAY
+                else:
+                    self._retry_at = time.monotonic() + RECONNECT_DELAY
+                return False
+            except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as ex:
+                _LOGGER.debug(f"Input channel connect failed: {ex}")
+                self._retry_at = time.monotonic() + RECONNECT_DELAY
+                return False
+
+            self.supported = True
+            self._unacked.clear()
+            self._reader = asyncio.create_task(self._async_read(self._ws))
+            _LOGGER.debug(f"Input channel connected to {self.base_url}{INPUT_PATH}")
+            return True
+
+    async def _async_read(self, ws: aiohttp.ClientWebSocketResponse) -> None:
+        """Consume acknowledgements until the channel closes."""
+        try:
+            async for msg in ws:
+                if msg.type != aiohttp.WSMsgType.TEXT:
+                    if msg.type == aiohttp.WSMsgType.ERROR:
+                        break
+                    continue
+                try:
+                    ack = json.loads(msg.data)
+                except ValueError:
+                    continue
+                sent_at = self._unacked.pop(ack.get("a"), None) if isinstance(ack, dict) else None
+                if sent_at is None:
+                    continue
+                self.last_ack_latency_ms = round((time.monotonic() - sent_at) * 1000, 1)
+                if ack.get("ok", True):
+                    self.frames_acked += 1
+                else:
+                    self.frames_failed += 1
+                    _LOGGER.debug(f"Input frame {ack.get('a')} rejected: {ack.get('error')}")
+        finally:
+            if self._ws is ws:
+                self._ws = None
+                self._retry_at = time.monotonic() + RECONNECT_DELAY
+            # Frames still unacknowledged when the channel drops are lost
+            self.frames_failed += len(self._unacked)
+            self._unacked.clear()
+
+    async def _async_drop(self, retry_delay: float) -> None:
+        """Close the channel and hold off reconnecting."""
+        self._retry_at = time.monotonic() + retry_delay
+        ws, self._ws = self._ws, None
+        if ws is not None and not ws.closed:
+            await ws.close()
+
+    async def close(self) -> None:
+        """Close the channel."""
+        await self._async_drop(0.0)
+        if self._reader is not None:
+            self._reader.cancel()
+            self._reader = None
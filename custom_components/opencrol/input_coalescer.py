@@ -0,0 +1,168 @@
+"""Input event coalescing for OpenCtrol."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DEFAULT_INPUT_FLUSH_INTERVAL
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class InputCoalescer:
+    """Merge bursts of pointer input into at most one command per flush.
+
+    Pending input is kept in arrival order and only consecutive events of
+    the same kind are merged: relative mouse deltas are summed, an absolute
+    target replaces the movement right before it and scroll deltas are
+    added up. A click without coordinates absorbs an absolute move queued
+    right before it; everything else pending is flushed first, in order.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        send: Callable[..., Awaitable[bool]],
+        flush_interval_ms: int = DEFAULT_INPUT_FLUSH_INTERVAL,
+    ) -> None:
+        """Initialize coalescer."""
+        self.hass = hass
+        self._send = send
+        self.flush_interval = flush_interval_ms / 1000
+        self._lock = asyncio.Lock()
+        self._flush_handle: asyncio.TimerHandle | None = None
+        self._flush_task: asyncio.Task | None = None
+
+        # Pending input in arrival order: [kind, *values] with kind one of
+        # "move_abs" (x, y), "move_rel" (dx, dy) or "scroll" (delta)
+        self._pending: list[list[Any]] = []
+        self._pending_events = 0
+
+        # Statistics
+        self.events_received = 0
+        self.commands_sent = 0
+        self.events_merged = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return coalescing statistics."""
+        return {
+            "flush_interval_ms": round(self.flush_interval * 1000),
+            "events_received": self.events_received,
+            "commands_sent": self.commands_sent,
+            "events_merged": self.events_merged,
+            "pending_events": self._pending_events,
+        }
+
+    @callback
+    def queue_move(self, x: int, y: int, relative: bool = False) -> None:
+        """Queue a mouse move."""
+        last = self._pending[-1] if self._pending else None
+        if relative:
+            if last is not None and last[0] in ("move_abs", "move_rel"):
+                last[1] += x
+                last[2] += y
+            else:
+                self._pending.append(["move_rel", x, y])
+        elif last is not None and last[0] in ("move_abs", "move_rel"):
+            # An absolute target supersedes the movement right before it
+            self._pending[-1] = ["move_abs", x, y]
+        else:
+            self._pending.append(["move_abs", x, y])
+        self._queued()
+
+    @callback
+    def queue_scroll(self, delta: int) -> None:
+        """Queue a scroll delta."""
+        if self._pending and self._pending[-1][0] == "scroll":
+            self._pending[-1][1] += delta
+        else:
+            self._pending.append(["scroll", delta])
+        self._queued()
+
+    async def async_click(
+        self, button: str = "left", x: int | None = None, y: int | None = None
+    ) -> bool:
+        """Send a click after pending input, folding a final absolute move into it."""
+        if x is None and y is None and self._pending and self._pending[-1][0] == "move_abs":
+            _, x, y = self._pending.pop()
+            self.events_merged += 1
+            self._pending_events -= 1
+        await self.async_flush()
+        async with self._lock:
+            self.commands_sent += 1
+            return await self._send("click", button=button, x=x, y=y)
+
+    @callback
+    def _queued(self) -> None:
+        """Account for a queued event and make sure a flush is scheduled."""
+        self.events_received += 1
+        self._pending_events += 1
+        if self._flush_handle is None and self._flush_task is None:
+            self._flush_handle = self.hass.loop.call_later(
+                self.flush_interval, self._start_flush
+            )
+
+    @callback
+    def _start_flush(self) -> None:
+        """Start a scheduled flush."""
+        self._flush_handle = None
+        self._flush_task = self.hass.async_create_background_task(
+            self._async_scheduled_flush(), "opencrol_input_flush"
+        )
+
+    async def _async_scheduled_flush(self) -> None:
+        """Flush pending input, rescheduling if more arrived meanwhile."""
+        try:
+            await self.async_flush()
+        finally:
+            self._flush_task = None
+            if self._pending_events:
+                self._flush_handle = self.hass.loop.call_later(
+                    self.flush_interval, self._start_flush
+                )
+
+    async def async_flush(self) -> None:
+        """Send all pending input now."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        async with self._lock:
+            segments, pending = self._pending, self._pending_events
+            self._pending = []
+            self._pending_events = 0
+            if not pending:
+                return
+
+            sent = 0
+            for kind, *values in segments:
+                if kind == "move_abs":
+                    await self._send("move_mouse", x=values[0], y=values[1], relative=False)
+                elif kind == "move_rel" and values != [0, 0]:
+                    await self._send("move_mouse", x=values[0], y=values[1], relative=True)
+                elif kind == "scroll" and values[0]:
+                    await self._send("scroll", delta=values[0])
+                else:
+                    continue
+                sent += 1
+
+            self.commands_sent += sent
+            self.events_merged += pending - sent
+            if pending > sent:
+                _LOGGER.debug(f"Coalesced {pending} input events into {sent} command(s)")
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop pending input and cancel any scheduled flush."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        if self._flush_task is not None:
+            self._flush_task.cancel()
+            self._flush_task = None
+        self._pending = []
+        self._pending_events = 0
@@ -1,5 +1,7 @@
 """Media Player platform for OpenCtrol screen viewing."""
 
+from datetime import datetime
+import time
 from typing import Any
 
 from homeassistant.components.media_player import (
@@ -8,12 +10,23 @@ from homeassistant.components.media_player import (
     MediaPlayerEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
-
-from .const import DOMAIN, ATTR_CLIENT_ID
+from homeassistant.helpers.event import async_call_later
+
+from .const import (
+    DOMAIN,
+    ATTR_CLIENT_ID,
+    CAPABILITY_AUDIO,
+    CONF_THUMBNAIL_TTL,
+    DEFAULT_THUMBNAIL_TTL,
+)
 from .coordinator import OpenCtrolCoordinator
+from .entity import OpenCtrolEntity
+from .thumbnail_cache import Thumbnail, async_get_thumbnail_cache
+
+# The preview is refreshed only while it has been requested this recently
+THUMBNAIL_IDLE_TIMEOUT = 120  # seconds
 
 
 async def async_setup_entry(
@@ -27,11 +40,14 @@ async def async_setup_entry(
 
 
 class OpenCtrolScreenViewer(
-    CoordinatorEntity, MediaPlayerEntity
+    OpenCtrolEntity, MediaPlayerEntity
 ):
     """Representation of OpenCtrol screen viewer."""
 
     _attr_should_poll = False
+    # Monitor and audio lists are served by the opencrol/data WebSocket
+    # command; the revision only tells the card when to fetch them again
+    _unrecorded_attributes = frozenset({"data_revision"})
 
     def __init__(self, coordinator: OpenCtrolCoordinator, entry: ConfigEntry) -> None:
         """Initialize the screen viewer."""
@@ -42,15 +58,34 @@ class OpenCtrolScreenViewer(
         self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} Screen"
         self._attr_state = MediaPlayerState.IDLE
         self._attr_supported_features = (
-            MediaPlayerEntityFeature.VOLUME_SET
-            | MediaPlayerEntityFeature.TURN_ON
-            | MediaPlayerEntityFeature.TURN_OFF
+            MediaPlayerEntityFeature.TURN_ON | MediaPlayerEntityFeature.TURN_OFF
         )
+        if coordinator.supports(CAPABILITY_AUDIO):
+            self._attr_supported_features |= MediaPlayerEntityFeature.VOLUME_SET
+        self._thumbnails = async_get_thumbnail_cache(coordinator.hass)
+        # ETag of the preview viewers were last told about
+        self._thumbnail_etag: str | None = None
+        self._thumbnail_requested = 0.0
+        self._thumbnail_refresh_unsub: CALLBACK_TYPE | None = None
+
+    async def async_added_to_hass(self) -> None:
+        """Serve this entity's thumbnail once it has an entity id."""
+        await super().async_added_to_hass()
+        self._thumbnails.sources[self.entity_id] = self
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop serving and refreshing the thumbnail."""
+        self._thumbnails.sources.pop(self.entity_id, None)
+        self._thumbnails.async_remove(self.entry.entry_id)
+        if self._thumbnail_refresh_unsub is not None:
+            self._thumbnail_refresh_unsub()
+            self._thumbnail_refresh_unsub = None
+        await super().async_will_remove_from_hass()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success and self.coordinator.data.get("status") == "online"
+        return self.coordinator.last_update_success and (self.coordinator.data or {}).get("status") == "online"
 
     @property
     def state(self) -> str:
@@ -58,7 +93,7 @@ class OpenCtrolScreenViewer(
         if not self.coordinator.last_update_success:
             return MediaPlayerState.OFF
 
-        data = self.coordinator.data
+        data = self.coordinator.data or {}
         status = data.get("status", "offline")
         
         if status == "offline":
@@ -76,7 +111,7 @@ class OpenCtrolScreenViewer(
         host = self.entry.data.get("host", "localhost")
         port = self.entry.data.get("port", 8080)
         base_url = f"http://{host}:{port}"
-        data = self.coordinator.data
+        data = self.coordinator.data or {}
         
         attrs = {
             "client_id": self.entry.data.get(ATTR_CLIENT_ID),
@@ -84,13 +119,13 @@ class OpenCtrolScreenViewer(
             "stream_url": f"{base_url}/api/v1/screenstream/stream",
             "frame_url": f"{base_url}/api/v1/screenstream/frame",
             "status": data.get("status", "offline"),
-            "monitors": data.get("monitors", []),
             "current_monitor": data.get("current_monitor", 0),
             "total_monitors": data.get("total_monitors", 0),
             "master_volume": data.get("master_volume", 0.0),
             "screen_capture_active": data.get("screen_capture_active", False),
-            "audio_apps": data.get("audio_apps", []),
-            "audio_devices": data.get("audio_devices", []),
+            "audio_app_count": len(data.get("audio_apps", [])),
+            "audio_device_count": len(data.get("audio_devices", [])),
+            "data_revision": self.coordinator.revision,
             "default_output_device": next(
                 (d.get("id") for d in data.get("audio_devices", []) if d.get("is_default")),
                 None
@@ -102,6 +137,80 @@ class OpenCtrolScreenViewer(
             attrs["mac_address"] = mac_address
         return attrs
 
+    @property
+    def media_image_hash(self) -> str | None:
+        """Return a hash that changes whenever viewers should reload the preview."""
+        if not (self.coordinator.data or {}).get("screen_capture_active", False):
+            return None
+        return self._thumbnail_etag or "pending"
+
+    @property
+    def entity_picture(self) -> str | None:
+        """Return the preview URL, served with ETag validation."""
+        if self.state == MediaPlayerState.OFF or (image_hash := self.media_image_hash) is None:
+            return None
+        return f"/api/opencrol/thumbnail/{self.entity_id}?token={self.access_token}&cache={image_hash}"
+
+    async def async_get_media_image(self) -> tuple[bytes | None, str | None]:
+        """Return the cached screen thumbnail."""
+        thumbnail = await self.async_get_thumbnail()
+        if thumbnail is None:
+            return None, None
+        return thumbnail.data, "image/jpeg"
+
+    async def async_get_thumbnail(self) -> Thumbnail | None:
+        """Return the screen thumbnail, fetching at most once per TTL."""
+        self._thumbnail_requested = time.monotonic()
+        thumbnail = await self._async_fetch_thumbnail()
+        if self._thumbnail_refresh_unsub is None:
+            self._async_schedule_thumbnail_refresh()
+        return thumbnail
+
+    async def _async_fetch_thumbnail(self) -> Thumbnail | None:
+        """Get the thumbnail from the cache, announcing a changed one."""
+        ttl = self.entry.options.get(CONF_THUMBNAIL_TTL, DEFAULT_THUMBNAIL_TTL)
+        thumbnail = await self._thumbnails.async_get(
+            self.entry.entry_id, self.coordinator.async_get_frame, ttl
+        )
+        if (
+            thumbnail is not None
+            and thumbnail.etag != self._thumbnail_etag
+            # Not removed while fetching
+            and self._thumbnails.sources.get(self.entity_id) is self
+        ):
+            self._async_announce_thumbnail(thumbnail.etag)
+        return thumbnail
+
+    @callback
+    def _async_announce_thumbnail(self, etag: str) -> None:
+        """Write state so viewers pick up the changed preview URL."""
+        self._thumbnail_etag = etag
+        self.async_write_ha_state()
+
+    @callback
+    def _async_schedule_thumbnail_refresh(self) -> None:
+        """Refresh the thumbnail once its TTL has passed."""
+        ttl = self.entry.options.get(CONF_THUMBNAIL_TTL, DEFAULT_THUMBNAIL_TTL)
+        self._thumbnail_refresh_unsub = async_call_later(
+            self.hass, ttl, self._async_refresh_thumbnail
+        )
+
+    async def _async_refresh_thumbnail(self, _now: datetime) -> None:
+        """Keep the preview fresh while dashboards are showing it."""
+        self._thumbnail_refresh_unsub = None
+        if (
+            time.monotonic() - self._thumbnail_requested > THUMBNAIL_IDLE_TIMEOUT
+            or self.entity_picture is None
+        ):
+            return
+        # State is only written when the screen changed; viewers revalidate
+        # an unchanged preview through its ETag
+        await self._async_fetch_thumbnail()
+        if self._thumbnails.sources.get(self.entity_id) is not self:
+            # Removed while fetching
+            return
+        self._async_schedule_thumbnail_refresh()
+
     async def async_turn_on(self) -> None:
         """Turn on the screen capture."""
         await self.coordinator.send_command("start_screen_capture")
@@ -0,0 +1,131 @@
+"""MQTT transport for OpenCtrol."""
+
+from collections.abc import Callable
+import json
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    TOPIC_COMMAND,
+    TOPIC_STATUS,
+    TOPIC_SCREEN,
+    TOPIC_AUDIO,
+    TOPIC_DEVICES,
+    TOPIC_APPS,
+    SECTION_STATUS,
+    SECTION_MONITORS,
+    SECTION_AUDIO_APPS,
+    SECTION_AUDIO_DEVICES,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# Pseudo-section of the audio topic. It only carries master volume state,
+# which the coordinator merges into the status section; it never stands in
+# for a status message.
+SECTION_AUDIO = "audio"
+# Data keys the audio topic may update
+AUDIO_KEYS = ("master_volume",)
+
+# Retained state topics and the coordinator section each one feeds
+STATE_TOPICS = {
+    TOPIC_STATUS: SECTION_STATUS,
+    TOPIC_AUDIO: SECTION_AUDIO,
+    TOPIC_SCREEN: SECTION_MONITORS,
+    TOPIC_APPS: SECTION_AUDIO_APPS,
+    TOPIC_DEVICES: SECTION_AUDIO_DEVICES,
+}
+
+# Input events are fire-and-forget; everything else is delivered at least once
+INPUT_COMMANDS = {"move_mouse", "click", "scroll"}
+
+
+class OpenCtrolMqttTransport:
+    """Send commands and receive state for one OpenCtrol client over MQTT."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client_id: str,
+        on_event: Callable[[dict[str, Any]], None],
+    ) -> None:
+        """Initialize MQTT transport."""
+        self.hass = hass
+        self.client_id = client_id
+        self._on_event = on_event
+        self._unsubscribers: list[Callable[[], None]] = []
+
+    @property
+    def subscribed(self) -> bool:
+        """Return True once the state topics are subscribed."""
+        return bool(self._unsubscribers)
+
+    async def async_subscribe(self) -> None:
+        """Subscribe to the retained state topics of this client."""
+        if self.subscribed:
+            return
+
+        # MQTT is an optional dependency; only import it when selected
+        from homeassistant.components import mqtt
+
+        if not await mqtt.async_wait_for_mqtt_client(self.hass):
+            raise ConnectionError("MQTT integration is not set up")
+
+        # Only a complete set of subscriptions counts as subscribed, so a
+        # failed attempt is rolled back and retried in full
+        unsubscribers: list[Callable[[], None]] = []
+        try:
+            for template, section in STATE_TOPICS.items():
+                topic = template.format(client_id=self.client_id)
+                unsubscribers.append(
+                    await mqtt.async_subscribe(
+                        self.hass, topic, self._make_handler(topic, section)
+                    )
+                )
+        except BaseException:
+            for unsubscribe in unsubscribers:
+                unsubscribe()
+            raise
+        self._unsubscribers = unsubscribers
+        _LOGGER.debug(f"Subscribed to OpenCtrol MQTT topics for {self.client_id}")
+
+    def _make_handler(self, topic: str, section: str) -> Callable[[Any], None]:
+        """Build a message handler that forwards a topic's payload as a section event."""
+
+        @callback
+        def _handle_message(msg: Any) -> None:
+            try:
+                payload = json.loads(msg.payload)
+            except (TypeError, ValueError) as ex:
+                _LOGGER.debug(f"Ignoring malformed payload on {topic}: {ex}")
+                return
+            self._on_event({"section": section, "data": payload})
+
+        return _handle_message
+
+    async def async_send_command(self, command: str, **kwargs: Any) -> bool:
+        """Publish a command on the client's command topic."""
+        from homeassistant.components import mqtt
+
+        payload = {"command": command}
+        payload.update({key: value for key, value in kwargs.items() if value is not None})
+        try:
+            await mqtt.async_publish(
+                self.hass,
+                TOPIC_COMMAND.format(client_id=self.client_id),
+                json.dumps(payload),
+                qos=0 if command in INPUT_COMMANDS else 1,
+                retain=False,
+            )
+        except Exception as ex:
+            _LOGGER.error(f"Error publishing command {command}: {ex}")
+            return False
+        return True
+
+    @callback
+    def async_unsubscribe(self) -> None:
+        """Unsubscribe from all state topics."""
+        while self._unsubscribers:
+            self._unsubscribers.pop()()
@@ -5,11 +5,12 @@ from typing import Any
 
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ATTR_CLIENT_ID, ATTR_VOLUME
+from .const import DOMAIN, ATTR_CLIENT_ID, ATTR_VOLUME, SECTION_STATUS, SECTION_AUDIO_APPS
 from .coordinator import OpenCtrolCoordinator
+from .entity import OpenCtrolEntity, async_track_app_entities
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -24,73 +25,82 @@ async def async_setup_entry(
     
     entities = [OpenCtrolMasterVolume(coordinator, entry)]
     
-    # Add app volume controls
-    for app in coordinator.data.get("audio_apps", []):
-        entities.append(OpenCtrolAppVolume(coordinator, entry, app))
-    
     async_add_entities(entities)
 
+    # Per-app entities follow apps as they start and exit
+    async_track_app_entities(
+        hass,
+        entry,
+        coordinator,
+        "number",
+        "app_volume",
+        lambda key, app: OpenCtrolAppVolume(coordinator, entry, key, app),
+        async_add_entities,
+    )
+
 
-class OpenCtrolMasterVolume(NumberEntity):
+class OpenCtrolMasterVolume(OpenCtrolEntity, NumberEntity):
     """Representation of master volume control."""
 
-    _attr_should_poll = True
+    _sections = frozenset({SECTION_STATUS})
 
     def __init__(self, coordinator: OpenCtrolCoordinator, entry: ConfigEntry) -> None:
         """Initialize master volume."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry = entry
         self._attr_unique_id = f"{entry.entry_id}_master_volume"
         self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} Master Volume"
-        self._attr_min_value = 0.0
-        self._attr_max_value = 1.0
-        self._attr_step = 0.01
+        self._attr_native_min_value = 0.0
+        self._attr_native_max_value = 1.0
+        self._attr_native_step = 0.01
         self._attr_mode = "slider"
-        self._attr_native_value = 0.5
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        self._update_from_data()
 
     async def async_set_native_value(self, value: float) -> None:
         """Set master volume."""
         await self.coordinator.send_command("set_volume", volume=value)
 
-    async def async_update(self) -> None:
+    @callback
+    def _update_from_data(self) -> bool:
         """Update volume from coordinator."""
-        audio_data = self.coordinator.data.get("audio", {})
-        self._attr_native_value = audio_data.get("master_volume", 0.5)
+        value = (self.coordinator.data or {}).get("master_volume", 0.5)
+        if value == self._attr_native_value:
+            return False
+        self._attr_native_value = value
+        return True
 
 
-class OpenCtrolAppVolume(NumberEntity):
+class OpenCtrolAppVolume(OpenCtrolEntity, NumberEntity):
     """Representation of app-specific volume control."""
 
-    _attr_should_poll = True
+    _sections = frozenset({SECTION_AUDIO_APPS})
 
     def __init__(
         self, 
         coordinator: OpenCtrolCoordinator, 
         entry: ConfigEntry,
+        app_key: str,
         app: dict[str, Any]
     ) -> None:
         """Initialize app volume."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry = entry
         self.app = app
-        # Use process_id for unique ID, fallback to id
-        app_id = app.get("process_id") or app.get("id")
-        self._attr_unique_id = f"{entry.entry_id}_app_volume_{app_id}"
+        # Keyed by executable and session; process ids change on restart
+        self._app_key = app_key
+        self._attr_unique_id = f"{entry.entry_id}_app_volume_{app_key}"
         self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} {app.get('name')} Volume"
-        self._attr_min_value = 0.0
-        self._attr_max_value = 1.0
-        self._attr_step = 0.01
+        self._attr_native_min_value = 0.0
+        self._attr_native_max_value = 1.0
+        self._attr_native_step = 0.01
         self._attr_mode = "slider"
+        self._app_present = False
+        self._update_from_data()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return super().available and self._app_present
 
     async def async_set_native_value(self, value: float) -> None:
         """Set app volume."""
@@ -105,7 +115,17 @@ class OpenCtrolAppVolume(NumberEntity):
             volume=value
         )
 
-    async def async_update(self) -> None:
+    @callback
+    def _update_from_data(self) -> bool:
         """Update app volume from coordinator."""
-        self._attr_native_value = self.app.get(ATTR_VOLUME, 0.5)
-
+        app = self.coordinator.audio_apps.get(self._app_key)
+        changed = (app is not None) != self._app_present
+        self._app_present = app is not None
+        if app is None:
+            return changed
+        self.app = app
+        value = app.get(ATTR_VOLUME, 0.5)
+        if value == self._attr_native_value:
+            return changed
+        self._attr_native_value = value
+        return True
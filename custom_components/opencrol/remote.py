@@ -5,10 +5,10 @@ from homeassistant.components.remote import RemoteEntity, RemoteEntityFeature
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import DOMAIN
 from .coordinator import OpenCtrolCoordinator
+from .entity import OpenCtrolEntity
 
 
 async def async_setup_entry(
@@ -21,12 +21,14 @@ async def async_setup_entry(
     async_add_entities([OpenCtrolRemote(coordinator, entry)])
 
 
-class OpenCtrolRemote(CoordinatorEntity, RemoteEntity):
+class OpenCtrolRemote(OpenCtrolEntity, RemoteEntity):
     """Representation of OpenCtrol remote control."""
 
     _attr_supported_features = (
         RemoteEntityFeature.ACTIVITY
     )
+    # Bulky lists are served by the opencrol/data WebSocket command
+    _unrecorded_attributes = frozenset({"data_revision"})
 
     def __init__(self, coordinator: OpenCtrolCoordinator, entry: ConfigEntry) -> None:
         """Initialize the remote."""
@@ -53,11 +55,11 @@ class OpenCtrolRemote(CoordinatorEntity, RemoteEntity):
         return {
             "client_id": self.entry.data.get("client_id"),
             "base_url": base_url,
-            "monitors": self.coordinator.data.get("monitors", []),
             "current_monitor": self.coordinator.data.get("current_monitor", 0),
             "total_monitors": self.coordinator.data.get("total_monitors", 0),
-            "audio_apps": self.coordinator.data.get("audio_apps", []),
-            "audio_devices": self.coordinator.data.get("audio_devices", []),
+            "audio_app_count": len(self.coordinator.data.get("audio_apps", [])),
+            "audio_device_count": len(self.coordinator.data.get("audio_devices", [])),
+            "data_revision": self.coordinator.revision,
             "capabilities": self.coordinator.data.get("capabilities", {}),
             "master_volume": self.coordinator.data.get("master_volume", 0.0),
         }
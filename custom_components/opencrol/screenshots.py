@@ -0,0 +1,184 @@
+"""Screenshot capture and retention for OpenCtrol."""
+
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+import logging
+from pathlib import Path
+from typing import Any
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.util import dt as dt_util, slugify
+
+from .const import DEFAULT_SCREENSHOT_MAX_COUNT, DEFAULT_SCREENSHOT_MAX_SIZE
+from .http_client import OpenCtrolHttpClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Subdirectory of the local media directory screenshots are saved to
+SCREENSHOT_DIR = "opencrol"
+SCREENSHOT_PREFIX = "screenshot_"
+CONTENT_TYPE_EXTENSIONS = {
+    "image/png": ".png",
+    "image/jpeg": ".jpg",
+    "image/bmp": ".bmp",
+    "image/webp": ".webp",
+}
+EXTENSION_CONTENT_TYPES = {ext: content_type for content_type, ext in CONTENT_TYPE_EXTENSIONS.items()}
+
+
+@dataclass
+class Screenshot:
+    """A screenshot saved to the media directory."""
+
+    path: Path
+    content_type: str
+    size: int
+    captured_at: datetime
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the screenshot as a service response."""
+        return {
+            "path": str(self.path),
+            "content_type": self.content_type,
+            "size": self.size,
+            "captured_at": self.captured_at.isoformat(),
+        }
+
+
+def _scan(directory: Path) -> list[Screenshot]:
+    """Return saved screenshots, oldest first; runs in the executor."""
+    if not directory.is_dir():
+        return []
+    screenshots = []
+    for path in directory.iterdir():
+        content_type = EXTENSION_CONTENT_TYPES.get(path.suffix)
+        if not path.name.startswith(SCREENSHOT_PREFIX) or content_type is None:
+            continue
+        stat = path.stat()
+        screenshots.append(
+            Screenshot(path, content_type, stat.st_size, dt_util.utc_from_timestamp(stat.st_mtime))
+        )
+    screenshots.sort(key=lambda screenshot: screenshot.captured_at)
+    return screenshots
+
+
+def _delete(paths: list[Path]) -> None:
+    """Delete screenshot files; runs in the executor."""
+    for path in paths:
+        path.unlink(missing_ok=True)
+
+
+class ScreenshotStore:
+    """Download screenshots of one PC to disk and prune old ones.
+
+    The image is written chunk by chunk as it arrives, so capturing from
+    several PCs at once never holds a whole screenshot in memory. After
+    each capture the oldest files are removed until both the count and the
+    total size are within their limits.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: OpenCtrolHttpClient,
+        client_id: str,
+        max_count: int = DEFAULT_SCREENSHOT_MAX_COUNT,
+        max_size_mb: int = DEFAULT_SCREENSHOT_MAX_SIZE,
+    ) -> None:
+        """Initialize screenshot store."""
+        self.hass = hass
+        self._client = client
+        media_dir = hass.config.media_dirs.get("local") or hass.config.path("media")
+        self.directory = Path(media_dir) / SCREENSHOT_DIR / slugify(client_id)
+        self.max_count = max_count
+        self.max_size_mb = max_size_mb
+        self._screenshots: list[Screenshot] | None = None
+        self._listeners: list[CALLBACK_TYPE] = []
+
+    @property
+    def latest(self) -> Screenshot | None:
+        """Return the most recent screenshot."""
+        return self._screenshots[-1] if self._screenshots else None
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return retention state for diagnostics."""
+        screenshots = self._screenshots or []
+        return {
+            "directory": str(self.directory),
+            "count": len(screenshots),
+            "bytes": sum(screenshot.size for screenshot in screenshots),
+            "max_count": self.max_count,
+            "max_size_mb": self.max_size_mb,
+        }
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Call ``update_callback`` whenever a screenshot is saved."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    async def async_load(self) -> None:
+        """Pick up screenshots saved before a restart."""
+        if self._screenshots is None:
+            self._screenshots = await self.hass.async_add_executor_job(_scan, self.directory)
+
+    async def async_capture(self, monitor: int = 0) -> Screenshot | None:
+        """Take a screenshot and save it to the media directory."""
+        await self.async_load()
+        captured_at = dt_util.utcnow()
+        stem = f"{SCREENSHOT_PREFIX}{dt_util.as_local(captured_at).strftime('%Y%m%d_%H%M%S_%f')}"
+        partial = self.directory / f"{stem}.part"
+        await self.hass.async_add_executor_job(
+            lambda: self.directory.mkdir(parents=True, exist_ok=True)
+        )
+
+        file = await self.hass.async_add_executor_job(partial.open, "wb")
+        size = 0
+
+        async def write_chunk(chunk: bytes) -> None:
+            nonlocal size
+            await self.hass.async_add_executor_job(file.write, chunk)
+            size += len(chunk)
+
+        content_type = None
+        try:
+            content_type = await self._client.download_screenshot(write_chunk, monitor)
+        finally:
+            await self.hass.async_add_executor_job(file.close)
+            if content_type is None or size == 0:
+                await self.hass.async_add_executor_job(_delete, [partial])
+        if content_type is None or size == 0:
+            return None
+
+        path = partial.with_suffix(CONTENT_TYPE_EXTENSIONS.get(content_type, ".png"))
+        await self.hass.async_add_executor_job(partial.rename, path)
+        screenshot = Screenshot(path, content_type, size, captured_at)
+        self._screenshots.append(screenshot)
+        _LOGGER.debug(f"Saved screenshot {path} ({size} bytes)")
+
+        await self._async_apply_retention()
+        for update_callback in list(self._listeners):
+            update_callback()
+        return screenshot
+
+    async def _async_apply_retention(self) -> None:
+        """Delete the oldest screenshots beyond the count and size limits."""
+        screenshots = self._screenshots
+        max_bytes = self.max_size_mb * 1024 * 1024
+        total = sum(screenshot.size for screenshot in screenshots)
+        expired: list[Path] = []
+        # The newest screenshot is always kept
+        while len(screenshots) > 1 and (len(screenshots) > self.max_count or total > max_bytes):
+            oldest = screenshots.pop(0)
+            total -= oldest.size
+            expired.append(oldest.path)
+        if expired:
+            await self.hass.async_add_executor_job(_delete, expired)
+            _LOGGER.debug(f"Removed {len(expired)} old screenshot(s) from {self.directory}")
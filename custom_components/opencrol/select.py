@@ -1,14 +1,18 @@
 """Select platform for OpenCtrol device selection."""
 
+import logging
 from typing import Any
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
-from .const import DOMAIN, ATTR_CLIENT_ID, ATTR_DEVICE_ID
+from .const import DOMAIN, ATTR_CLIENT_ID, ATTR_DEVICE_ID, SECTION_AUDIO_APPS, SECTION_AUDIO_DEVICES
 from .coordinator import OpenCtrolCoordinator
+from .entity import OpenCtrolEntity, async_track_app_entities
+
+_LOGGER = logging.getLogger(__name__)
 
 
 async def async_setup_entry(
@@ -21,73 +25,84 @@ async def async_setup_entry(
     
     entities = [OpenCtrolOutputDevice(coordinator, entry)]
     
-    # Add app device selectors
-    for app in coordinator.data.get("audio_apps", []):
-        entities.append(OpenCtrolAppDevice(coordinator, entry, app))
-    
     async_add_entities(entities)
 
+    # Per-app entities follow apps as they start and exit
+    async_track_app_entities(
+        hass,
+        entry,
+        coordinator,
+        "select",
+        "app_device",
+        lambda key, app: OpenCtrolAppDevice(coordinator, entry, key, app),
+        async_add_entities,
+    )
+
 
-class OpenCtrolOutputDevice(SelectEntity):
+class OpenCtrolOutputDevice(OpenCtrolEntity, SelectEntity):
     """Representation of system output device selection."""
 
-    _attr_should_poll = True
+    _sections = frozenset({SECTION_AUDIO_DEVICES})
 
     def __init__(self, coordinator: OpenCtrolCoordinator, entry: ConfigEntry) -> None:
         """Initialize output device selector."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry = entry
         self._attr_unique_id = f"{entry.entry_id}_output_device"
         self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} Output Device"
         self._attr_current_option = None
         self._attr_options = []
-
-    @property
-    def available(self) -> bool:
-        """Return if entity is available."""
-        return self.coordinator.last_update_success
+        self._update_from_data()
 
     async def async_select_option(self, option: str) -> None:
         """Set output device."""
         await self.coordinator.send_command("set_default_device", device_id=option)
 
-    async def async_update(self) -> None:
+    @callback
+    def _update_from_data(self) -> bool:
         """Update device list and current selection."""
-        devices = self.coordinator.data.get("audio_devices", [])
-        self._attr_options = [d.get("id") for d in devices]
-        
-        # Find default device
+        devices = (self.coordinator.data or {}).get("audio_devices", [])
+        options = [d.get("id") for d in devices]
+
+        # Find default device; keep the last known one if none is flagged
         default_device = next((d for d in devices if d.get("is_default")), None)
-        if default_device:
-            self._attr_current_option = default_device.get("id")
+        current = default_device.get("id") if default_device else self._attr_current_option
+        if options == self._attr_options and current == self._attr_current_option:
+            return False
+        self._attr_options = options
+        self._attr_current_option = current
+        return True
 
 
-class OpenCtrolAppDevice(SelectEntity):
+class OpenCtrolAppDevice(OpenCtrolEntity, SelectEntity):
     """Representation of app-specific device selection."""
 
-    _attr_should_poll = True
+    _sections = frozenset({SECTION_AUDIO_APPS, SECTION_AUDIO_DEVICES})
 
     def __init__(
         self, 
         coordinator: OpenCtrolCoordinator, 
         entry: ConfigEntry,
+        app_key: str,
         app: dict[str, Any]
     ) -> None:
         """Initialize app device selector."""
-        self.coordinator = coordinator
+        super().__init__(coordinator)
         self.entry = entry
         self.app = app
-        # Use process_id for unique ID, fallback to id
-        app_id = app.get("process_id") or app.get("id")
-        self._attr_unique_id = f"{entry.entry_id}_app_device_{app_id}"
+        # Keyed by executable and session; process ids change on restart
+        self._app_key = app_key
+        self._attr_unique_id = f"{entry.entry_id}_app_device_{app_key}"
         self._attr_name = f"{entry.data.get(ATTR_CLIENT_ID)} {app.get('name')} Device"
         self._attr_current_option = None
         self._attr_options = []
+        self._app_present = False
+        self._update_from_data()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self.coordinator.last_update_success
+        return super().available and self._app_present
 
     async def async_select_option(self, option: str) -> None:
         """Set app output device."""
@@ -98,9 +113,20 @@ class OpenCtrolAppDevice(SelectEntity):
             return
         await self.coordinator.send_command("set_app_device", process_id=process_id, device_id=option)
 
-    async def async_update(self) -> None:
+    @callback
+    def _update_from_data(self) -> bool:
         """Update device list and current selection."""
-        devices = self.coordinator.data.get("audio_devices", [])
-        self._attr_options = [d.get("id") for d in devices]
-        self._attr_current_option = self.app.get(ATTR_DEVICE_ID)
-
+        data = self.coordinator.data or {}
+        app = self.coordinator.audio_apps.get(self._app_key)
+        changed = (app is not None) != self._app_present
+        self._app_present = app is not None
+        if app is not None:
+            self.app = app
+
+        options = [d.get("id") for d in data.get("audio_devices", [])]
+        current = self.app.get(ATTR_DEVICE_ID)
+        if options == self._attr_options and current == self._attr_current_option:
+            return changed
+        self._attr_options = options
+        self._attr_current_option = current
+        return True
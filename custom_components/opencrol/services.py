@@ -1,13 +1,14 @@
 """Services for OpenCtrol integration."""
 
 import logging
+import time
 from typing import Any
 
-from homeassistant.core import HomeAssistant, ServiceCall, callback
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse, callback
 from homeassistant.helpers import config_validation as cv
 import voluptuous as vol
 
-from .const import DOMAIN, SERVICE_LOCK
+from .const import DOMAIN, SERVICE_LOCK, SERVICE_TAKE_SCREENSHOT
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -28,11 +29,13 @@ SERVICE_SEND_TO_SECURE_DESKTOP = "send_to_secure_desktop"
 SERVICE_SHUTDOWN_COMPUTER = "shutdown_computer"
 SERVICE_RESTART_COMPUTER = "restart_computer"
 SERVICE_WAKE_ON_LAN = "wake_on_lan"
+SERVICE_SEND_COMMANDS = "send_commands"
 
 SERVICE_SCHEMA_MOVE_MOUSE = vol.Schema({
     vol.Required("entity_id"): cv.entity_id,
     vol.Required("x"): vol.Coerce(int),
     vol.Required("y"): vol.Coerce(int),
+    vol.Optional("relative", default=False): cv.boolean,
 })
 
 SERVICE_SCHEMA_CLICK = vol.Schema({
@@ -100,6 +103,16 @@ SERVICE_SCHEMA_LOCK = vol.Schema({
     vol.Required("entity_id"): cv.entity_id,
 })
 
+SERVICE_SCHEMA_TAKE_SCREENSHOT = vol.Schema({
+    vol.Required("entity_id"): cv.entity_id,
+})
+
+SERVICE_SCHEMA_SET_APP_DEVICE = vol.Schema({
+    vol.Required("entity_id"): cv.entity_id,
+    vol.Required("process_id"): vol.Coerce(int),
+    vol.Required("device_id"): cv.string,
+})
+
 SERVICE_SCHEMA_SHUTDOWN_COMPUTER = vol.Schema({
     vol.Required("entity_id"): cv.entity_id,
 })
@@ -115,6 +128,62 @@ SERVICE_SCHEMA_WAKE_ON_LAN = vol.Schema({
     vol.Optional("broadcast_port"): cv.port,
 })
 
+def _step_schema(command: str, schema: vol.Schema) -> vol.Schema:
+    """Return the schema of a send_commands step running ``command``.
+
+    Steps take the same parameters as the command's own service, minus the
+    entity, so they are validated and coerced the same way.
+    """
+    fields = {key: value for key, value in schema.schema.items() if str(key) != "entity_id"}
+    return vol.Schema({
+        vol.Required("command"): command,
+        vol.Optional("delay", default=0): vol.All(vol.Coerce(float), vol.Range(min=0, max=60)),
+        **fields,
+    })
+
+
+# Commands accepted as steps of send_commands, with their step schema
+BATCH_STEP_SCHEMAS = {
+    command: _step_schema(command, schema)
+    for command, schema in (
+        ("move_mouse", SERVICE_SCHEMA_MOVE_MOUSE),
+        ("click", SERVICE_SCHEMA_CLICK),
+        ("scroll", SERVICE_SCHEMA_SCROLL),
+        ("type_text", SERVICE_SCHEMA_TYPE_TEXT),
+        ("send_key", SERVICE_SCHEMA_SEND_KEY),
+        ("secure_attention", SERVICE_SCHEMA_SECURE_ATTENTION),
+        ("set_volume", SERVICE_SCHEMA_SET_VOLUME),
+        ("set_app_volume", SERVICE_SCHEMA_SET_APP_VOLUME),
+        ("set_app_device", SERVICE_SCHEMA_SET_APP_DEVICE),
+        ("set_default_device", SERVICE_SCHEMA_SET_DEFAULT_DEVICE),
+        ("select_monitor", SERVICE_SCHEMA_SELECT_MONITOR),
+        ("start_screen_capture", SERVICE_SCHEMA_START_SCREEN_CAPTURE),
+        ("stop_screen_capture", SERVICE_SCHEMA_STOP_SCREEN_CAPTURE),
+        ("send_to_secure_desktop", SERVICE_SCHEMA_SEND_TO_SECURE_DESKTOP),
+        ("take_screenshot", SERVICE_SCHEMA_TAKE_SCREENSHOT),
+        ("lock", SERVICE_SCHEMA_LOCK),
+        ("shutdown_computer", SERVICE_SCHEMA_SHUTDOWN_COMPUTER),
+        ("restart_computer", SERVICE_SCHEMA_RESTART_COMPUTER),
+    )
+}
+
+
+def _validate_step(step: Any) -> dict[str, Any]:
+    """Validate a send_commands step against its command's schema."""
+    if not isinstance(step, dict):
+        raise vol.Invalid("each step must be a dictionary")
+    schema = BATCH_STEP_SCHEMAS.get(step.get("command"))
+    if schema is None:
+        raise vol.Invalid(f"unknown command: {step.get('command')}")
+    return schema(step)
+
+
+SERVICE_SCHEMA_SEND_COMMANDS = vol.Schema({
+    vol.Required("entity_id"): cv.entity_id,
+    vol.Required("commands"): vol.All(cv.ensure_list, vol.Length(min=1), [_validate_step]),
+    vol.Optional("stop_on_error", default=False): cv.boolean,
+})
+
 
 @callback
 def async_setup_services(hass: HomeAssistant) -> None:
@@ -129,10 +198,11 @@ def async_setup_services(hass: HomeAssistant) -> None:
         entity_id = call.data["entity_id"]
         x = call.data["x"]
         y = call.data["y"]
+        relative = call.data.get("relative", False)
 
         coordinator = _get_coordinator(hass, entity_id)
         if coordinator:
-            await coordinator.send_command("move_mouse", x=x, y=y)
+            await coordinator.send_command("move_mouse", x=x, y=y, relative=relative)
 
     async def handle_click(call: ServiceCall) -> None:
         """Handle click service call."""
@@ -316,6 +386,35 @@ def async_setup_services(hass: HomeAssistant) -> None:
             except Exception as ex2:
                 _LOGGER.error(f"Error with alternative WOL method: {ex2}")
 
+    async def handle_take_screenshot(call: ServiceCall) -> ServiceResponse:
+        """Handle take_screenshot service call."""
+        entity_id = call.data["entity_id"]
+
+        coordinator = _get_coordinator(hass, entity_id)
+        if not coordinator:
+            return {"success": False}
+        screenshot = await coordinator.async_take_screenshot()
+        if screenshot is None:
+            return {"success": False}
+        return {"success": True, **screenshot.as_dict()}
+
+    async def handle_send_commands(call: ServiceCall) -> ServiceResponse:
+        """Handle send_commands service call."""
+        entity_id = call.data["entity_id"]
+        steps = call.data["commands"]
+
+        coordinator = _get_coordinator(hass, entity_id)
+        if not coordinator:
+            return {"steps": [], "total_ms": 0}
+        started = time.monotonic()
+        results = await coordinator.async_send_commands(
+            steps, stop_on_error=call.data.get("stop_on_error", False)
+        )
+        return {
+            "steps": results,
+            "total_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+
     hass.services.async_register(
         DOMAIN, SERVICE_MOVE_MOUSE, handle_move_mouse, schema=SERVICE_SCHEMA_MOVE_MOUSE
     )
@@ -367,6 +466,20 @@ def async_setup_services(hass: HomeAssistant) -> None:
     hass.services.async_register(
         DOMAIN, SERVICE_WAKE_ON_LAN, handle_wake_on_lan, schema=SERVICE_SCHEMA_WAKE_ON_LAN
     )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_TAKE_SCREENSHOT,
+        handle_take_screenshot,
+        schema=SERVICE_SCHEMA_TAKE_SCREENSHOT,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SEND_COMMANDS,
+        handle_send_commands,
+        schema=SERVICE_SCHEMA_SEND_COMMANDS,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
 
 
 def _get_coordinator(hass: HomeAssistant, entity_id: str):
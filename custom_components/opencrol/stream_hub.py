@@ -0,0 +1,191 @@
+"""Fan-out of the PC screen stream to Home Assistant viewers."""
+
+import asyncio
+from contextlib import aclosing
+import logging
+from typing import Any
+
+import aiohttp
+
+from homeassistant.core import CALLBACK_TYPE, callback
+
+from .const import DOMAIN
+from .coordinator import OpenCtrolCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+JPEG_SOI = b"\xff\xd8"
+JPEG_EOI = b"\xff\xd9"
+# Unparsed bytes kept while looking for the end of a frame
+MAX_FRAME_SIZE = 8 * 1024 * 1024
+
+# Frames buffered per viewer; a viewer that falls behind skips to the newest
+VIEWER_QUEUE_SIZE = 2
+# Empty frame handed to viewers when the hub shuts down
+END_OF_STREAM = b""
+
+STREAM_INITIAL_RETRY_DELAY = 1.0  # seconds
+STREAM_MAX_RETRY_DELAY = 30.0  # seconds
+
+
+class JpegFrameParser:
+    """Split an MJPEG byte stream into JPEG frames without decoding them.
+
+    Frames are delimited by their SOI/EOI markers, so the multipart framing
+    of the upstream response does not matter.
+    """
+
+    def __init__(self) -> None:
+        """Initialize parser."""
+        self._buffer = bytearray()
+        # Where to resume searching for EOI, so each byte is scanned once
+        self._scan_from = 0
+
+    def feed(self, chunk: bytes) -> list[bytes]:
+        """Add a chunk and return the frames it completed."""
+        buffer = self._buffer
+        buffer += chunk
+        frames = []
+        while True:
+            start = buffer.find(JPEG_SOI)
+            if start < 0:
+                # A trailing 0xFF may be the first half of the next SOI
+                del buffer[: max(len(buffer) - 1, 0)]
+                self._scan_from = 0
+                break
+            if start:
+                del buffer[:start]
+                self._scan_from = max(self._scan_from - start, 0)
+            end = buffer.find(JPEG_EOI, max(self._scan_from, 2))
+            if end < 0:
+                if len(buffer) > MAX_FRAME_SIZE:
+                    raise ValueError(f"No JPEG frame boundary within {MAX_FRAME_SIZE} bytes")
+                self._scan_from = max(len(buffer) - 1, 2)
+                break
+            frames.append(bytes(buffer[: end + 2]))
+            del buffer[: end + 2]
+            self._scan_from = 0
+        return frames
+
+
+class ScreenStreamHub:
+    """Share one upstream screen stream between any number of viewers.
+
+    The upstream connection is opened with the first viewer and closed with
+    the last one. Each viewer gets a small queue; when it is full the oldest
+    frame is dropped, so a slow viewer sees the latest frame rather than
+    falling further behind or slowing down the others. Capture on the PC is
+    started with the first viewer and left to the coordinator's viewer
+    tracking to stop after its grace period.
+    """
+
+    def __init__(self, coordinator: OpenCtrolCoordinator) -> None:
+        """Initialize stream hub."""
+        self._coordinator = coordinator
+        self._viewers: set[asyncio.Queue[bytes]] = set()
+        self._task: asyncio.Task | None = None
+        self._release_viewer: CALLBACK_TYPE | None = None
+        self.last_frame: bytes | None = None
+        self._frames = 0
+        self._dropped = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return stream statistics for diagnostics."""
+        return {
+            "viewers": len(self._viewers),
+            "streaming": self._task is not None,
+            "frames": self._frames,
+            "dropped_frames": self._dropped,
+        }
+
+    @callback
+    def async_add_viewer(self) -> asyncio.Queue[bytes]:
+        """Register a viewer and return the queue its frames arrive on."""
+        queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=VIEWER_QUEUE_SIZE)
+        self._viewers.add(queue)
+        if self._task is None:
+            self._start()
+        elif self.last_frame is not None:
+            queue.put_nowait(self.last_frame)
+        return queue
+
+    @callback
+    def async_remove_viewer(self, queue: asyncio.Queue[bytes]) -> None:
+        """Unregister a viewer, closing the upstream stream after the last."""
+        self._viewers.discard(queue)
+        if not self._viewers:
+            self._stop()
+
+    @callback
+    def async_shutdown(self) -> None:
+        """Stop streaming and end every viewer's stream."""
+        for queue in self._viewers:
+            self._put_latest(queue, END_OF_STREAM)
+        self._viewers.clear()
+        self._stop()
+
+    def _start(self) -> None:
+        """Open the upstream stream and count as a viewer of the PC screen."""
+        coordinator = self._coordinator
+        self._release_viewer = coordinator.async_add_viewer()
+        self._task = coordinator.entry.async_create_background_task(
+            coordinator.hass, self._async_run(), f"{DOMAIN}_{coordinator.client_id}_screen_stream"
+        )
+
+    def _stop(self) -> None:
+        """Close the upstream stream."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        if self._release_viewer is not None:
+            self._release_viewer()
+            self._release_viewer = None
+        self.last_frame = None
+
+    async def _async_run(self) -> None:
+        """Relay upstream frames to viewers, reconnecting with backoff."""
+        coordinator = self._coordinator
+        # Only the first viewer starts capture; if it is stopped from
+        # elsewhere while streaming, reconnects must not turn it back on
+        start_capture = True
+        delay = STREAM_INITIAL_RETRY_DELAY
+        while True:
+            data = coordinator.data or {}
+            if start_capture and not data.get("screen_capture_active"):
+                await coordinator.send_command("start_screen_capture")
+            start_capture = False
+            monitor = data.get("current_monitor", 0)
+            parser = JpegFrameParser()
+            try:
+                async with aclosing(coordinator.stream_screen(monitor)) as chunks:
+                    async for chunk in chunks:
+                        for frame in parser.feed(chunk):
+                            self._publish(frame)
+                            delay = STREAM_INITIAL_RETRY_DELAY
+                        if (coordinator.data or {}).get("current_monitor", 0) != monitor:
+                            break
+                if (coordinator.data or {}).get("current_monitor", 0) != monitor:
+                    _LOGGER.debug("Monitor changed, reconnecting screen stream")
+                    continue
+                _LOGGER.debug("Screen stream closed by client")
+            except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as ex:
+                _LOGGER.debug(f"Screen stream disconnected: {ex}")
+            except ValueError as ex:
+                _LOGGER.warning(f"Invalid screen stream data: {ex}")
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, STREAM_MAX_RETRY_DELAY)
+
+    def _publish(self, frame: bytes) -> None:
+        """Hand a frame to every viewer."""
+        self.last_frame = frame
+        self._frames += 1
+        for queue in self._viewers:
+            self._put_latest(queue, frame)
+
+    def _put_latest(self, queue: asyncio.Queue[bytes], frame: bytes) -> None:
+        """Queue a frame, dropping the oldest one if the viewer is behind."""
+        if queue.full():
+            queue.get_nowait()
+            self._dropped += 1
+        queue.put_nowait(frame)
@@ -0,0 +1,216 @@
+"""Screen thumbnail cache for OpenCtrol previews."""
+
+import asyncio
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+import hashlib
+from http import HTTPStatus
+import io
+import logging
+import time
+from typing import Any, Protocol
+
+from aiohttp import web
+
+from homeassistant.components.http import KEY_AUTHENTICATED, HomeAssistantView
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN
+
+try:
+    from PIL import Image
+except ImportError:  # Thumbnails are served at full size without Pillow
+    Image = None
+
+_LOGGER = logging.getLogger(__name__)
+
+DATA_THUMBNAIL_CACHE = "thumbnail_cache"
+
+# Longest edge of a thumbnail (pixels)
+THUMBNAIL_SIZE = 480
+THUMBNAIL_QUALITY = 70
+# Memory used by cached thumbnails of all PCs; least recently used go first
+THUMBNAIL_CACHE_BUDGET = 8 * 1024 * 1024  # bytes
+
+
+@dataclass
+class Thumbnail:
+    """A cached screen thumbnail."""
+
+    data: bytes
+    etag: str
+    last_modified: datetime
+    fetched_at: float  # monotonic
+
+
+class ThumbnailSource(Protocol):
+    """Entity whose thumbnail is served by the thumbnail view."""
+
+    access_token: str
+
+    async def async_get_thumbnail(self) -> Thumbnail | None:
+        """Return the current thumbnail."""
+
+
+def downscale_jpeg(frame: bytes, size: int = THUMBNAIL_SIZE) -> bytes:
+    """Shrink a JPEG frame to fit ``size`` pixels; runs in the executor."""
+    if Image is None:
+        return frame
+    with Image.open(io.BytesIO(frame)) as image:
+        if max(image.size) <= size:
+            return frame
+        # draft() lets the JPEG decoder skip most of the work for large reductions
+        image.draft("RGB", (size, size))
+        image = image.convert("RGB")
+        image.thumbnail((size, size))
+        output = io.BytesIO()
+        image.save(output, format="JPEG", quality=THUMBNAIL_QUALITY, optimize=True)
+        return output.getvalue()
+
+
+class ThumbnailCache:
+    """Hold the latest thumbnail of each PC within a memory budget.
+
+    A thumbnail is fetched at most once per TTL however many dashboards ask
+    for it; concurrent requests for a stale one share a single fetch. If a
+    fetch fails, the previous thumbnail keeps being served.
+    """
+
+    def __init__(self, hass: HomeAssistant, budget: int = THUMBNAIL_CACHE_BUDGET) -> None:
+        """Initialize thumbnail cache."""
+        self.hass = hass
+        self.budget = budget
+        self._entries: OrderedDict[str, Thumbnail] = OrderedDict()
+        self._pending: dict[str, asyncio.Task] = {}
+        self._bytes = 0
+        # Entities served by the thumbnail view, by entity id
+        self.sources: dict[str, ThumbnailSource] = {}
+
+        # Statistics
+        self.hits = 0
+        self.fetches = 0
+        self.evictions = 0
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        """Return cache statistics for diagnostics."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "budget": self.budget,
+            "hits": self.hits,
+            "fetches": self.fetches,
+            "evictions": self.evictions,
+        }
+
+    async def async_get(
+        self, key: str, fetch: Callable[[], Awaitable[bytes | None]], ttl: float
+    ) -> Thumbnail | None:
+        """Return the thumbnail for ``key``, fetching it if older than ``ttl``."""
+        thumbnail = self._entries.get(key)
+        if thumbnail is not None:
+            self._entries.move_to_end(key)
+            if time.monotonic() - thumbnail.fetched_at < ttl:
+                self.hits += 1
+                return thumbnail
+        task = self._pending.get(key)
+        if task is None:
+            task = self.hass.async_create_task(self._async_refresh(key, fetch, thumbnail))
+            self._pending[key] = task
+        # A cancelled request must not cancel the fetch others are waiting on
+        return await asyncio.shield(task)
+
+    def async_remove(self, key: str) -> None:
+        """Drop the thumbnail for ``key``."""
+        thumbnail = self._entries.pop(key, None)
+        if thumbnail is not None:
+            self._bytes -= len(thumbnail.data)
+
+    async def _async_refresh(
+        self, key: str, fetch: Callable[[], Awaitable[bytes | None]], previous: Thumbnail | None
+    ) -> Thumbnail | None:
+        """Fetch, downscale and store a new thumbnail."""
+        try:
+            self.fetches += 1
+            frame = await fetch()
+            if not frame:
+                return previous
+            try:
+                data = await self.hass.async_add_executor_job(downscale_jpeg, frame)
+            except (OSError, ValueError) as ex:
+                _LOGGER.debug(f"Could not downscale screen frame: {ex}")
+                return previous
+        finally:
+            self._pending.pop(key, None)
+
+        etag = hashlib.sha256(data).hexdigest()[:32]
+        now = time.monotonic()
+        if previous is not None and previous.etag == etag:
+            # Unchanged screen: keep Last-Modified so clients get a 304
+            previous.fetched_at = now
+            return previous
+
+        thumbnail = Thumbnail(data, etag, dt_util.utcnow().replace(microsecond=0), now)
+        self.async_remove(key)
+        self._entries[key] = thumbnail
+        self._bytes += len(data)
+        while self._bytes > self.budget and len(self._entries) > 1:
+            _, evicted = self._entries.popitem(last=False)
+            self._bytes -= len(evicted.data)
+            self.evictions += 1
+        return thumbnail
+
+
+class OpenCtrolThumbnailView(HomeAssistantView):
+    """Serve screen thumbnails with ETag and Last-Modified validation."""
+
+    url = "/api/opencrol/thumbnail/{entity_id}"
+    name = "api:opencrol:thumbnail"
+    # Image tags cannot send a bearer token; the entity's access token is
+    # passed in the query string instead, like the media player proxy
+    requires_auth = False
+
+    def __init__(self, cache: ThumbnailCache) -> None:
+        """Initialize thumbnail view."""
+        self._cache = cache
+
+    async def get(self, request: web.Request, entity_id: str) -> web.StreamResponse:
+        """Return the thumbnail, or 304 if the client's copy is current."""
+        source = self._cache.sources.get(entity_id)
+        if source is None:
+            return web.Response(status=HTTPStatus.NOT_FOUND)
+        authenticated = request.get(KEY_AUTHENTICATED, False) or (
+            request.query.get("token") == source.access_token
+        )
+        if not authenticated:
+            return web.Response(status=HTTPStatus.UNAUTHORIZED)
+
+        thumbnail = await source.async_get_thumbnail()
+        if thumbnail is None:
+            return web.Response(status=HTTPStatus.SERVICE_UNAVAILABLE)
+
+        response = web.Response(status=HTTPStatus.NOT_MODIFIED)
+        if request.if_none_match is not None:
+            not_modified = any(tag.value in (thumbnail.etag, "*") for tag in request.if_none_match)
+        else:
+            since = request.if_modified_since
+            not_modified = since is not None and thumbnail.last_modified <= since
+        if not not_modified:
+            response = web.Response(body=thumbnail.data, content_type="image/jpeg")
+        response.etag = thumbnail.etag
+        response.last_modified = thumbnail.last_modified
+        # Revalidate on every use; the ETag makes that a cheap 304
+        response.headers["Cache-Control"] = "private, no-cache"
+        return response
+
+
+def async_get_thumbnail_cache(hass: HomeAssistant) -> ThumbnailCache:
+    """Return the domain-wide thumbnail cache, registering its view on first use."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if DATA_THUMBNAIL_CACHE not in domain_data:
+        cache = domain_data[DATA_THUMBNAIL_CACHE] = ThumbnailCache(hass)
+        hass.http.register_view(OpenCtrolThumbnailView(cache))
+    return domain_data[DATA_THUMBNAIL_CACHE]
@@ -0,0 +1,159 @@
+"""WebSocket API for OpenCtrol."""
+
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers import config_validation as cv, entity_registry as er
+
+from .const import DOMAIN, SECTIONS
+from .coordinator import OpenCtrolCoordinator
+
+
+@callback
+def async_setup_websocket_api(hass: HomeAssistant) -> None:
+    """Register the OpenCtrol WebSocket commands."""
+    websocket_api.async_register_command(hass, ws_get_data)
+    websocket_api.async_register_command(hass, ws_subscribe)
+    websocket_api.async_register_command(hass, ws_view)
+
+
+@callback
+def async_get_coordinator(hass: HomeAssistant, entity_id: str) -> OpenCtrolCoordinator | None:
+    """Return the coordinator of the config entry an entity belongs to."""
+    entity = er.async_get(hass).async_get(entity_id)
+    if entity is None or entity.platform != DOMAIN:
+        return None
+    coordinator = hass.data.get(DOMAIN, {}).get(entity.config_entry_id)
+    return coordinator if isinstance(coordinator, OpenCtrolCoordinator) else None
+
+
+@callback
+def async_get_camera_entity(hass: HomeAssistant, coordinator: OpenCtrolCoordinator) -> str | None:
+    """Return the screen camera of a device, which fans out its stream to all viewers."""
+    for entity in er.async_entries_for_config_entry(er.async_get(hass), coordinator.entry.entry_id):
+        if entity.domain == "camera" and not entity.disabled:
+            return entity.entity_id
+    return None
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/data",
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("sections", default=list(SECTIONS)): [vol.In(SECTIONS)],
+    }
+)
+@callback
+def ws_get_data(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Return monitors, audio apps and devices that are kept out of entity attributes."""
+    coordinator = async_get_coordinator(hass, msg["entity_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No OpenCtrol device for {msg['entity_id']}"
+        )
+        return
+    connection.send_result(
+        msg["id"],
+        {
+            "revision": coordinator.revision,
+            "sections": coordinator.sections_snapshot(msg["sections"]),
+            "camera_entity": async_get_camera_entity(hass, coordinator),
+        },
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/subscribe",
+        vol.Required("entity_id"): cv.entity_id,
+        vol.Optional("sections", default=list(SECTIONS)): [vol.In(SECTIONS)],
+    }
+)
+@callback
+def ws_subscribe(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Stream a snapshot of one device and then only the sections that change.
+
+    Every event carries the coordinator revision so clients can tell whether
+    they missed an update. Event types are ``snapshot``, ``delta`` (changed
+    sections only) and ``availability`` (the device went on- or offline
+    without any data changing).
+    """
+    coordinator = async_get_coordinator(hass, msg["entity_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No OpenCtrol device for {msg['entity_id']}"
+        )
+        return
+
+    sections = frozenset(msg["sections"])
+    available = coordinator.last_update_success
+
+    def _event(event_type: str, **payload: Any) -> dict[str, Any]:
+        return websocket_api.event_message(
+            msg["id"], {"type": event_type, "revision": coordinator.revision, **payload}
+        )
+
+    @callback
+    def _forward_sections() -> None:
+        connection.send_message(
+            _event("delta", sections=coordinator.sections_snapshot(coordinator.changed_sections & sections))
+        )
+
+    @callback
+    def _forward_availability() -> None:
+        nonlocal available
+        if coordinator.last_update_success == available:
+            return
+        available = coordinator.last_update_success
+        connection.send_message(_event("availability", available=available))
+
+    unsub_sections = coordinator.async_add_section_listener(sections, _forward_sections)
+    unsub_availability = coordinator.async_add_listener(_forward_availability)
+
+    @callback
+    def _unsubscribe() -> None:
+        unsub_sections()
+        unsub_availability()
+
+    connection.subscriptions[msg["id"]] = _unsubscribe
+    connection.send_result(msg["id"])
+    connection.send_message(
+        _event(
+            "snapshot",
+            available=available,
+            sections=coordinator.sections_snapshot(sections),
+            camera_entity=async_get_camera_entity(hass, coordinator),
+        )
+    )
+
+
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): f"{DOMAIN}/view",
+        vol.Required("entity_id"): cv.entity_id,
+    }
+)
+@callback
+def ws_view(
+    hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Register the caller as a viewer of the screen stream until it unsubscribes.
+
+    Screen capture is stopped once no viewer is left and restarted when one
+    returns; closing the connection counts as leaving.
+    """
+    coordinator = async_get_coordinator(hass, msg["entity_id"])
+    if coordinator is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, f"No OpenCtrol device for {msg['entity_id']}"
+        )
+        return
+    connection.subscriptions[msg["id"]] = coordinator.async_add_viewer()
+    connection.send_result(msg["id"])
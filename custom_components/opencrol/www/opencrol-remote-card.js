@@ -15,6 +15,115 @@
     document.head.appendChild(link);
   }
 
+  // Touchpad input pipeline, shared by all cards showing the same device.
+  // Pointer events can fire at 120 Hz or more; deltas are accumulated and
+  // flushed at most once per animation frame, and the next flush waits
+  // until the previous service call has completed.
+  class InputPipeline {
+    constructor(entityId) {
+      this.entityId = entityId;
+      this.hass = null;
+      this._moveX = 0;
+      this._moveY = 0;
+      this._moveTo = null;
+      this._scroll = 0;
+      this._clicks = [];
+      this._frame = null;
+      this._inFlight = false;
+    }
+
+    queueMove(dx, dy) {
+      if (this._moveTo) {
+        this._moveTo = { x: this._moveTo.x + dx, y: this._moveTo.y + dy };
+      } else {
+        this._moveX += dx;
+        this._moveY += dy;
+      }
+      this._schedule();
+    }
+
+    queueMoveTo(x, y) {
+      // An absolute target supersedes any relative movement before it
+      this._moveTo = { x, y };
+      this._moveX = 0;
+      this._moveY = 0;
+      this._schedule();
+    }
+
+    queueScroll(delta) {
+      this._scroll += delta;
+      this._schedule();
+    }
+
+    queueClick(button, x, y) {
+      // Sent after pending movement in the same flush so ordering holds
+      this._clicks.push(x === undefined ? { button } : { button, x, y });
+      this._schedule();
+    }
+
+    _schedule() {
+      if (this._frame !== null || this._inFlight) return;
+      this._frame = requestAnimationFrame(() => {
+        this._frame = null;
+        this._flush();
+      });
+    }
+
+    async _flush() {
+      if (!this.hass) return;
+      const calls = [];
+      if (this._moveTo) {
+        calls.push(['move_mouse', { x: Math.round(this._moveTo.x), y: Math.round(this._moveTo.y) }]);
+        this._moveTo = null;
+      } else {
+        // Whole pixels are sent; the fractional remainder carries over
+        const x = Math.trunc(this._moveX);
+        const y = Math.trunc(this._moveY);
+        if (x !== 0 || y !== 0) {
+          calls.push(['move_mouse', { x, y, relative: true }]);
+          this._moveX -= x;
+          this._moveY -= y;
+        }
+      }
+      const scroll = Math.trunc(this._scroll);
+      if (scroll !== 0) {
+        calls.push(['scroll', { delta: scroll }]);
+        this._scroll -= scroll;
+      }
+      this._clicks.splice(0).forEach(click => calls.push(['click', click]));
+      if (calls.length === 0) return;
+
+      this._inFlight = true;
+      try {
+        for (const [service, data] of calls) {
+          await this.hass.callService('opencrol', service, { entity_id: this.entityId, ...data });
+        }
+      } catch (err) {
+        console.error('OpenCtrol card: Error sending input:', err);
+      } finally {
+        this._inFlight = false;
+      }
+      if (this._moveTo || Math.trunc(this._moveX) || Math.trunc(this._moveY)
+          || Math.trunc(this._scroll) || this._clicks.length) {
+        this._schedule();
+      }
+    }
+  }
+
+  const inputPipelines = new Map();
+
+  // A failed device subscription is retried with exponential backoff, not
+  // on every hass update (which happens on any state change in the house)
+  const SUBSCRIBE_RETRY_INITIAL_MS = 5000;
+  const SUBSCRIBE_RETRY_MAX_MS = 300000;
+
+  function getInputPipeline(entityId) {
+    if (!inputPipelines.has(entityId)) {
+      inputPipelines.set(entityId, new InputPipeline(entityId));
+    }
+    return inputPipelines.get(entityId);
+  }
+
 class OpenCtrolRemoteCard extends HTMLElement {
   constructor() {
     super();
@@ -23,6 +132,21 @@ class OpenCtrolRemoteCard extends HTMLElement {
     this._fullscreenOverlay = null;
     this._activeModifiers = new Set();
     this._isFullscreenOpen = false;
+    // Device data streamed by the opencrol/subscribe WebSocket command
+    this._data = {};
+    this._available = true;
+    this._revision = null;
+    this._unsubscribe = null;
+    this._subscribing = false;
+    // Screen camera of the device, resolved by the integration
+    this._cameraEntity = null;
+    this._subscribeFailures = 0;
+    this._subscribeRetryAt = 0;
+    this._entityState = null;
+    // Rendered skeleton and hash of the data each patched part shows
+    this._card = null;
+    this._parts = {};
+    this._isOnline = false;
   }
 
   static getStubConfig() {
@@ -37,6 +161,15 @@ class OpenCtrolRemoteCard extends HTMLElement {
     if (!config.entity) {
       throw new Error('Entity is required');
     }
+    if (this.config && this.config.entity !== config.entity) {
+      this._unsubscribeDevice();
+      this._data = {};
+      this._cameraEntity = null;
+      this._entityState = null;
+      this._card = null;
+      this._subscribeFailures = 0;
+      this._subscribeRetryAt = 0;
+    }
     this.config = config;
     this.entity = config.entity;
   }
@@ -44,10 +177,85 @@ class OpenCtrolRemoteCard extends HTMLElement {
   set hass(hass) {
     this._hass = hass;
     if (!this._hass || !this.config) return;
+    this._input = getInputPipeline(this.config.entity);
+    this._input.hass = hass;
+    this._subscribe();
+    // hass is replaced on every state change in the house; only this
+    // card's entity matters, device data arrives over the subscription
+    const entityState = hass.states[this.config.entity];
+    if (entityState === this._entityState) return;
+    this._entityState = entityState;
+    this.updateCard();
+  }
+
+  async _subscribe() {
+    if (this._unsubscribe || this._subscribing || !this._hass?.connection) return;
+    if (Date.now() < this._subscribeRetryAt) return;
+    this._subscribing = true;
+    try {
+      this._unsubscribe = await this._hass.connection.subscribeMessage(
+        msg => this._handleDeviceMessage(msg),
+        { type: 'opencrol/subscribe', entity_id: this.config.entity }
+      );
+      this._subscribeFailures = 0;
+      this._subscribeRetryAt = 0;
+    } catch (err) {
+      const delay = Math.min(
+        SUBSCRIBE_RETRY_INITIAL_MS * 2 ** this._subscribeFailures, SUBSCRIBE_RETRY_MAX_MS
+      );
+      this._subscribeFailures += 1;
+      this._subscribeRetryAt = Date.now() + delay;
+      if (this._subscribeFailures === 1) {
+        console.error('OpenCtrol card: Error subscribing to device data:', err);
+        // Show the device lists from a one-off fetch until a retry succeeds
+        this._fetchData();
+      } else {
+        console.debug(`OpenCtrol card: Subscribe failed again, retrying in ${delay / 1000}s`);
+      }
+    } finally {
+      this._subscribing = false;
+    }
+  }
+
+  async _fetchData() {
+    try {
+      const result = await this._hass.connection.sendMessagePromise(
+        { type: 'opencrol/data', entity_id: this.config.entity }
+      );
+      if (this._unsubscribe) return;
+      this._handleDeviceMessage({ type: 'snapshot', ...result });
+    } catch (err) {
+      console.debug('OpenCtrol card: Could not fetch device data:', err);
+    }
+  }
+
+  _unsubscribeDevice() {
+    if (this._unsubscribe) {
+      this._unsubscribe();
+      this._unsubscribe = null;
+    }
+  }
+
+  _handleDeviceMessage(msg) {
+    if (msg.type === 'snapshot') {
+      this._data = {};
+    }
+    if (msg.available !== undefined) {
+      this._available = msg.available;
+    }
+    if (msg.camera_entity !== undefined) {
+      this._cameraEntity = msg.camera_entity;
+    }
+    Object.values(msg.sections || {}).forEach(section => Object.assign(this._data, section.data));
+    this._revision = msg.revision;
     this.updateCard();
   }
 
   connectedCallback() {
+    if (this._hass && this.config) this._subscribe();
+    this._setupVisibility();
+    // The skeleton survives a detach, so document listeners are restored here
+    if (this._card) this._addOutsideClickHandler();
     this.updateCard();
     // Close fullscreen on ESC key (only add once)
     if (!this._escKeyHandler) {
@@ -57,12 +265,14 @@ class OpenCtrolRemoteCard extends HTMLElement {
   }
 
   disconnectedCallback() {
-    // Stop screen stream when card is removed
-    if (this._imgElement) {
-      this._imgElement.src = '';
-      this._imgElement = null;
-    }
+    this._unsubscribeDevice();
+    this._entityState = null;
+    this._teardownVisibility();
+    // Stop screen stream when card is removed; the skeleton is kept and
+    // the stream resumes on the next update after reattaching
+    this._patchStream(null);
     this.closeFullscreenRemote();
+    this._updateViewer();
     // Remove event listeners
     if (this._escKeyHandler) {
       document.removeEventListener('keydown', this._escKeyHandler);
@@ -85,71 +295,85 @@ class OpenCtrolRemoteCard extends HTMLElement {
 
     const entity = this._hass.states[this.config.entity];
     if (!entity) {
+      this._card = null;
       this.innerHTML = '<ha-card><div class="error">Entity not found</div></ha-card>';
       return;
     }
+    // The skeleton is built once; afterwards only changed parts are patched
+    // so the stream connection, listeners and focus survive updates
+    if (!this._card) this._renderSkeleton();
 
-    const attributes = entity.attributes || {};
-    
-    // Get status from coordinator data via attributes (not entity state)
-    // The coordinator exposes status in attributes.status
-    const status = attributes.status || 'offline';
+    // Streamed device data takes precedence over entity attributes
+    const attributes = { ...(entity.attributes || {}), ...this._data };
+    const data = this._data;
+
+    // Get status from coordinator data (not entity state)
+    const status = this._available ? (attributes.status || 'offline') : 'offline';
     const isOnline = status === 'online';
-    
+
     // Get all monitor-related data first
-    const monitors = attributes.monitors || [];
+    const monitors = data.monitors || [];
     const currentMonitor = attributes.current_monitor !== undefined ? attributes.current_monitor : 0;
-    
+
     // Get base URL from entity attributes or config
     const baseUrl = this.config.base_url || this.getBaseUrlFromEntity(entity);
-    // Always include monitor parameter (0 is default)
-    const monitorParam = `?monitor=${currentMonitor}`;
-    this._screenStreamUrl = baseUrl ? `${baseUrl}/api/v1/screenstream/stream${monitorParam}` : null;
+    this._screenStreamUrl = this._screenStreamSource(baseUrl, currentMonitor);
 
     const clientId = attributes.client_id || entity.attributes?.friendly_name || this.config.entity;
     const masterVolume = attributes.master_volume !== undefined ? Math.round(attributes.master_volume * 100) : 0;
-    const audioApps = attributes.audio_apps || [];
-    const audioDevices = attributes.audio_devices || [];
-    const defaultDeviceId = attributes.default_output_device || (audioDevices.length > 0 ? audioDevices[0].id : '');
+    const audioApps = data.audio_apps || [];
+    const audioDevices = data.audio_devices || [];
+    const defaultDeviceId = attributes.default_output_device || (audioDevices.find(d => d.is_default) || audioDevices[0] || {}).id || '';
     const isScreenCaptureActive = attributes.screen_capture_active !== undefined ? attributes.screen_capture_active : false;
     const shouldShowStream = isOnline && this._screenStreamUrl && isScreenCaptureActive;
+    this._isOnline = isOnline;
+
+    this._patchPart('header', [clientId, isOnline], () => this._patchHeader(clientId, isOnline));
+    this._patchPart('power', [isOnline, isScreenCaptureActive], () => {
+      this.querySelector('#power-menu').innerHTML = this._renderPowerMenu(isOnline, isScreenCaptureActive);
+    });
+    this._patchPart('touchpad', [isOnline, isScreenCaptureActive], () => {
+      this._patchTouchpad(isOnline, isScreenCaptureActive);
+    });
+    this._patchStream(shouldShowStream ? this._screenStreamUrl : null);
+    this._patchPart('monitors', [monitors.length, currentMonitor], () => {
+      this.querySelector('#monitors-content').innerHTML = this._renderMonitors(monitors, currentMonitor);
+    });
+    this._patchSound(masterVolume, audioDevices, defaultDeviceId, audioApps);
+    this._updateViewer();
+  }
+
+  _patchPart(name, key, render) {
+    // Re-render a part only when the data it shows has changed
+    const hash = JSON.stringify(key);
+    if (this._parts[name] === hash) return;
+    this._parts[name] = hash;
+    render();
+  }
+
+  _isEditing(container) {
+    // Controls the user is interacting with are patched on a later update
+    return container.contains(document.activeElement);
+  }
 
-    // Header with status, power button, monitors, sound, keyboard
+  _renderSkeleton() {
+    this._parts = {};
+    this._streamSrc = null;
     this.innerHTML = `
       <ha-card>
         <div class="card-header-compact">
           <div class="header-left-compact">
-            <div class="status-icon ${isOnline ? 'online' : 'offline'}" title="${isOnline ? 'Online' : 'Offline'}">
-              <ha-icon icon="${isOnline ? 'mdi:circle' : 'mdi:circle-outline'}"></ha-icon>
+            <div class="status-icon" id="status-icon">
+              <ha-icon></ha-icon>
             </div>
-            <div class="client-name">${this._escapeHtml(clientId)}</div>
+            <div class="client-name" id="client-name"></div>
           </div>
           <div class="header-icons-compact">
             <div class="power-menu-container">
               <button class="icon-btn power-btn" id="power-btn" title="Power Options">
-                <ha-icon icon="${isOnline ? 'mdi:power' : 'mdi:power-off'}"></ha-icon>
+                <ha-icon></ha-icon>
               </button>
-              <div class="dropdown-menu power-menu" id="power-menu">
-                ${isOnline ? `
-                  <button class="dropdown-item" id="screen-on-btn" ${isScreenCaptureActive ? 'disabled' : ''}>
-                    <ha-icon icon="mdi:monitor"></ha-icon> Screen On
-                  </button>
-                  <button class="dropdown-item" id="screen-off-btn" ${!isScreenCaptureActive ? 'disabled' : ''}>
-                    <ha-icon icon="mdi:monitor-off"></ha-icon> Screen Off
-                  </button>
-                  <div class="dropdown-divider"></div>
-                  <button class="dropdown-item" id="computer-restart-btn">
-                    <ha-icon icon="mdi:restart"></ha-icon> Restart Computer
-                  </button>
-                  <button class="dropdown-item computer-power-off" id="computer-power-off-btn">
-                    <ha-icon icon="mdi:power-off"></ha-icon> Shutdown Computer
-                  </button>
-                ` : `
-                  <button class="dropdown-item computer-wol" id="computer-wol-btn">
-                    <ha-icon icon="mdi:power-on"></ha-icon> Wake on LAN
-                  </button>
-                `}
-              </div>
+              <div class="dropdown-menu power-menu" id="power-menu"></div>
             </div>
             <button class="icon-btn" id="monitors-btn" title="Monitor Selection">
               <ha-icon icon="mdi:monitor-multiple"></ha-icon>
@@ -162,22 +386,21 @@ class OpenCtrolRemoteCard extends HTMLElement {
             </button>
           </div>
         </div>
-        
+
         <div class="card-content">
           <!-- Big Touchpad Area - Main view, always visible when online -->
-          <div class="touchpad-container ${!isOnline ? 'offline' : ''}" id="touchpad-container">
+          <div class="touchpad-container" id="touchpad-container">
             <div class="touchpad-area" id="touchpad-area">
+              <img class="screen-stream" id="screen-stream" alt="Screen Stream" hidden>
               <div class="touchpad-visual">
-                <div class="touchpad-icon">${isOnline ? '🖱️' : '📴'}</div>
-                <div class="touchpad-text">${isOnline ? 'Touchpad' : 'Device Offline'}</div>
-                <div class="touchpad-hint">${isOnline ? 'Drag to move mouse • Tap to click • Scroll with two fingers' : 'Waiting for connection...'}</div>
-                ${isOnline && isScreenCaptureActive ? `
-                  <div class="fullscreen-hint">
-                    <button class="fullscreen-hint-btn" id="fullscreen-hint-btn" title="View Screen in Fullscreen">
-                      <ha-icon icon="mdi:fullscreen"></ha-icon> View Screen
-                    </button>
-                  </div>
-                ` : ''}
+                <div class="touchpad-icon"></div>
+                <div class="touchpad-text"></div>
+                <div class="touchpad-hint"></div>
+                <div class="fullscreen-hint" hidden>
+                  <button class="fullscreen-hint-btn" id="fullscreen-hint-btn" title="View Screen in Fullscreen">
+                    <ha-icon icon="mdi:fullscreen"></ha-icon> View Screen
+                  </button>
+                </div>
               </div>
             </div>
           </div>
@@ -318,21 +541,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
                 <ha-icon icon="mdi:close"></ha-icon>
               </button>
             </div>
-            <div class="popup-content">
-              ${monitors.length > 0 ? `
-                <div class="monitor-list">
-                  ${monitors.map((monitor, index) => `
-                    <button class="monitor-item ${index === currentMonitor ? 'active' : ''}" 
-                            data-monitor-index="${index}" 
-                            title="Monitor ${index + 1}">
-                      <ha-icon icon="mdi:monitor"></ha-icon>
-                      <span>Monitor ${index + 1}</span>
-                      ${index === currentMonitor ? '<ha-icon icon="mdi:check" class="check-icon"></ha-icon>' : ''}
-                    </button>
-                  `).join('')}
-                </div>
-              ` : '<div class="no-monitors">No monitors detected</div>'}
-            </div>
+            <div class="popup-content" id="monitors-content"></div>
           </div>
 
           <!-- Sound Popup Menu -->
@@ -347,61 +556,260 @@ class OpenCtrolRemoteCard extends HTMLElement {
               <div class="sound-section">
                 <div class="sound-label">Master Volume</div>
                 <div class="volume-control">
-                  <input type="range" id="master-volume-slider" min="0" max="100" value="${masterVolume}" 
+                  <input type="range" id="master-volume-slider" min="0" max="100" value="0"
                          class="volume-slider" aria-label="Master Volume">
-                  <span class="volume-value">${masterVolume}%</span>
+                  <span class="volume-value">0%</span>
                 </div>
               </div>
 
               <div class="sound-section">
                 <div class="sound-label">Output Device</div>
-                <select id="output-device-select" class="device-select" aria-label="Output Device">
-                  ${audioDevices.map(device => `
-                    <option value="${this._escapeHtml(device.id)}" ${device.id === defaultDeviceId ? 'selected' : ''}>
-                      ${this._escapeHtml(device.name || device.id)}
-                    </option>
-                  `).join('')}
-                </select>
+                <select id="output-device-select" class="device-select" aria-label="Output Device"></select>
               </div>
 
               <div class="sound-section">
                 <div class="sound-label">Application Volumes</div>
-                <div class="app-volumes">
-                  ${audioApps.length > 0 ? audioApps.map(app => `
-                    <div class="app-volume-item">
-                      <div class="app-name">${this._escapeHtml(app.name || `Process ${app.process_id}`)}</div>
-                      <div class="volume-control">
-                        <input type="range" class="app-volume-slider" 
-                               data-process-id="${app.process_id}"
-                               min="0" max="100" 
-                               value="${Math.round((app.volume || 0) * 100)}" 
-                               aria-label="Volume for ${this._escapeHtml(app.name || 'app')}">
-                        <span class="volume-value">${Math.round((app.volume || 0) * 100)}%</span>
-                      </div>
-                      ${audioDevices && audioDevices.length > 0 ? `
-                        <select class="app-device-select" data-process-id="${app.process_id}" aria-label="Device for ${this._escapeHtml(app.name || 'app')}">
-                          ${audioDevices.map(device => `
-                            <option value="${this._escapeHtml(device.id)}" ${device.id === app.device_id ? 'selected' : ''}>
-                              ${this._escapeHtml(device.name || device.id)}
-                            </option>
-                          `).join('')}
-                        </select>
-                      ` : ''}
-                    </div>
-                  `).join('') : '<div class="no-apps">No audio applications running</div>'}
-                </div>
+                <div class="app-volumes" id="app-volumes"></div>
               </div>
             </div>
           </div>
         </div>
       </ha-card>
     `;
+    this._card = this.querySelector('ha-card');
+    this._imgElement = this.querySelector('#screen-stream');
 
     this.attachEventHandlers();
     this.setupScreenInteraction();
-    if (isOnline) {
-      this.setupTouchpadMode();
+    this.setupTouchpadMode();
+  }
+
+  _patchHeader(clientId, isOnline) {
+    const statusIcon = this.querySelector('#status-icon');
+    statusIcon.className = `status-icon ${isOnline ? 'online' : 'offline'}`;
+    statusIcon.title = isOnline ? 'Online' : 'Offline';
+    statusIcon.querySelector('ha-icon').setAttribute('icon', isOnline ? 'mdi:circle' : 'mdi:circle-outline');
+    this.querySelector('#client-name').textContent = clientId;
+    this.querySelector('#power-btn ha-icon').setAttribute('icon', isOnline ? 'mdi:power' : 'mdi:power-off');
+  }
+
+  _renderPowerMenu(isOnline, isScreenCaptureActive) {
+    return isOnline ? `
+      <button class="dropdown-item" id="screen-on-btn" ${isScreenCaptureActive ? 'disabled' : ''}>
+        <ha-icon icon="mdi:monitor"></ha-icon> Screen On
+      </button>
+      <button class="dropdown-item" id="screen-off-btn" ${!isScreenCaptureActive ? 'disabled' : ''}>
+        <ha-icon icon="mdi:monitor-off"></ha-icon> Screen Off
+      </button>
+      <div class="dropdown-divider"></div>
+      <button class="dropdown-item" id="computer-restart-btn">
+        <ha-icon icon="mdi:restart"></ha-icon> Restart Computer
+      </button>
+      <button class="dropdown-item computer-power-off" id="computer-power-off-btn">
+        <ha-icon icon="mdi:power-off"></ha-icon> Shutdown Computer
+      </button>
+    ` : `
+      <button class="dropdown-item computer-wol" id="computer-wol-btn">
+        <ha-icon icon="mdi:power-on"></ha-icon> Wake on LAN
+      </button>
+    `;
+  }
+
+  _patchTouchpad(isOnline, isScreenCaptureActive) {
+    this.querySelector('#touchpad-container').classList.toggle('offline', !isOnline);
+    this.querySelector('.touchpad-icon').textContent = isOnline ? '🖱️' : '📴';
+    this.querySelector('.touchpad-text').textContent = isOnline ? 'Touchpad' : 'Device Offline';
+    this.querySelector('.touchpad-hint').textContent = isOnline
+      ? 'Drag to move mouse • Tap to click • Scroll with two fingers'
+      : 'Waiting for connection...';
+    this.querySelector('.fullscreen-hint').hidden = !(isOnline && isScreenCaptureActive);
+  }
+
+  _patchStream(url) {
+    // Every src assignment reopens the MJPEG connection, so only touch it
+    // when the URL actually changes. A card that is scrolled away or in a
+    // background tab keeps the wanted URL but drops the connection.
+    this._wantedStreamUrl = url;
+    const img = this._imgElement;
+    const effective = url && this._isStreamVisible() ? url : null;
+    if (!img || this._streamSrc === effective) return;
+    this._streamSrc = effective;
+    if (effective) {
+      img.src = effective;
+      img.hidden = false;
+    } else {
+      img.removeAttribute('src');
+      img.hidden = true;
+    }
+  }
+
+  _setupVisibility() {
+    if (!this._visibilityHandler) {
+      this._visibilityHandler = () => this._updateStreamVisibility();
+      document.addEventListener('visibilitychange', this._visibilityHandler);
+    }
+    if (!this._intersectionObserver && 'IntersectionObserver' in window) {
+      this._intersectionObserver = new IntersectionObserver((entries) => {
+        const entry = entries[entries.length - 1];
+        if (!entry || entry.isIntersecting === this._inView) return;
+        this._inView = entry.isIntersecting;
+        this._updateStreamVisibility();
+      });
+      this._intersectionObserver.observe(this);
+    }
+    if (!this._intersectionObserver) this._inView = true;
+  }
+
+  _teardownVisibility() {
+    if (this._visibilityHandler) {
+      document.removeEventListener('visibilitychange', this._visibilityHandler);
+      this._visibilityHandler = null;
     }
+    if (this._intersectionObserver) {
+      this._intersectionObserver.disconnect();
+      this._intersectionObserver = null;
+    }
+    this._inView = false;
+  }
+
+  _isStreamVisible() {
+    return document.visibilityState === 'visible' && (this._inView || this._isFullscreenOpen);
+  }
+
+  _updateStreamVisibility() {
+    this._patchStream(this._wantedStreamUrl);
+    // The fullscreen overlay lives outside the card, so it only follows tab focus
+    const fullscreenImg = this._fullscreenOverlay?.querySelector('.fullscreen-stream');
+    if (fullscreenImg) {
+      if (document.visibilityState === 'visible') {
+        if (fullscreenImg.getAttribute('src') !== this._fullscreenStreamUrl) {
+          fullscreenImg.src = this._fullscreenStreamUrl;
+        }
+      } else {
+        fullscreenImg.removeAttribute('src');
+      }
+    }
+    this._updateViewer();
+  }
+
+  _updateViewer() {
+    // Register as a viewer while the stream is on screen so the integration
+    // can stop capture on the PC once nobody is watching
+    const watching = this.isConnected && this._hass && this.config?.entity
+      && this._wantedStreamUrl && this._isStreamVisible();
+    if (!watching) {
+      if (this._viewerUnsub) {
+        const unsub = this._viewerUnsub;
+        this._viewerUnsub = null;
+        unsub().catch(() => {});
+      }
+      return;
+    }
+    if (this._viewerUnsub || this._viewerPending) return;
+    this._viewerPending = true;
+    this._hass.connection.subscribeMessage(() => {}, {
+      type: 'opencrol/view',
+      entity_id: this.config.entity,
+    }).then((unsub) => {
+      this._viewerPending = false;
+      this._viewerUnsub = unsub;
+      // Visibility may have changed while the subscription was pending
+      this._updateViewer();
+    }).catch(() => {
+      this._viewerPending = false;
+    });
+  }
+
+  _renderMonitors(monitors, currentMonitor) {
+    return monitors.length > 0 ? `
+      <div class="monitor-list">
+        ${monitors.map((monitor, index) => `
+          <button class="monitor-item ${index === currentMonitor ? 'active' : ''}"
+                  data-monitor-index="${index}"
+                  title="Monitor ${index + 1}">
+            <ha-icon icon="mdi:monitor"></ha-icon>
+            <span>Monitor ${index + 1}</span>
+            ${index === currentMonitor ? '<ha-icon icon="mdi:check" class="check-icon"></ha-icon>' : ''}
+          </button>
+        `).join('')}
+      </div>
+    ` : '<div class="no-monitors">No monitors detected</div>';
+  }
+
+  _patchSound(masterVolume, audioDevices, defaultDeviceId, audioApps) {
+    const masterSlider = this.querySelector('#master-volume-slider');
+    if (document.activeElement !== masterSlider) {
+      this._patchPart('masterVolume', masterVolume, () => {
+        masterSlider.value = masterVolume;
+        masterSlider.nextElementSibling.textContent = `${masterVolume}%`;
+      });
+    }
+
+    const deviceList = audioDevices.map(d => [d.id, d.name]);
+    const deviceSelect = this.querySelector('#output-device-select');
+    if (!this._isEditing(deviceSelect)) {
+      this._patchPart('devices', [deviceList, defaultDeviceId], () => {
+        deviceSelect.innerHTML = audioDevices.map(device => `
+          <option value="${this._escapeHtml(device.id)}" ${device.id === defaultDeviceId ? 'selected' : ''}>
+            ${this._escapeHtml(device.name || device.id)}
+          </option>
+        `).join('');
+      });
+    }
+
+    const appVolumes = this.querySelector('#app-volumes');
+    if (!this._isEditing(appVolumes)) {
+      this._patchPart('apps', [audioApps, deviceList], () => {
+        appVolumes.innerHTML = this._renderApps(audioApps, audioDevices);
+      });
+    }
+  }
+
+  _renderApps(audioApps, audioDevices) {
+    return audioApps.length > 0 ? audioApps.map(app => `
+      <div class="app-volume-item">
+        <div class="app-name">${this._escapeHtml(app.name || `Process ${app.process_id}`)}</div>
+        <div class="volume-control">
+          <input type="range" class="app-volume-slider"
+                 data-process-id="${app.process_id}"
+                 min="0" max="100"
+                 value="${Math.round((app.volume || 0) * 100)}"
+                 aria-label="Volume for ${this._escapeHtml(app.name || 'app')}">
+          <span class="volume-value">${Math.round((app.volume || 0) * 100)}%</span>
+        </div>
+        ${audioDevices && audioDevices.length > 0 ? `
+          <select class="app-device-select" data-process-id="${app.process_id}" aria-label="Device for ${this._escapeHtml(app.name || 'app')}">
+            ${audioDevices.map(device => `
+              <option value="${this._escapeHtml(device.id)}" ${device.id === app.device_id ? 'selected' : ''}>
+                ${this._escapeHtml(device.name || device.id)}
+              </option>
+            `).join('')}
+          </select>
+        ` : ''}
+      </div>
+    `).join('') : '<div class="no-apps">No audio applications running</div>';
+  }
+
+  _guessCameraEntity() {
+    // The camera shares its name with the media player ("<PC> Screen");
+    // used until the integration has named it
+    const [domain, objectId] = this.config.entity.split('.');
+    if (domain === 'remote') return `camera.${objectId.replace(/_remote$/, '_screen')}`;
+    return `camera.${objectId}`;
+  }
+
+  _screenStreamSource(baseUrl, monitorIndex) {
+    // Prefer the integration's camera, which shares one connection to the PC
+    // between all viewers and follows the selected monitor itself
+    const cameraId = this.config.camera_entity || this._cameraEntity || this._guessCameraEntity();
+    const token = this._hass.states[cameraId]?.attributes?.access_token;
+    if (token) {
+      // Camera tokens rotate; keep the running URL so the stream is not reopened
+      const proxyPath = `/api/camera_proxy_stream/${cameraId}?`;
+      if (this._streamSrc && this._streamSrc.startsWith(proxyPath)) return this._streamSrc;
+      return `${proxyPath}token=${encodeURIComponent(token)}`;
+    }
+    return baseUrl ? `${baseUrl}/api/v1/screenstream/stream?monitor=${monitorIndex}` : null;
   }
 
   getBaseUrlFromEntity(entity) {
@@ -437,9 +845,10 @@ class OpenCtrolRemoteCard extends HTMLElement {
     let startX = null;
     let startY = null;
 
-    // Mouse events
+    // Mouse events; the touchpad stays wired while offline but sends nothing
     touchpadArea.addEventListener('mousedown', (e) => {
       e.preventDefault();
+      if (!this._isOnline) return;
       isDown = true;
       lastX = e.clientX;
       lastY = e.clientY;
@@ -451,18 +860,9 @@ class OpenCtrolRemoteCard extends HTMLElement {
     touchpadArea.addEventListener('mousemove', (e) => {
       e.preventDefault();
       if (isDown && lastX !== null && lastY !== null) {
-        const deltaX = e.clientX - lastX;
-        const deltaY = e.clientY - lastY;
-        
-        if (Math.abs(deltaX) > 2 || Math.abs(deltaY) > 2) {
-          this.sendCommand('move_mouse', { 
-            x: Math.round(deltaX * 1.5),
-            y: Math.round(deltaY * 1.5),
-            relative: true
-          });
-          lastX = e.clientX;
-          lastY = e.clientY;
-        }
+        this._queuePointerMove(e.clientX - lastX, e.clientY - lastY);
+        lastX = e.clientX;
+        lastY = e.clientY;
       }
     });
 
@@ -472,7 +872,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
       if (isDown && startX !== null && startY !== null) {
         const delta = Math.abs(e.clientX - startX) + Math.abs(e.clientY - startY);
         if (delta < 5) {
-          this.sendCommand('click', { button: 'left' });
+          this._input.queueClick('left');
         }
       }
       isDown = false;
@@ -484,15 +884,14 @@ class OpenCtrolRemoteCard extends HTMLElement {
 
     touchpadArea.addEventListener('contextmenu', (e) => {
       e.preventDefault();
-      this.sendCommand('click', { button: 'right' });
+      if (!this._isOnline) return;
+      this._input.queueClick('right');
     });
 
     touchpadArea.addEventListener('wheel', (e) => {
       e.preventDefault();
-      const delta = Math.round(e.deltaY);
-      if (delta !== 0) {
-        this.sendCommand('scroll', { delta: delta });
-      }
+      if (!this._isOnline) return;
+      this._input.queueScroll(e.deltaY);
     });
 
     // Touch events
@@ -502,6 +901,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
 
     touchpadArea.addEventListener('touchstart', (e) => {
       e.preventDefault();
+      if (!this._isOnline) return;
       const touch = e.touches[0];
       touchStartX = touch.clientX;
       touchStartY = touch.clientY;
@@ -516,27 +916,16 @@ class OpenCtrolRemoteCard extends HTMLElement {
       e.preventDefault();
       if (e.touches.length === 1 && isDown && lastX !== null && lastY !== null) {
         const touch = e.touches[0];
-        const deltaX = touch.clientX - lastX;
-        const deltaY = touch.clientY - lastY;
-        
-        if (Math.abs(deltaX) > 2 || Math.abs(deltaY) > 2) {
-          this.sendCommand('move_mouse', { 
-            x: Math.round(deltaX * 1.5),
-            y: Math.round(deltaY * 1.5),
-            relative: true
-          });
-          lastX = touch.clientX;
-          lastY = touch.clientY;
-        }
+        this._queuePointerMove(touch.clientX - lastX, touch.clientY - lastY);
+        lastX = touch.clientX;
+        lastY = touch.clientY;
       } else if (e.touches.length === 2) {
-        // Two-finger scroll
+        // Two-finger scroll, merged like pointer movement
         const touch1 = e.touches[0];
         const touch2 = e.touches[1];
-        const deltaY = (touch1.clientY + touch2.clientY) / 2 - (lastY || touch1.clientY);
-        if (Math.abs(deltaY) > 5) {
-          this.sendCommand('scroll', { delta: Math.round(deltaY) });
-          lastY = (touch1.clientY + touch2.clientY) / 2;
-        }
+        const midY = (touch1.clientY + touch2.clientY) / 2;
+        this._input.queueScroll(midY - (lastY || touch1.clientY));
+        lastY = midY;
       }
     });
 
@@ -549,7 +938,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
         const duration = Date.now() - touchStartTime;
         
         if (delta < 10 && duration < 300) {
-          this.sendCommand('click', { button: 'left' });
+          this._input.queueClick('left');
         }
       }
       isDown = false;
@@ -560,6 +949,15 @@ class OpenCtrolRemoteCard extends HTMLElement {
     });
   }
 
+  _queuePointerMove(dx, dy) {
+    // Linear gain, optionally growing with pointer speed (pixels per event)
+    const sensitivity = this.config.touchpad_sensitivity ?? 1.5;
+    const acceleration = this.config.touchpad_acceleration ?? 0;
+    const speed = Math.min(Math.hypot(dx, dy), 50);
+    const gain = sensitivity * (1 + acceleration * speed / 10);
+    this._input.queueMove(dx * gain, dy * gain);
+  }
+
   setupScreenInteraction() {
     // Fullscreen hint button - opens fullscreen view of screen
     const fullscreenHintBtn = this.querySelector('#fullscreen-hint-btn');
@@ -568,7 +966,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
         e.stopPropagation();
         e.preventDefault();
         const entityForFullscreen = this._hass.states[this.config.entity];
-        const attrsForFullscreen = entityForFullscreen?.attributes || {};
+        const attrsForFullscreen = { ...(entityForFullscreen?.attributes || {}), ...this._data };
         const baseUrl = this.config.base_url || this.getBaseUrlFromEntity(entityForFullscreen);
         const currentMonitor = attrsForFullscreen.current_monitor !== undefined ? attrsForFullscreen.current_monitor : 0;
         this.openFullscreenRemote(baseUrl, currentMonitor);
@@ -576,224 +974,173 @@ class OpenCtrolRemoteCard extends HTMLElement {
     }
   }
 
-  attachEventHandlers() {
-    // Power dropdown menu
-    const powerBtn = this.querySelector('#power-btn');
-    const powerMenu = this.querySelector('#power-menu');
-    if (powerBtn && powerMenu) {
-      powerBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const isOpen = powerMenu.classList.contains('open');
-        // Close all other menus
-        this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(menu => {
-          if (menu !== powerMenu) menu.classList.remove('open');
-        });
-        if (isOpen) {
-          powerMenu.classList.remove('open');
-        } else {
-          powerMenu.classList.add('open');
-        }
-      });
-    }
+  _toggleMenu(menu) {
+    const isOpen = menu.classList.contains('open');
+    // Close all other menus
+    this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(other => {
+      if (other !== menu) other.classList.remove('open');
+    });
+    menu.classList.toggle('open', !isOpen);
+    return !isOpen;
+  }
 
-    // Screen On button
-    const screenOnBtn = this.querySelector('#screen-on-btn');
-    if (screenOnBtn) {
-      screenOnBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const mediaEntityId = this.config.entity.replace('remote.', 'media_player.').replace('_remote', '_screen');
-        if (this._hass.states[mediaEntityId]) {
-          this._hass.callService('media_player', 'turn_on', { entity_id: mediaEntityId }).catch(() => {
-            this.sendCommand('start_screen_capture');
-          });
-        } else {
-          this.sendCommand('start_screen_capture');
-        }
-        if (powerMenu) powerMenu.classList.remove('open');
+  _setScreenCapture(on) {
+    const mediaEntityId = this.config.entity.replace('remote.', 'media_player.').replace('_remote', '_screen');
+    const fallback = on ? 'start_screen_capture' : 'stop_screen_capture';
+    if (this._hass.states[mediaEntityId]) {
+      this._hass.callService('media_player', on ? 'turn_on' : 'turn_off', { entity_id: mediaEntityId }).catch(() => {
+        this.sendCommand(fallback);
       });
+    } else {
+      this.sendCommand(fallback);
     }
+  }
 
-    // Screen Off button
-    const screenOffBtn = this.querySelector('#screen-off-btn');
-    if (screenOffBtn) {
-      screenOffBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const mediaEntityId = this.config.entity.replace('remote.', 'media_player.').replace('_remote', '_screen');
-        if (this._hass.states[mediaEntityId]) {
-          this._hass.callService('media_player', 'turn_off', { entity_id: mediaEntityId }).catch(() => {
-            this.sendCommand('stop_screen_capture');
-          });
-        } else {
-          this.sendCommand('stop_screen_capture');
-        }
-        if (powerMenu) powerMenu.classList.remove('open');
-      });
+  _wakeOnLan() {
+    // Get MAC address from entity attributes (set from config entry)
+    let macAddress = null;
+    try {
+      const entity = this._hass.states[this.config.entity];
+      const attributes = entity?.attributes || {};
+      macAddress = attributes.mac_address;
+    } catch (err) {
+      console.warn('Could not get MAC address from attributes:', err);
     }
 
-    // Computer power off button
-    const computerPowerOffBtn = this.querySelector('#computer-power-off-btn');
-    if (computerPowerOffBtn) {
-      computerPowerOffBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        if (confirm('Are you sure you want to shutdown the computer?')) {
-          this._hass.callService('opencrol', 'shutdown_computer', {
-            entity_id: this.config.entity
-          }).catch(err => {
-            console.error('Failed to shutdown computer:', err);
-          });
-        }
-        if (powerMenu) powerMenu.classList.remove('open');
-      });
+    if (!macAddress) {
+      alert('MAC address is not configured. Please configure it in the integration settings (Settings → Devices & Services → OpenCtrol → Configure).');
+      return;
     }
 
-    // Computer restart button
-    const computerRestartBtn = this.querySelector('#computer-restart-btn');
-    if (computerRestartBtn) {
-      computerRestartBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        if (confirm('Are you sure you want to restart the computer?')) {
-          this._hass.callService('opencrol', 'restart_computer', {
-            entity_id: this.config.entity
-          }).catch(err => {
-            console.error('Failed to restart computer:', err);
-          });
-        }
-        if (powerMenu) powerMenu.classList.remove('open');
-      });
-    }
+    this._hass.callService('opencrol', 'wake_on_lan', {
+      entity_id: this.config.entity,
+      mac_address: macAddress
+    }).catch(err => {
+      console.error('Failed to send Wake-on-LAN packet:', err);
+      alert('Failed to send Wake-on-LAN packet. Please check the MAC address and ensure the computer supports WOL.');
+    });
+  }
 
-    // Wake on LAN button (when offline)
-    const computerWolBtn = this.querySelector('#computer-wol-btn');
-    if (computerWolBtn) {
-      computerWolBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        // Get MAC address from entity attributes (set from config entry)
-        let macAddress = null;
-        try {
-          const entity = this._hass.states[this.config.entity];
-          const attributes = entity?.attributes || {};
-          macAddress = attributes.mac_address;
-        } catch (err) {
-          console.warn('Could not get MAC address from attributes:', err);
-        }
+  _addOutsideClickHandler() {
+    // Only add once
+    if (this._outsideClickHandler) return;
+    this._outsideClickHandler = (e) => {
+      const clickedElement = e.target;
+      const isInMenu = Array.from(this.querySelectorAll('.popup-menu, .dropdown-menu')).some(menu => menu.contains(clickedElement));
+      const isMenuButton = clickedElement.closest('.icon-btn');
 
-        if (!macAddress) {
-          alert('MAC address is not configured. Please configure it in the integration settings (Settings → Devices & Services → OpenCtrol → Configure).');
-          if (powerMenu) powerMenu.classList.remove('open');
-          return;
-        }
+      if (!this.contains(clickedElement) || (!isInMenu && !isMenuButton)) {
+        this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(menu => menu.classList.remove('open'));
+      }
+    };
+    document.addEventListener('click', this._outsideClickHandler);
+  }
 
-        this._hass.callService('opencrol', 'wake_on_lan', {
-          entity_id: this.config.entity,
-          mac_address: macAddress
-        }).catch(err => {
-          console.error('Failed to send Wake-on-LAN packet:', err);
-          alert('Failed to send Wake-on-LAN packet. Please check the MAC address and ensure the computer supports WOL.');
-        });
-        if (powerMenu) powerMenu.classList.remove('open');
-      });
-    }
+  attachEventHandlers() {
+    // Handlers are attached once to the skeleton. Parts that are re-rendered
+    // (power menu, monitor list, app list) use delegation on their container.
+
+    // Power dropdown menu
+    const powerBtn = this.querySelector('#power-btn');
+    const powerMenu = this.querySelector('#power-menu');
+    powerBtn.addEventListener('click', (e) => {
+      e.stopPropagation();
+      e.preventDefault();
+      this._toggleMenu(powerMenu);
+    });
+
+    powerMenu.addEventListener('click', (e) => {
+      const item = e.target.closest('.dropdown-item');
+      if (!item || item.disabled) return;
+      e.stopPropagation();
+      e.preventDefault();
+      switch (item.id) {
+        case 'screen-on-btn':
+          this._setScreenCapture(true);
+          break;
+        case 'screen-off-btn':
+          this._setScreenCapture(false);
+          break;
+        case 'computer-power-off-btn':
+          if (confirm('Are you sure you want to shutdown the computer?')) {
+            this._hass.callService('opencrol', 'shutdown_computer', {
+              entity_id: this.config.entity
+            }).catch(err => {
+              console.error('Failed to shutdown computer:', err);
+            });
+          }
+          break;
+        case 'computer-restart-btn':
+          if (confirm('Are you sure you want to restart the computer?')) {
+            this._hass.callService('opencrol', 'restart_computer', {
+              entity_id: this.config.entity
+            }).catch(err => {
+              console.error('Failed to restart computer:', err);
+            });
+          }
+          break;
+        case 'computer-wol-btn':
+          this._wakeOnLan();
+          break;
+      }
+      powerMenu.classList.remove('open');
+    });
 
     // Monitor selection button
     const monitorsBtn = this.querySelector('#monitors-btn');
     const monitorsMenu = this.querySelector('#monitors-menu');
-    if (monitorsBtn && monitorsMenu) {
-      monitorsBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const isOpen = monitorsMenu.classList.contains('open');
-        // Close all other menus
-        this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(menu => {
-          if (menu !== monitorsMenu) menu.classList.remove('open');
-        });
-        if (isOpen) {
-          monitorsMenu.classList.remove('open');
-        } else {
-          monitorsMenu.classList.add('open');
-        }
-      });
-    }
+    monitorsBtn.addEventListener('click', (e) => {
+      e.stopPropagation();
+      e.preventDefault();
+      this._toggleMenu(monitorsMenu);
+    });
 
     // Monitor selection items
-    this.querySelectorAll('.monitor-item').forEach(btn => {
-      btn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const index = parseInt(btn.dataset.monitorIndex);
-        if (!isNaN(index) && this.config.entity) {
-          this._hass.callService('opencrol', 'select_monitor', {
-            entity_id: this.config.entity,
-            monitor_index: index,
-          }).catch(() => {});
-          
-          this._hass.callService('opencrol', 'start_screen_capture', {
-            entity_id: this.config.entity,
-          }).catch(() => {});
-
-          // Update stream URL with new monitor
-          const entityForStream = this._hass.states[this.config.entity];
-          const attrsForStream = entityForStream?.attributes || {};
-          const baseUrl = this.config.base_url || this.getBaseUrlFromEntity(entityForStream);
-          if (baseUrl) {
-            const newStreamUrl = `${baseUrl}/api/v1/screenstream/stream?monitor=${index}`;
-            this._screenStreamUrl = newStreamUrl;
-            const screenImg = this.querySelector('#screen-stream');
-            if (screenImg) {
-              screenImg.src = `${newStreamUrl}&_t=${Date.now()}`;
-            }
-          }
+    this.querySelector('#monitors-content').addEventListener('click', (e) => {
+      const btn = e.target.closest('.monitor-item');
+      if (!btn) return;
+      e.stopPropagation();
+      e.preventDefault();
+      const index = parseInt(btn.dataset.monitorIndex);
+      if (!isNaN(index) && this.config.entity) {
+        this._hass.callService('opencrol', 'select_monitor', {
+          entity_id: this.config.entity,
+          monitor_index: index,
+        }).catch(() => {});
+
+        this._hass.callService('opencrol', 'start_screen_capture', {
+          entity_id: this.config.entity,
+        }).catch(() => {});
+
+        // Switch the stream right away; the next update carries the same URL
+        const baseUrl = this.config.base_url || this.getBaseUrlFromEntity(this._hass.states[this.config.entity]);
+        const streamUrl = this._screenStreamSource(baseUrl, index);
+        if (streamUrl) {
+          this._screenStreamUrl = streamUrl;
+          this._patchStream(this._screenStreamUrl);
         }
-        if (monitorsMenu) monitorsMenu.classList.remove('open');
-      });
+      }
+      monitorsMenu.classList.remove('open');
     });
 
     // Menu toggles
-    const soundBtn = this.querySelector('#sound-btn');
-    const keyboardBtn = this.querySelector('#keyboard-btn');
     const soundMenu = this.querySelector('#sound-menu');
     const keyboardMenu = this.querySelector('#keyboard-menu');
 
-    if (soundBtn && soundMenu) {
-      soundBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const isOpen = soundMenu.classList.contains('open');
-        // Close all other menus
-        this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(menu => {
-          if (menu !== soundMenu) menu.classList.remove('open');
-        });
-        if (isOpen) {
-          soundMenu.classList.remove('open');
-        } else {
-          soundMenu.classList.add('open');
-        }
-      });
-    }
+    this.querySelector('#sound-btn').addEventListener('click', (e) => {
+      e.stopPropagation();
+      e.preventDefault();
+      this._toggleMenu(soundMenu);
+    });
 
-    if (keyboardBtn && keyboardMenu) {
-      keyboardBtn.addEventListener('click', (e) => {
-        e.stopPropagation();
-        e.preventDefault();
-        const isOpen = keyboardMenu.classList.contains('open');
-        // Close all other menus
-        this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(menu => {
-          if (menu !== keyboardMenu) menu.classList.remove('open');
-        });
-        if (isOpen) {
-          keyboardMenu.classList.remove('open');
-        } else {
-          keyboardMenu.classList.add('open');
-          const textInput = this.querySelector('#text-input');
-          if (textInput) setTimeout(() => textInput.focus(), 100);
-        }
-      });
-    }
+    this.querySelector('#keyboard-btn').addEventListener('click', (e) => {
+      e.stopPropagation();
+      e.preventDefault();
+      if (this._toggleMenu(keyboardMenu)) {
+        const textInput = this.querySelector('#text-input');
+        if (textInput) setTimeout(() => textInput.focus(), 100);
+      }
+    });
 
     // Close buttons
     this.querySelectorAll('.popup-close').forEach(btn => {
@@ -802,19 +1149,8 @@ class OpenCtrolRemoteCard extends HTMLElement {
       });
     });
 
-    // Close on outside click (only add once)
-    if (!this._outsideClickHandler) {
-      this._outsideClickHandler = (e) => {
-        const clickedElement = e.target;
-        const isInMenu = this.querySelectorAll('.popup-menu, .dropdown-menu').some(menu => menu.contains(clickedElement));
-        const isMenuButton = clickedElement.closest('.icon-btn');
-        
-        if (!this.contains(clickedElement) || (!isInMenu && !isMenuButton)) {
-          this.querySelectorAll('.popup-menu, .dropdown-menu').forEach(menu => menu.classList.remove('open'));
-        }
-      };
-      document.addEventListener('click', this._outsideClickHandler);
-    }
+    // Close on outside click
+    this._addOutsideClickHandler();
 
     // Type text
     const typeBtn = this.querySelector('#type-btn');
@@ -840,11 +1176,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
     const updateModifierStyles = () => {
       this.querySelectorAll('.keyboard-key.toggle').forEach(btn => {
         const key = (btn.dataset.key || '').toUpperCase();
-        if (this._activeModifiers.has(key)) {
-          btn.classList.add('toggled');
-        } else {
-          btn.classList.remove('toggled');
-        }
+        btn.classList.toggle('toggled', this._activeModifiers.has(key));
       });
     };
 
@@ -852,7 +1184,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
       btn.addEventListener('click', (e) => {
         e.stopPropagation();
         e.preventDefault();
-        
+
         const key = (btn.dataset.key || '').toUpperCase();
         const combo = btn.dataset.keys;
 
@@ -886,75 +1218,68 @@ class OpenCtrolRemoteCard extends HTMLElement {
 
     // Volume controls
     const masterVolumeSlider = this.querySelector('#master-volume-slider');
-    if (masterVolumeSlider) {
-      let volumeTimeout;
-      masterVolumeSlider.addEventListener('input', (e) => {
-        const value = parseInt(e.target.value);
-        const valueDisplay = masterVolumeSlider.nextElementSibling;
-        if (valueDisplay) valueDisplay.textContent = value + '%';
-        
-        clearTimeout(volumeTimeout);
-        volumeTimeout = setTimeout(() => {
-          this.sendCommand('set_volume', { volume: value / 100 });
-        }, 100);
-      });
-    }
+    let volumeTimeout;
+    masterVolumeSlider.addEventListener('input', (e) => {
+      const value = parseInt(e.target.value);
+      const valueDisplay = masterVolumeSlider.nextElementSibling;
+      if (valueDisplay) valueDisplay.textContent = value + '%';
+
+      clearTimeout(volumeTimeout);
+      volumeTimeout = setTimeout(() => {
+        this.sendCommand('set_volume', { volume: value / 100 });
+      }, 100);
+    });
 
-    // App volume sliders
-    this.querySelectorAll('.app-volume-slider').forEach(slider => {
-      let volumeTimeout;
-      slider.addEventListener('input', (e) => {
-        const value = parseInt(e.target.value);
-        const processId = parseInt(e.target.dataset.processId);
-        const valueDisplay = e.target.nextElementSibling;
-        if (valueDisplay) valueDisplay.textContent = value + '%';
-        
-        clearTimeout(volumeTimeout);
-        volumeTimeout = setTimeout(() => {
-          this.sendCommand('set_app_volume', { process_id: processId, volume: value / 100 });
-        }, 100);
-      });
+    // App volume sliders and device selectors
+    const appVolumes = this.querySelector('#app-volumes');
+    const appVolumeTimeouts = new Map();
+    appVolumes.addEventListener('input', (e) => {
+      if (!e.target.classList.contains('app-volume-slider')) return;
+      const value = parseInt(e.target.value);
+      const processId = parseInt(e.target.dataset.processId);
+      const valueDisplay = e.target.nextElementSibling;
+      if (valueDisplay) valueDisplay.textContent = value + '%';
+
+      clearTimeout(appVolumeTimeouts.get(processId));
+      appVolumeTimeouts.set(processId, setTimeout(() => {
+        this.sendCommand('set_app_volume', { process_id: processId, volume: value / 100 });
+      }, 100));
+    });
+    appVolumes.addEventListener('change', (e) => {
+      if (!e.target.classList.contains('app-device-select')) return;
+      const processId = parseInt(e.target.dataset.processId);
+      this.sendCommand('set_app_device', { process_id: processId, device_id: e.target.value });
     });
 
     // Device selectors
     const outputDeviceSelect = this.querySelector('#output-device-select');
-    if (outputDeviceSelect) {
-      outputDeviceSelect.addEventListener('change', async (e) => {
-        const deviceId = e.target.value;
-        if (!deviceId) return;
-        
-        try {
-          // Call the service directly to get better error feedback
-          const result = await this._hass.callService('opencrol', 'set_default_device', {
-            entity_id: this.config.entity,
-            device_id: deviceId
-          });
-          
-          // Log result for debugging
-          if (result && typeof result === 'object') {
-            if (result.warning) {
-              console.warn('Device selection warning:', result.warning);
-              console.warn('Requested:', result.requested_device, 'Current:', result.current_default);
-            }
-          }
-        } catch (err) {
-          console.error('Failed to set default audio device:', err);
-          // Revert selection on error
-          const entity = this._hass.states[this.config.entity];
-          const devices = entity?.attributes?.audio_devices || [];
-          const currentDefault = devices.find(d => d.is_default)?.id;
-          if (currentDefault && outputDeviceSelect) {
-            outputDeviceSelect.value = currentDefault;
+    outputDeviceSelect.addEventListener('change', async (e) => {
+      const deviceId = e.target.value;
+      if (!deviceId) return;
+
+      try {
+        // Call the service directly to get better error feedback
+        const result = await this._hass.callService('opencrol', 'set_default_device', {
+          entity_id: this.config.entity,
+          device_id: deviceId
+        });
+
+        // Log result for debugging
+        if (result && typeof result === 'object') {
+          if (result.warning) {
+            console.warn('Device selection warning:', result.warning);
+            console.warn('Requested:', result.requested_device, 'Current:', result.current_default);
           }
         }
-      });
-    }
-
-    this.querySelectorAll('.app-device-select').forEach(select => {
-      select.addEventListener('change', (e) => {
-        const processId = parseInt(e.target.dataset.processId);
-        this.sendCommand('set_app_device', { process_id: processId, device_id: e.target.value });
-      });
+      } catch (err) {
+        console.error('Failed to set default audio device:', err);
+        // Revert selection on error
+        const devices = this._data.audio_devices || [];
+        const currentDefault = devices.find(d => d.is_default)?.id;
+        if (currentDefault && outputDeviceSelect) {
+          outputDeviceSelect.value = currentDefault;
+        }
+      }
     });
   }
 
@@ -967,10 +1292,10 @@ class OpenCtrolRemoteCard extends HTMLElement {
     const entity = this._hass.states[this.config.entity];
     const attributes = entity?.attributes || {};
     const clientId = attributes.client_id || entity?.attributes?.friendly_name || this.config.entity;
-    const monitorParam = monitorIndex >= 0 ? `?monitor=${monitorIndex}` : '';
-    const streamUrl = `${baseUrl}/api/v1/screenstream/stream${monitorParam}`;
+    const streamUrl = this._screenStreamSource(baseUrl, Math.max(monitorIndex, 0));
 
     this._isFullscreenOpen = true;
+    this._fullscreenStreamUrl = streamUrl;
     this._fullscreenOverlay = document.createElement('div');
     this._fullscreenOverlay.className = 'fullscreen-overlay';
     this._fullscreenOverlay.innerHTML = `
@@ -996,13 +1321,16 @@ class OpenCtrolRemoteCard extends HTMLElement {
     if (streamImg) {
       this.setupFullscreenInteraction(streamImg, baseUrl);
     }
+    this._updateViewer();
   }
 
   closeFullscreenRemote() {
     if (this._fullscreenOverlay) {
       this._fullscreenOverlay.remove();
       this._fullscreenOverlay = null;
+      this._fullscreenStreamUrl = null;
       this._isFullscreenOpen = false;
+      this._updateStreamVisibility();
     }
   }
 
@@ -1011,7 +1339,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
       const rect = img.getBoundingClientRect();
       const x = Math.round((e.clientX - rect.left) * (img.naturalWidth / rect.width));
       const y = Math.round((e.clientY - rect.top) * (img.naturalHeight / rect.height));
-      this.sendCommand('click', { button: 'left', x: x, y: y });
+      this._input.queueClick('left', x, y);
     });
 
     img.addEventListener('contextmenu', (e) => {
@@ -1019,12 +1347,12 @@ class OpenCtrolRemoteCard extends HTMLElement {
       const rect = img.getBoundingClientRect();
       const x = Math.round((e.clientX - rect.left) * (img.naturalWidth / rect.width));
       const y = Math.round((e.clientY - rect.top) * (img.naturalHeight / rect.height));
-      this.sendCommand('click', { button: 'right', x: x, y: y });
+      this._input.queueClick('right', x, y);
     });
 
     img.addEventListener('wheel', (e) => {
       e.preventDefault();
-      this.sendCommand('scroll', { delta: Math.round(e.deltaY) });
+      this._input.queueScroll(e.deltaY);
     });
 
     let isDragging = false;
@@ -1035,7 +1363,7 @@ class OpenCtrolRemoteCard extends HTMLElement {
         const rect = img.getBoundingClientRect();
         const x = Math.round((e.clientX - rect.left) * (img.naturalWidth / rect.width));
         const y = Math.round((e.clientY - rect.top) * (img.naturalHeight / rect.height));
-        this.sendCommand('move_mouse', { x: x, y: y });
+        this._input.queueMoveTo(x, y);
       }
     });
   }
@@ -0,0 +1,51 @@
+"""Tests for the OpenCtrol connection manager."""
+
+import asyncio
+
+from custom_components.opencrol.connection_manager import OpenCtrolSessionManager
+
+HOST_A = "http://192.168.1.10:8080"
+HOST_B = "http://192.168.1.11:8080"
+
+
+def test_unloading_one_entry_releases_only_its_host() -> None:
+    """Releasing one of two entries closes that host's pool and keeps the other."""
+
+    async def run() -> None:
+        manager = OpenCtrolSessionManager()
+        manager.acquire("entry_a", HOST_A)
+        manager.acquire("entry_b", HOST_B)
+        session_a = await manager.async_get_session(HOST_A)
+        session_b = await manager.async_get_session(HOST_B)
+        assert session_a is not session_b
+
+        await manager.async_release("entry_a")
+
+        assert session_a.closed
+        assert not session_b.closed
+        assert manager.stats["hosts"] == [HOST_B]
+        assert manager.stats["open_sessions"] == [HOST_B]
+        assert await manager.async_get_session(HOST_B) is session_b
+
+        await manager.async_release("entry_b")
+        assert session_b.closed
+
+    asyncio.run(run())
+
+
+def test_host_pool_stays_open_while_another_owner_uses_it() -> None:
+    """A validation lease on a configured host does not close the entry's pool."""
+
+    async def run() -> None:
+        manager = OpenCtrolSessionManager()
+        manager.acquire("entry_a", HOST_A)
+        session = await manager.async_get_session(HOST_A)
+
+        async with manager.async_lease("probe", HOST_A) as leased:
+            assert leased is session
+
+        assert not session.closed
+        await manager.async_release("entry_a")
+        assert session.closed
+
+    asyncio.run(run())